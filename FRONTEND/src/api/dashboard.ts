@@ -66,3 +66,31 @@ export const getRandomEcoTip = async (category?: string): Promise<EcoTip> => {
   return response.data;
 };
 
+
+export type TimeSeriesBucket = 'day' | 'week' | 'month';
+
+export interface TimeSeriesValues {
+  co2: number[];
+  count: number[];
+}
+
+export interface EmissionTimeSeries {
+  from: string;
+  to: string;
+  bucket: TimeSeriesBucket;
+  dates: string[];
+  series: {
+    meals?: TimeSeriesValues;
+    transport?: TimeSeriesValues;
+  };
+}
+
+export const getEmissionTimeSeries = async (params: {
+  from?: string;
+  to?: string;
+  bucket?: TimeSeriesBucket;
+  category?: 'meals' | 'transport';
+}): Promise<EmissionTimeSeries> => {
+  const response = await api.get('/dashboard/timeseries/', { params });
+  return response.data;
+};
@@ -8,9 +8,16 @@ export const mealsAPI = {
   /**
    * Obtener lista de comidas del usuario
    */
-  list: async (params?: { date?: string; meal_type?: string }): Promise<{
-    count: number;
+  list: async (params?: {
+    date?: string;
+    meal_type?: string;
+    cursor?: string;
+    page_size?: number;
+    include_count?: boolean;
+  }): Promise<{
     meals: Meal[];
+    next_cursor: string | null;
+    count?: number;
   }> => {
     const response = await apiClient.get('/meals/', { params });
     return response.data;
@@ -59,10 +59,18 @@ export interface LeaderboardEntry {
 export interface LeaderboardResponse {
   leaderboard: LeaderboardEntry[];
   current_user_rank: number | null;
+  current_user_percentile?: number | null;
   total_users?: number;
   total_friends?: number;
 }
 
+export interface UserRankResponse {
+  rank: number | null;
+  percentile: number | null;
+  total_users: number;
+  neighbours: LeaderboardEntry[];
+}
+
 export interface Achievement {
   id: number;
   achievement_id: number;
@@ -93,6 +101,12 @@ export interface SearchUser {
   profile_picture: string | null;
   level: number;
   total_points: number;
+  mutual_friends: number;
+  friendship_status: 'friends' | 'request_sent' | 'request_received' | null;
+}
+
+export interface FriendSuggestion extends Omit<SearchUser, 'friendship_status'> {
+  mutual_friends: number;
 }
 
 // Friend APIs
@@ -127,6 +141,11 @@ export const removeFriend = async (friendshipId: number): Promise<void> => {
   await api.delete(`/social/friends/${friendshipId}/`);
 };
 
+export const getFriendSuggestions = async (limit: number = 10): Promise<FriendSuggestion[]> => {
+  const response = await api.get(`/social/friends/suggestions/?limit=${limit}`);
+  return response.data;
+};
+
 export const searchUsers = async (query: string): Promise<SearchUser[]> => {
   const response = await api.get(`/social/users/search/?q=${encodeURIComponent(query)}`);
   return response.data.results || response.data;
@@ -143,6 +162,11 @@ export const getFriendsLeaderboard = async (): Promise<LeaderboardResponse> => {
   return response.data;
 };
 
+export const getUserRank = async (neighbours: number = 2): Promise<UserRankResponse> => {
+  const response = await api.get(`/social/leaderboard/rank/?neighbours=${neighbours}`);
+  return response.data;
+};
+
 // Achievement APIs
 export const getAllAchievements = async (category?: string): Promise<Achievement[]> => {
   const url = category 
@@ -8,9 +8,16 @@ export const transportAPI = {
   /**
    * Obtener lista de transportes del usuario
    */
-  list: async (params?: { date?: string; transport_type?: string }): Promise<{
-    count: number;
+  list: async (params?: {
+    date?: string;
+    transport_type?: string;
+    cursor?: string;
+    page_size?: number;
+    include_count?: boolean;
+  }): Promise<{
     transports: Transport[];
+    next_cursor: string | null;
+    count?: number;
   }> => {
     const response = await apiClient.get('/transport/', { params });
     return response.data;
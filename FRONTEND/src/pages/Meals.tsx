@@ -18,6 +18,8 @@ export default function Meals() {
   const [meals, setMeals] = useState<Meal[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [showForm, setShowForm] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [showInfo, setShowInfo] = useState(false);
   const toast = useToast();
 
@@ -29,13 +31,29 @@ export default function Meals() {
     try {
       const response = await mealsAPI.list();
       setMeals(response.meals || []);
+      setNextCursor(response.next_cursor);
     } catch (error) {
       console.error('Error al cargar comidas:', error);
       setMeals([]);
+      setNextCursor(null);
       toast.error('Error al cargar el historial de comidas');
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const response = await mealsAPI.list({ cursor: nextCursor });
+      setMeals((current) => [...current, ...(response.meals || [])]);
+      setNextCursor(response.next_cursor);
+    } catch (error) {
+      toast.error('Error al cargar más comidas');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleSubmit = async (formData: MealFormData) => {
     setIsLoading(true);
     try {
@@ -106,7 +124,16 @@ export default function Meals() {
         ) : showForm ? (
           <MealForm onSubmit={handleSubmit} isLoading={isLoading} />
         ) : (
-          <MealList meals={meals} onDelete={handleDelete} />
+          <>
+            <MealList meals={meals} onDelete={handleDelete} />
+            {nextCursor && (
+              <div className="mt-6 flex justify-center">
+                <Button variant="outline" onClick={loadMore} disabled={isLoadingMore}>
+                  {isLoadingMore ? 'Cargando...' : 'Cargar más'}
+                </Button>
+              </div>
+            )}
+          </>
         )}
       </div>
     </div>
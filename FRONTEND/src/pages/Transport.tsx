@@ -17,6 +17,8 @@ export default function TransportPage() {
   const [transports, setTransports] = useState<Transport[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [showForm, setShowForm] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const toast = useToast();
 
   useEffect(() => {
@@ -27,13 +29,29 @@ export default function TransportPage() {
     try {
       const response = await transportAPI.list();
       setTransports(response.transports || []);
+      setNextCursor(response.next_cursor);
     } catch (error) {
       console.error('Error al cargar transportes:', error);
       setTransports([]);
+      setNextCursor(null);
       toast.error('Error al cargar el historial de transportes');
     }
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const response = await transportAPI.list({ cursor: nextCursor });
+      setTransports((current) => [...current, ...(response.transports || [])]);
+      setNextCursor(response.next_cursor);
+    } catch (error) {
+      toast.error('Error al cargar más transportes');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleSubmit = async (formData: TransportFormData) => {
     setIsLoading(true);
     try {
@@ -95,7 +113,16 @@ export default function TransportPage() {
         {showForm ? (
           <TransportForm onSubmit={handleSubmit} isLoading={isLoading} />
         ) : (
-          <TransportList transports={transports} onDelete={handleDelete} />
+          <>
+            <TransportList transports={transports} onDelete={handleDelete} />
+            {nextCursor && (
+              <div className="mt-6 flex justify-center">
+                <Button variant="outline" onClick={loadMore} disabled={isLoadingMore}>
+                  {isLoadingMore ? 'Cargando...' : 'Cargar más'}
+                </Button>
+              </div>
+            )}
+          </>
         )}
       </div>
     </div>
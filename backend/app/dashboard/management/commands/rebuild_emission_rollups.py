@@ -0,0 +1,132 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Sum, Count
+from app.meals.models import M_Meal
+from app.transport.models import M_Transport
+from app.dashboard.models import DailyEmissionRollup
+
+
+# Tolerancia para diferencias de redondeo acumuladas en total_co2
+CO2_TOLERANCE = 1e-6
+
+
+class Command(BaseCommand):
+    help = 'Reconstruir o verificar los acumulados diarios de emisiones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Solo reportar diferencias, sin modificar la base de datos'
+        )
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='ID de usuario a procesar (se puede repetir)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Usuarios procesados por lote'
+        )
+
+    def handle(self, *args, **options):
+        verify = options['verify']
+        chunk_size = options['chunk_size']
+
+        user_ids = options['user_ids'] or list(
+            User.objects.order_by('id').values_list('id', flat=True)
+        )
+
+        self.stdout.write(
+            'Verificando acumulados...' if verify else 'Reconstruyendo acumulados...'
+        )
+
+        drift_count = 0
+        written_count = 0
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            expected = self._expected_rollups(chunk)
+            current = self._current_rollups(chunk)
+
+            drifted = self._diff(expected, current)
+            drift_count += len(drifted)
+
+            for key in drifted:
+                user_id, day, category = key
+                exp_count, exp_co2 = expected.get(key, (0, 0.0))
+                cur_count, cur_co2 = current.get(key, (0, 0.0))
+                self.stdout.write(self.style.WARNING(
+                    f'  - Usuario {user_id} {day} {category}: '
+                    f'esperado {exp_count}/{exp_co2:.3f} kg, '
+                    f'actual {cur_count}/{cur_co2:.3f} kg'
+                ))
+
+            if not verify and drifted:
+                written_count += self._rebuild(chunk, expected)
+
+        if verify:
+            style = self.style.SUCCESS if not drift_count else self.style.ERROR
+            self.stdout.write(style(f'\n✓ {drift_count} acumulados con diferencias'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'\n✓ Proceso completado:'))
+            self.stdout.write(self.style.SUCCESS(f'  - {drift_count} acumulados corregidos'))
+            self.stdout.write(self.style.SUCCESS(f'  - {written_count} filas escritas'))
+
+    def _expected_rollups(self, user_ids):
+        """Agrega las tablas de origen por (usuario, fecha)."""
+        expected = {}
+        sources = [
+            (M_Meal, 'meal_date', 'meals'),
+            (M_Transport, 'trip_date', 'transport'),
+        ]
+        for model, date_field, category in sources:
+            rows = model.objects.filter(
+                user_id__in=user_ids,
+                is_active=True
+            ).order_by().values('user_id', date_field).annotate(
+                count=Count('id'),
+                co2=Sum('total_co2')
+            )
+            for row in rows:
+                key = (row['user_id'], row[date_field], category)
+                expected[key] = (row['count'], float(row['co2'] or 0))
+        return expected
+
+    def _current_rollups(self, user_ids):
+        rows = DailyEmissionRollup.objects.filter(user_id__in=user_ids).values_list(
+            'user_id', 'date', 'category', 'activity_count', 'total_co2'
+        )
+        return {
+            (user_id, day, category): (count, co2)
+            for user_id, day, category, count, co2 in rows
+        }
+
+    def _diff(self, expected, current):
+        drifted = []
+        for key in expected.keys() | current.keys():
+            exp_count, exp_co2 = expected.get(key, (0, 0.0))
+            cur_count, cur_co2 = current.get(key, (0, 0.0))
+            if exp_count != cur_count or abs(exp_co2 - cur_co2) > CO2_TOLERANCE:
+                drifted.append(key)
+        return sorted(drifted, key=str)
+
+    @transaction.atomic
+    def _rebuild(self, user_ids, expected):
+        DailyEmissionRollup.objects.filter(user_id__in=user_ids).delete()
+        rollups = [
+            DailyEmissionRollup(
+                user_id=user_id,
+                date=day,
+                category=category,
+                activity_count=count,
+                total_co2=co2
+            )
+            for (user_id, day, category), (count, co2) in expected.items()
+        ]
+        DailyEmissionRollup.objects.bulk_create(rollups, batch_size=1000)
+        return len(rollups)
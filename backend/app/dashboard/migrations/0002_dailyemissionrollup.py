@@ -0,0 +1,66 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rollups(apps, schema_editor):
+    Meal = apps.get_model('meals', 'M_Meal')
+    Transport = apps.get_model('transport', 'M_Transport')
+    DailyEmissionRollup = apps.get_model('dashboard', 'DailyEmissionRollup')
+
+    sources = [
+        (Meal, 'meal_date', 'meals'),
+        (Transport, 'trip_date', 'transport'),
+    ]
+    rollups = []
+    for model, date_field, category in sources:
+        rows = model.objects.filter(is_active=True).order_by().values(
+            'user_id', date_field
+        ).annotate(count=Count('id'), co2=Sum('total_co2'))
+        for row in rows:
+            rollups.append(DailyEmissionRollup(
+                user_id=row['user_id'],
+                date=row[date_field],
+                category=category,
+                activity_count=row['count'],
+                total_co2=row['co2'] or 0.0,
+            ))
+    DailyEmissionRollup.objects.bulk_create(rollups, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_initial'),
+        ('meals', '0001_initial'),
+        ('transport', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyEmissionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('date', models.DateField(verbose_name='Fecha')),
+                ('category', models.CharField(choices=[('meals', 'Comidas'), ('transport', 'Transporte')], max_length=20, verbose_name='Categoría')),
+                ('activity_count', models.IntegerField(default=0, verbose_name='Cantidad de actividades')),
+                ('total_co2', models.FloatField(default=0.0, verbose_name='CO2 Total (kg)')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='emission_rollups', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Acumulado diario de emisiones',
+                'verbose_name_plural': 'Acumulados diarios de emisiones',
+                'db_table': 'daily_emission_rollups',
+                'ordering': ['-date', 'category'],
+                'unique_together': {('user', 'date', 'category')},
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.contrib.auth.models import User
 from core.models import M_BaseModel
 
 
@@ -50,3 +51,63 @@ class EcoTip(M_BaseModel):
     
     def __str__(self):
         return f"{self.title} ({self.get_category_display()})"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        from .tip_pool import eco_tip_pool
+        eco_tip_pool.invalidate()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        from .tip_pool import eco_tip_pool
+        eco_tip_pool.invalidate()
+        return result
+
+
+class DailyEmissionRollup(M_BaseModel):
+    """
+    Acumulado diario de emisiones por usuario y categoría.
+    Se mantiene de forma incremental al guardar o eliminar actividades.
+    """
+
+    CATEGORY_CHOICES = [
+        ('meals', 'Comidas'),
+        ('transport', 'Transporte'),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='emission_rollups',
+        verbose_name='Usuario'
+    )
+
+    date = models.DateField(
+        verbose_name='Fecha'
+    )
+
+    category = models.CharField(
+        max_length=20,
+        choices=CATEGORY_CHOICES,
+        verbose_name='Categoría'
+    )
+
+    activity_count = models.IntegerField(
+        default=0,
+        verbose_name='Cantidad de actividades'
+    )
+
+    total_co2 = models.FloatField(
+        default=0.0,
+        verbose_name='CO2 Total (kg)'
+    )
+
+    class Meta:
+        db_table = 'daily_emission_rollups'
+        verbose_name = 'Acumulado diario de emisiones'
+        verbose_name_plural = 'Acumulados diarios de emisiones'
+        unique_together = ['user', 'date', 'category']
+        ordering = ['-date', 'category']
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date} {self.category}: {self.total_co2} kg"
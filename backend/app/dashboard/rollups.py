@@ -0,0 +1,83 @@
+"""
+Mantenimiento incremental de los acumulados diarios de emisiones.
+Las actividades (comidas y transportes) reportan su estado antes y
+después de guardarse; aquí se aplica la diferencia al acumulado del día.
+"""
+from collections import defaultdict
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import DailyEmissionRollup
+
+
+def apply_delta(user_id, date, category, count, co2):
+    """Suma (o resta) actividades al acumulado de un día con un UPDATE atómico."""
+    if not count and not co2:
+        return
+
+    rows = DailyEmissionRollup.objects.filter(
+        user_id=user_id,
+        date=date,
+        category=category
+    )
+    updated = rows.update(
+        activity_count=F('activity_count') + count,
+        total_co2=F('total_co2') + co2,
+        updated_at=timezone.now()
+    )
+    if updated:
+        return
+
+    try:
+        with transaction.atomic():
+            DailyEmissionRollup.objects.create(
+                user_id=user_id,
+                date=date,
+                category=category,
+                activity_count=count,
+                total_co2=co2
+            )
+    except IntegrityError:
+        # Otra petición creó la fila del día entre el UPDATE y el INSERT
+        rows.update(
+            activity_count=F('activity_count') + count,
+            total_co2=F('total_co2') + co2,
+            updated_at=timezone.now()
+        )
+
+
+def track_activity_change(user_id, category, before, after):
+    """
+    Aplica el cambio de una actividad al acumulado.
+
+    Args:
+        user_id: Usuario dueño de la actividad
+        category: 'meals' o 'transport'
+        before: Tupla (fecha, co2) antes de guardar, o None si no contaba
+                (registro nuevo o eliminado lógicamente). Se lee dentro de
+                la misma transacción con la fila bloqueada (select_for_update)
+        after: Tupla (fecha, co2) después de guardar, o None si ya no cuenta
+    """
+    if before == after:
+        return
+    if before is not None:
+        apply_delta(user_id, before[0], category, -1, -before[1])
+    if after is not None:
+        apply_delta(user_id, after[0], category, 1, after[1])
+
+
+
+def track_bulk_activities(user_id, category, activities):
+    """
+    Registra un lote de actividades nuevas con un UPDATE por día.
+
+    Args:
+        activities: Iterable de tuplas (fecha, co2)
+    """
+    by_date = defaultdict(lambda: [0, 0.0])
+    for activity_date, co2 in activities:
+        by_date[activity_date][0] += 1
+        by_date[activity_date][1] += co2
+
+    for activity_date, (count, co2) in by_date.items():
+        apply_delta(user_id, activity_date, category, count, co2)
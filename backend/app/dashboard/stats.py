@@ -0,0 +1,138 @@
+"""
+Motor de estadísticas del dashboard.
+Calcula todos los indicadores desde los contadores y acumulados por
+usuario, más una agregación para el desglose de transportes.
+"""
+from collections import defaultdict
+from datetime import timedelta
+from django.db.models import Count, Q
+from django.utils import timezone
+from app.transport.models import M_Transport
+from app.users.stats import get_user_stats
+from .models import DailyEmissionRollup
+
+
+TRANSPORT_LABELS = dict(M_Transport.TRANSPORT_CHOICES)
+
+
+class DashboardStatsEngine:
+    """
+    Calcula resumen y gráficos del dashboard de un usuario.
+
+    Los totales salen de los contadores del usuario (M_UserStats) y el
+    desglose por tipo de transporte de una agregación condicional. Las series por fecha (hoy, últimos 7 días y
+    últimos 30 días) se leen de los acumulados diarios, que son unas
+    pocas filas por usuario sin importar el tamaño de su historial.
+    """
+
+    CHART_DAYS = 7
+    MONTH_DAYS = 30
+
+    def __init__(self, user, now=None):
+        self.user = user
+        self.now = now or timezone.now()
+        self.today = timezone.localdate(self.now)
+        self.month_start = self.today - timedelta(days=self.MONTH_DAYS)
+        self.chart_days = [
+            self.today - timedelta(days=i)
+            for i in range(self.CHART_DAYS - 1, -1, -1)
+        ]
+
+    def _transport_stats(self):
+        aggregates = {}
+        for transport_type, _ in M_Transport.TRANSPORT_CHOICES:
+            aggregates[f'type_{transport_type}'] = Count(
+                'id', filter=Q(transport_type=transport_type)
+            )
+        return M_Transport.objects.filter(user=self.user, is_active=True).aggregate(**aggregates)
+
+    def _daily_rollups(self):
+        """CO2 por día y totales (cantidad, CO2) por categoría de los últimos 30 días."""
+        rows = DailyEmissionRollup.objects.filter(
+            user=self.user,
+            date__gte=self.month_start,
+            date__lte=self.today
+        ).values_list('date', 'category', 'activity_count', 'total_co2')
+
+        co2_by_date = defaultdict(float)
+        month_totals = {'meals': [0, 0.0], 'transport': [0, 0.0]}
+        for day, category, count, co2 in rows:
+            co2_by_date[day] += co2
+            month_totals[category][0] += count
+            month_totals[category][1] += co2
+        return co2_by_date, month_totals
+
+    @staticmethod
+    def _co2(value):
+        return round(float(value or 0), 2)
+
+    def compute(self):
+        """Retorna el payload completo del dashboard (summary + charts)."""
+        profile = self.user.profile
+        stats = get_user_stats(self.user.id)
+        transports = self._transport_stats()
+        co2_by_date, month_totals = self._daily_rollups()
+
+        co2_by_day = [
+            {
+                'date': day.strftime('%d/%m'),
+                'co2': self._co2(co2_by_date[day])
+            }
+            for day in self.chart_days
+        ]
+
+        total_meals = stats.meal_count
+        vegan_meals = stats.vegan_meal_count
+        vegetarian_meals = stats.vegetarian_meal_count
+
+        meals_by_type = {
+            'veganas': vegan_meals,
+            'vegetarianas': vegetarian_meals - vegan_meals,
+            'omnívoras': total_meals - vegetarian_meals
+        }
+
+        transports_by_type = []
+        for transport_type, _ in M_Transport.TRANSPORT_CHOICES:
+            count = transports[f'type_{transport_type}']
+            if count:
+                transports_by_type.append({
+                    'type': TRANSPORT_LABELS.get(transport_type, transport_type),
+                    'count': count
+                })
+
+        month_meals_count, month_meals_co2 = month_totals['meals']
+        month_transports_count, month_transports_co2 = month_totals['transport']
+        category_stats = [
+            {
+                'category': 'Comidas',
+                'count': month_meals_count,
+                'co2': self._co2(month_meals_co2)
+            },
+            {
+                'category': 'Transporte',
+                'count': month_transports_count,
+                'co2': self._co2(month_transports_co2)
+            }
+        ]
+
+        today_co2 = co2_by_date[self.today]
+
+        return {
+            'summary': {
+                'total_co2': round(float(profile.total_co2_saved), 2),
+                'today_co2': self._co2(today_co2),
+                'total_meals': total_meals,
+                'total_transports': stats.transport_count,
+                'vegan_meals': vegan_meals,
+                'vegetarian_meals': vegetarian_meals,
+                'level': profile.level,
+                'total_points': profile.total_points,
+                'streak_days': profile.streak_days,
+            },
+            'charts': {
+                'co2_by_day': co2_by_day,
+                'meals_by_type': meals_by_type,
+                'transports_by_type': transports_by_type,
+                'category_stats': category_stats,
+            }
+        }
@@ -1,3 +1,82 @@
-from django.test import TestCase
+from datetime import date
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from app.meals.models import M_Meal
+from .models import DailyEmissionRollup
+from .timeseries import bucket_range, count_buckets, emission_timeseries
+
+
+class BucketTests(TestCase):
+
+    def test_week_buckets_start_on_monday(self):
+        buckets = bucket_range(date(2025, 1, 1), date(2025, 1, 14), 'week')
+        self.assertEqual(buckets, [date(2024, 12, 30), date(2025, 1, 6), date(2025, 1, 13)])
+        self.assertEqual(count_buckets(date(2025, 1, 1), date(2025, 1, 14), 'week'), 3)
+
+    def test_month_buckets_cross_year(self):
+        buckets = bucket_range(date(2024, 11, 15), date(2025, 2, 1), 'month')
+        self.assertEqual(buckets, [date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1)])
+        self.assertEqual(count_buckets(date(2024, 11, 15), date(2025, 2, 1), 'month'), 4)
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class EmissionTimeSeriesTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='ana', password='x')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_series_aligned_with_dates(self):
+        M_Meal.objects.create(
+            user=self.user, meal_type='lunch', description='Arroz',
+            ingredients={'rice': 0.2}, meal_date=date(2025, 3, 4)
+        )
+        data = emission_timeseries(self.user, date(2025, 3, 3), date(2025, 3, 9), 'day', ['meals'])
+        self.assertEqual(len(data['dates']), 7)
+        self.assertEqual(data['series']['meals']['count'], [0, 1, 0, 0, 0, 0, 0])
+
+    def test_invalid_dates_return_400(self):
+        for params in ({'to': 'garbage'}, {'from': 'garbage'}, {'to': '2025-02-30'}):
+            response = self.client.get('/api/dashboard/timeseries/', params)
+            self.assertEqual(response.status_code, 400, params)
+
+    def test_from_after_to_returns_400(self):
+        response = self.client.get('/api/dashboard/timeseries/', {'from': '2025-03-10', 'to': '2025-03-01'})
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class RollupTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='ana', password='x')
+
+    def rollups(self):
+        return {
+            row['date']: (row['activity_count'], round(row['total_co2'], 6))
+            for row in DailyEmissionRollup.objects.filter(user=self.user, category='meals').values(
+                'date', 'activity_count', 'total_co2'
+            )
+        }
+
+    def test_moves_and_removes_activities(self):
+        meal = M_Meal.objects.create(
+            user=self.user, meal_type='lunch', description='Arroz',
+            ingredients={'rice': 0.2}, meal_date=date(2025, 3, 4)
+        )
+        co2 = round(meal.total_co2, 6)
+        self.assertEqual(self.rollups(), {date(2025, 3, 4): (1, co2)})
+
+        meal.meal_date = date(2025, 3, 5)
+        meal.save()
+        self.assertEqual(self.rollups(), {date(2025, 3, 4): (0, 0), date(2025, 3, 5): (1, co2)})
+
+        # Dos copias del mismo registro: el segundo borrado ya no cuenta
+        stale = M_Meal.objects.get(pk=meal.pk)
+        meal.soft_delete()
+        stale.soft_delete()
+        self.assertEqual(self.rollups(), {date(2025, 3, 4): (0, 0), date(2025, 3, 5): (0, 0)})
@@ -0,0 +1,101 @@
+"""
+Series de tiempo de emisiones con rangos arbitrarios.
+Agrupa en la base de datos por día, semana o mes sobre meal_date/trip_date
+(cubiertos por los índices (user, -fecha)) y devuelve un formato columnar:
+un arreglo de fechas y arreglos de valores alineados por categoría.
+"""
+from datetime import date, timedelta
+from django.db.models import Count, DateField, F, Sum
+from django.db.models.functions import Trunc
+from app.meals.models import M_Meal
+from app.transport.models import M_Transport
+
+
+BUCKETS = ('day', 'week', 'month')
+
+SOURCES = {
+    'meals': (M_Meal, 'meal_date'),
+    'transport': (M_Transport, 'trip_date'),
+}
+
+# Máximo de intervalos por respuesta (~2.7 años por día, ~19 años por semana)
+MAX_BUCKETS = 1000
+
+
+def bucket_start(day: date, bucket: str) -> date:
+    """Inicio del intervalo que contiene `day` (semanas inician en lunes)."""
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    if bucket == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(day: date, bucket: str) -> date:
+    if bucket == 'week':
+        return day + timedelta(days=7)
+    if bucket == 'month':
+        return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return day + timedelta(days=1)
+
+
+def bucket_range(date_from: date, date_to: date, bucket: str):
+    """Lista de inicios de intervalo que cubren [date_from, date_to]."""
+    buckets = []
+    current = bucket_start(date_from, bucket)
+    while current <= date_to:
+        buckets.append(current)
+        current = next_bucket(current, bucket)
+    return buckets
+
+
+def count_buckets(date_from: date, date_to: date, bucket: str) -> int:
+    """Cantidad de intervalos sin construir la lista completa."""
+    start = bucket_start(date_from, bucket)
+    if bucket == 'week':
+        return (date_to - start).days // 7 + 1
+    if bucket == 'month':
+        return (date_to.year - start.year) * 12 + date_to.month - start.month + 1
+    return (date_to - start).days + 1
+
+
+def emission_timeseries(user, date_from: date, date_to: date, bucket: str, categories):
+    """
+    Calcula CO2 y cantidad de actividades por intervalo.
+
+    Returns:
+        Dict con 'dates' (inicio de cada intervalo, ISO) y 'series'
+        {categoría: {'co2': [...], 'count': [...]}} alineados con 'dates'.
+    """
+    buckets = bucket_range(date_from, date_to, bucket)
+    positions = {day: index for index, day in enumerate(buckets)}
+
+    series = {}
+    for category in categories:
+        model, date_field = SOURCES[category]
+        if bucket == 'day':
+            period = F(date_field)
+        else:
+            period = Trunc(date_field, bucket, output_field=DateField())
+
+        rows = model.objects.filter(
+            user=user,
+            is_active=True,
+            **{f'{date_field}__gte': date_from, f'{date_field}__lte': date_to}
+        ).order_by().annotate(period=period).values('period').annotate(
+            co2=Sum('total_co2'),
+            count=Count('id')
+        )
+
+        co2 = [0.0] * len(buckets)
+        count = [0] * len(buckets)
+        for row in rows:
+            index = positions[row['period']]
+            co2[index] = round(float(row['co2'] or 0), 2)
+            count[index] = row['count']
+        series[category] = {'co2': co2, 'count': count}
+
+    return {
+        'dates': [day.isoformat() for day in buckets],
+        'series': series,
+    }
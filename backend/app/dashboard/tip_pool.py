@@ -0,0 +1,100 @@
+"""
+Pool en memoria de eco tips activos.
+Se carga una vez por proceso, se invalida cuando un EcoTip cambia y
+sirve tips aleatorios por categoría sin consultar la base de datos.
+"""
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from .models import EcoTip
+from .serializers import EcoTipSerializer
+
+
+ALL_CATEGORIES = '__all__'
+
+
+class EcoTipPool:
+    """
+    Tips serializados agrupados por categoría.
+
+    Los cambios hechos con `EcoTip.save()`/`delete()` en este proceso
+    invalidan el pool de inmediato; RELOAD_SECONDS acota cuánto tarda en
+    verse un cambio hecho en otro proceso o con `QuerySet.update()`.
+    """
+
+    RELOAD_SECONDS = 300
+    # Tips recientes que se evitan repetir por usuario
+    RECENT_PER_USER = 5
+    MAX_TRACKED_USERS = 10000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._loaded_at = 0.0
+        self._recent = OrderedDict()
+
+    def invalidate(self):
+        self._pool = None
+
+    def _load(self):
+        tips = EcoTipSerializer(EcoTip.objects.filter(is_active=True), many=True).data
+        pool = defaultdict(list)
+        for tip in tips:
+            tip = dict(tip)
+            pool[ALL_CATEGORIES].append(tip)
+            pool[tip['category']].append(tip)
+        return dict(pool)
+
+    def _get_pool(self):
+        pool = self._pool
+        if pool is not None and time.monotonic() - self._loaded_at < self.RELOAD_SECONDS:
+            return pool
+
+        with self._lock:
+            if self._pool is None or time.monotonic() - self._loaded_at >= self.RELOAD_SECONDS:
+                self._pool = self._load()
+                self._loaded_at = time.monotonic()
+            return self._pool
+
+    def _recent_for(self, user_id):
+        with self._lock:
+            recent = self._recent.pop(user_id, None)
+            if recent is None:
+                recent = deque(maxlen=self.RECENT_PER_USER)
+            self._recent[user_id] = recent
+            if len(self._recent) > self.MAX_TRACKED_USERS:
+                self._recent.popitem(last=False)
+            return recent
+
+    def random_tip(self, category=None, user_id=None):
+        """
+        Retorna un tip aleatorio (dict serializado) o None si no hay tips.
+
+        Si se indica `user_id`, intenta no repetir los últimos tips que
+        vio ese usuario con unos pocos sorteos adicionales (costo constante).
+        """
+        tips = self._get_pool().get(category or ALL_CATEGORIES)
+        if not tips:
+            return None
+
+        tip = random.choice(tips)
+        if user_id is None:
+            return tip
+
+        recent = self._recent_for(user_id)
+        # Con pocos tips en la categoría solo se evitan los len(tips) - 1 más recientes
+        window = min(len(recent), len(tips) - 1)
+        avoid = set(list(recent)[len(recent) - window:]) if window > 0 else set()
+        for _ in range(self.RECENT_PER_USER):
+            if tip['id'] not in avoid:
+                break
+            tip = random.choice(tips)
+        else:
+            # Solo ocurre cuando los recientes cubren casi toda la categoría
+            tip = random.choice([t for t in tips if t['id'] not in avoid])
+        recent.append(tip['id'])
+        return tip
+
+
+eco_tip_pool = EcoTipPool()
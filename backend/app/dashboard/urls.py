@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import V_DashboardStats, V_RandomEcoTip
+from .views import V_DashboardStats, V_EmissionTimeSeries, V_RandomEcoTip
 
 urlpatterns = [
     path('stats/', V_DashboardStats.as_view(), name='dashboard-stats'),
+    path('timeseries/', V_EmissionTimeSeries.as_view(), name='dashboard-timeseries'),
     path('eco-tip/', V_RandomEcoTip.as_view(), name='random-eco-tip'),
 ]
@@ -1,126 +1,111 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Sum, Count
+from rest_framework import status
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 from datetime import timedelta
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from app.meals.models import M_Meal
 from app.transport.models import M_Transport
-from .models import EcoTip
-from .serializers import EcoTipSerializer
-import random
+from app.users.models import M_UserProfile
+from core.cache import cache_user_response
+from core.utils import build_etag, queryset_fingerprint
+from .stats import DashboardStatsEngine
+from .timeseries import BUCKETS, MAX_BUCKETS, SOURCES, count_buckets, emission_timeseries
+from .tip_pool import eco_tip_pool
 
 
+def _dashboard_stats_etag(request):
+    user = request.user
+    return build_etag(
+        'dashboard_stats',
+        user.id,
+        timezone.localdate(),
+        queryset_fingerprint(M_Meal.objects.filter(user=user)),
+        queryset_fingerprint(M_Transport.objects.filter(user=user)),
+        queryset_fingerprint(M_UserProfile.objects.filter(user=user)),
+    )
+
+
+@method_decorator(condition(etag_func=_dashboard_stats_etag), name='get')
+@method_decorator(cache_user_response('dashboard_stats'), name='get')
 class V_DashboardStats(APIView):
 
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
-        user = request.user
-        now = timezone.now()
-        
-        # Fechas para filtros
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_start = today_start - timedelta(days=7)
-        month_start = today_start - timedelta(days=30)
-        
-        # CO2 ahorrado
-        total_co2 = float(user.profile.total_co2_saved)
-        today_meals = M_Meal.objects.filter(user=user, created_at__gte=today_start)
-        today_transports = M_Transport.objects.filter(user=user, created_at__gte=today_start)
-        today_co2 = sum([m.total_co2 for m in today_meals]) + sum([t.total_co2 for t in today_transports])
-        
-        # Contadores
-        total_meals = M_Meal.objects.filter(user=user).count()
-        total_transports = M_Transport.objects.filter(user=user).count()
-        vegan_meals = M_Meal.objects.filter(user=user, is_vegan=True).count()
-        vegetarian_meals = M_Meal.objects.filter(user=user, is_vegetarian=True).count()
-        
-        # Datos para gráfico de CO2 por día (últimos 7 días)
-        co2_by_day = []
-        for i in range(6, -1, -1):
-            day_start = today_start - timedelta(days=i)
-            day_end = day_start + timedelta(days=1)
-            
-            day_meals = M_Meal.objects.filter(
-                user=user,
-                created_at__gte=day_start,
-                created_at__lt=day_end
+        engine = DashboardStatsEngine(request.user)
+        return Response(engine.compute())
+
+
+@method_decorator(cache_user_response('timeseries'), name='get')
+class V_EmissionTimeSeries(APIView):
+    """
+    GET /api/dashboard/timeseries/?from=2025-01-01&to=2025-12-31&bucket=week&category=meals
+    Serie de CO2 y cantidad de actividades agrupada por día, semana o mes.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        params = request.query_params
+        bucket = params.get('bucket', 'day')
+        category = params.get('category')
+
+        if bucket not in BUCKETS:
+            return Response(
+                {'error': f"bucket debe ser uno de: {', '.join(BUCKETS)}"},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            day_transports = M_Transport.objects.filter(
-                user=user,
-                created_at__gte=day_start,
-                created_at__lt=day_end
+
+        if category and category not in SOURCES:
+            return Response(
+                {'error': f"category debe ser uno de: {', '.join(SOURCES)}"},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            
-            day_co2 = sum([m.total_co2 for m in day_meals]) + sum([t.total_co2 for t in day_transports])
-            
-            co2_by_day.append({
-                'date': day_start.strftime('%d/%m'),
-                'co2': round(float(day_co2), 2)
-            })
-        
-        # Datos para gráfico de comidas por tipo
-        meals_by_type = {
-            'veganas': vegan_meals,
-            'vegetarianas': vegetarian_meals - vegan_meals,
-            'omnívoras': total_meals - vegetarian_meals
-        }
-        
-        # Datos para gráfico de transporte por tipo
-        transports_by_type = []
-        transport_types = M_Transport.objects.filter(user=user).values('transport_type').annotate(count=Count('id'))
-        
-        transport_labels = {
-            'walk': 'Caminata',
-            'bicycle': 'Bicicleta',
-            'public_transport': 'Transporte Público',
-            'car': 'Auto',
-            'electric_bike': 'Bici Eléctrica',
-            'electric_scooter': 'Scooter Eléctrico'
-        }
-        
-        for item in transport_types:
-            transports_by_type.append({
-                'type': transport_labels.get(item['transport_type'], item['transport_type']),
-                'count': item['count']
-            })
-        
-        # Estadísticas por categoría (últimos 30 días)
-        month_meals = M_Meal.objects.filter(user=user, created_at__gte=month_start)
-        month_transports = M_Transport.objects.filter(user=user, created_at__gte=month_start)
-        
-        category_stats = [
-            {
-                'category': 'Comidas',
-                'count': month_meals.count(),
-                'co2': round(float(sum([m.total_co2 for m in month_meals])), 2)
-            },
-            {
-                'category': 'Transporte',
-                'count': month_transports.count(),
-                'co2': round(float(sum([t.total_co2 for t in month_transports])), 2)
-            }
-        ]
-        
+
+        invalid_date = Response(
+            {'error': 'Las fechas deben tener formato YYYY-MM-DD'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+        # parse_date retorna None si el formato no coincide y lanza
+        # ValueError si coincide pero la fecha no existe (2025-02-30)
+        try:
+            date_to = parse_date(params['to']) if params.get('to') else timezone.localdate()
+        except ValueError:
+            date_to = None
+        if date_to is None:
+            return invalid_date
+
+        try:
+            date_from = parse_date(params['from']) if params.get('from') else date_to - timedelta(days=6)
+        except ValueError:
+            date_from = None
+        if date_from is None:
+            return invalid_date
+
+        if date_from > date_to:
+            return Response(
+                {'error': 'from debe ser anterior o igual a to'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if count_buckets(date_from, date_to, bucket) > MAX_BUCKETS:
+            return Response(
+                {'error': f'El rango excede el máximo de {MAX_BUCKETS} intervalos; usa un bucket mayor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        categories = [category] if category else list(SOURCES)
+        data = emission_timeseries(request.user, date_from, date_to, bucket, categories)
+
         return Response({
-            'summary': {
-                'total_co2': round(total_co2, 2),
-                'today_co2': round(float(today_co2), 2),
-                'total_meals': total_meals,
-                'total_transports': total_transports,
-                'vegan_meals': vegan_meals,
-                'vegetarian_meals': vegetarian_meals,
-                'level': user.profile.level,
-                'total_points': user.profile.total_points,
-                'streak_days': user.profile.streak_days,
-            },
-            'charts': {
-                'co2_by_day': co2_by_day,
-                'meals_by_type': meals_by_type,
-                'transports_by_type': transports_by_type,
-                'category_stats': category_stats,
-            }
+            'from': date_from.isoformat(),
+            'to': date_to.isoformat(),
+            'bucket': bucket,
+            **data
         })
 
 
@@ -133,17 +118,10 @@ class V_RandomEcoTip(APIView):
         # Obtener categoría opcional del query param
         category = request.query_params.get('category', None)
         
-        # Filtrar tips activos
-        tips = EcoTip.objects.filter(is_active=True)
-        
-        if category:
-            tips = tips.filter(category=category)
-        
-        # Obtener tip aleatorio
-        if tips.exists():
-            tip = random.choice(list(tips))
-            serializer = EcoTipSerializer(tip)
-            return Response(serializer.data)
+        # Obtener tip aleatorio del pool en memoria
+        tip = eco_tip_pool.random_tip(category, user_id=request.user.id)
+        if tip is not None:
+            return Response(tip)
         
         # Si no hay tips, devolver uno por defecto
         return Response({
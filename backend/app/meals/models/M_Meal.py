@@ -1,9 +1,10 @@
 """
 Modelo para registro de comidas y su impacto en CO2.
 """
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from core.cache import bump_user_version
 from core.models import M_BaseModel
 from core.utils import CarbonCalculator
 
@@ -67,12 +68,18 @@ class M_Meal(M_BaseModel):
         ordering = ['-meal_date', '-created_at']
         indexes = [
             models.Index(fields=['user', '-meal_date']),
+            # Sincronización incremental (app.sync)
+            models.Index(fields=['user', 'updated_at', 'id']),
         ]
 
     def __str__(self):
         return f"{self.user.username} - {self.get_meal_type_display()} ({self.meal_date})"
 
-    def save(self, *args, **kwargs):
+    def compute_derived_fields(self):
+        """
+        Calcula CO2 y clasificación vegetariana/vegana a partir de los ingredientes.
+        Se usa en save() y antes de bulk_create, que no llama a save().
+        """
         if not self.total_co2 or self.total_co2 == 0:
             self.total_co2 = CarbonCalculator.calculate_meal_emissions(
                 self.ingredients
@@ -89,15 +96,51 @@ class M_Meal(M_BaseModel):
         
         self.is_vegan = not has_animal
         self.is_vegetarian = not has_meat
+
+    def save(self, *args, **kwargs):
+        self.compute_derived_fields()
         
         is_new = self.pk is None
-        super().save(*args, **kwargs)
-        
-        # Verificar logros después de crear una comida
-        if is_new:
-            try:
-                from app.social.models import UserAchievement
-                UserAchievement.check_and_unlock_achievements(self.user)
-            except:
-                pass
+        with transaction.atomic():
+            # Estado anterior leído con la fila bloqueada: dos guardados
+            # concurrentes no pueden descontar dos veces el mismo estado
+            previous = None
+            if not is_new:
+                previous = M_Meal.objects.select_for_update().filter(pk=self.pk).values(
+                    'is_active', 'meal_date', 'total_co2', 'is_vegan', 'is_vegetarian'
+                ).first()
+            
+            super().save(*args, **kwargs)
+            
+            # Mantener el acumulado diario de emisiones y los contadores
+            from app.dashboard.rollups import track_activity_change
+            from app.users.stats import track_stats_change
+            before = None
+            stats_before = None
+            if previous and previous['is_active']:
+                before = (previous['meal_date'], previous['total_co2'])
+                stats_before = (previous['is_vegan'], previous['is_vegetarian'], previous['total_co2'])
+            track_activity_change(self.user_id, 'meals', before, self.rollup_state())
+            track_stats_change(self.user_id, 'meals', stats_before, self.stats_state())
+            bump_user_version(self.user_id)
+            
+            from app.sync.sync import COLLECTION_MEALS, record_changes
+            record_changes(COLLECTION_MEALS, [(self.user_id, self.pk)])
+            
+            # Los logros se evalúan fuera del request
+            if is_new:
+                from app.social.achievement_queue import enqueue_achievement_evaluation
+                from app.social.achievements import MEAL_LOGGED
+                enqueue_achievement_evaluation(self.user_id, MEAL_LOGGED)
+
+    def rollup_state(self):
+        """Fecha y CO2 con que la comida cuenta en el acumulado diario."""
+        if not self.is_active:
+            return None
+        return (self.meal_date, self.total_co2)
 
+    def stats_state(self):
+        """Clasificación y CO2 con que la comida cuenta en los contadores del usuario."""
+        if not self.is_active:
+            return None
+        return (self.is_vegan, self.is_vegetarian, self.total_co2)
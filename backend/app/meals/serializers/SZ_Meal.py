@@ -2,11 +2,30 @@
 Serializers para comidas.
 """
 from rest_framework import serializers
+from django.db import transaction
 from app.meals.models import M_Meal
+from app.users.points import REASON_MEAL, award_points
+from core.cache import bump_user_version
 from core.utils import CarbonCalculator, SUSTAINABILITY_POINTS
 from datetime import date
 
 
+# Máximo de comidas por registro masivo
+MAX_BULK_MEALS = 100
+
+
+def meal_points(meal):
+    """Puntos por registrar una comida, con bonus por comidas sostenibles."""
+    points = SUSTAINABILITY_POINTS['log_meal']
+    
+    if meal.is_vegan:
+        points += SUSTAINABILITY_POINTS['vegan_meal']
+    elif meal.is_vegetarian:
+        points += SUSTAINABILITY_POINTS['vegetarian_meal']
+    
+    return points
+
+
 class SZ_MealCreate(serializers.ModelSerializer):
     
     class Meta:
@@ -43,23 +62,61 @@ class SZ_MealCreate(serializers.ModelSerializer):
         # Asignar usuario actual
         validated_data['user'] = self.context['request'].user
         
-        # El CO2 se calcula automáticamente en el modelo
-        meal = M_Meal.objects.create(**validated_data)
+        # Los logros encolados se evalúan con puntos y racha ya guardados
+        with transaction.atomic():
+            # El CO2 se calcula automáticamente en el modelo
+            meal = M_Meal.objects.create(**validated_data)
+            
+            # Puntos, nivel y racha con un solo UPDATE del perfil
+            award_points(meal.user_id, [(meal_points(meal), REASON_MEAL, meal)], [meal.meal_date])
         
-        # Dar puntos al usuario
-        user_profile = meal.user.profile
-        points = SUSTAINABILITY_POINTS['log_meal']
+        return meal
+
+
+class SZ_MealBulkCreate(serializers.Serializer):
+    """
+    Registro masivo de comidas (sincronización de entradas offline).
+    Cada comida se valida con las reglas de SZ_MealCreate; los efectos
+    secundarios (puntos, racha, acumulados y logros) se aplican una vez por lote.
+    """
+    meals = SZ_MealCreate(many=True, allow_empty=False, max_length=MAX_BULK_MEALS)
+    
+    def create(self, validated_data):
+        from app.dashboard.rollups import track_bulk_activities
+        from app.users.stats import track_bulk_stats
+        from app.social.achievement_queue import enqueue_achievement_evaluation
+        from app.social.achievements import MEAL_LOGGED
+        from app.sync.sync import COLLECTION_MEALS, record_changes
         
-        # Bonus por comidas sostenibles
-        if meal.is_vegan:
-            points += SUSTAINABILITY_POINTS['vegan_meal']
-        elif meal.is_vegetarian:
-            points += SUSTAINABILITY_POINTS['vegetarian_meal']
+        user = self.context['request'].user
         
-        user_profile.add_points(points)
-        user_profile.update_streak(meal.meal_date)
+        meals = [M_Meal(user=user, **meal_data) for meal_data in validated_data['meals']]
+        emissions = CarbonCalculator.calculate_meal_emissions_batch(
+            meal.ingredients for meal in meals
+        )
+        for meal, total_co2 in zip(meals, emissions):
+            if not meal.total_co2:
+                meal.total_co2 = total_co2
+            meal.compute_derived_fields()
         
-        return meal
+        with transaction.atomic():
+            meals = M_Meal.objects.bulk_create(meals)
+            record_changes(COLLECTION_MEALS, [(user.id, meal.pk) for meal in meals])
+            track_bulk_activities(user.id, 'meals', [meal.rollup_state() for meal in meals])
+            track_bulk_stats(user.id, 'meals', [meal.stats_state() for meal in meals])
+            bump_user_version(user.id)
+            
+            # Un movimiento de puntos por comida; puntos, nivel y racha con un solo UPDATE
+            award_points(
+                user.id,
+                [(meal_points(meal), REASON_MEAL, meal) for meal in meals],
+                [meal.meal_date for meal in meals]
+            )
+            
+            # Una sola evaluación de logros para todo el lote
+            enqueue_achievement_evaluation(user.id, MEAL_LOGGED)
+        
+        return meals
 
 
 class SZ_Meal(serializers.ModelSerializer):
@@ -1,3 +1,3 @@
-from .SZ_Meal import SZ_Meal, SZ_MealCreate, SZ_MealList
+from .SZ_Meal import SZ_Meal, SZ_MealCreate, SZ_MealBulkCreate, SZ_MealList
 
-__all__ = ['SZ_Meal', 'SZ_MealCreate', 'SZ_MealList']
+__all__ = ['SZ_Meal', 'SZ_MealCreate', 'SZ_MealBulkCreate', 'SZ_MealList']
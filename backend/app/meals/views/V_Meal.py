@@ -6,12 +6,20 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from django.views.decorators.http import condition
 from app.meals.models import M_Meal
-from app.meals.serializers import SZ_Meal, SZ_MealCreate, SZ_MealList
+from app.meals.serializers import SZ_Meal, SZ_MealCreate, SZ_MealBulkCreate, SZ_MealList
+from core.utils import InvalidCursor, KeysetPaginator, build_etag, queryset_fingerprint
+
+
+def _meal_list_etag(request):
+    meals = M_Meal.objects.filter(user=request.user)
+    return build_etag('meals', request.user.id, request.get_full_path(), queryset_fingerprint(meals))
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@condition(etag_func=_meal_list_etag)
 def V_MealList(request):
 
     meals = M_Meal.objects.filter(user=request.user, is_active=True)
@@ -26,12 +34,22 @@ def V_MealList(request):
     if meal_type:
         meals = meals.filter(meal_type=meal_type)
     
-    serializer = SZ_MealList(meals, many=True)
+    # Paginación por cursor sobre (user, -meal_date)
+    try:
+        page, next_cursor, count = KeysetPaginator(meals, 'meal_date').paginate(request.query_params)
+    except InvalidCursor as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
-    return Response({
-        'count': meals.count(),
-        'meals': serializer.data
-    }, status=status.HTTP_200_OK)
+    serializer = SZ_MealList(page, many=True)
+    
+    data = {
+        'meals': serializer.data,
+        'next_cursor': next_cursor,
+    }
+    if count is not None:
+        data['count'] = count
+    
+    return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -57,6 +75,27 @@ def V_MealCreate(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def V_MealBulkCreate(request):
+    serializer = SZ_MealBulkCreate(
+        data=request.data,
+        context={'request': request}
+    )
+    
+    if serializer.is_valid():
+        meals = serializer.save()
+        
+        return Response({
+            'message': f'¡{len(meals)} comidas registradas exitosamente!',
+            'count': len(meals),
+            'meals': SZ_MealList(meals, many=True).data,
+            'co2_emitted': round(sum(meal.total_co2 for meal in meals), 3),
+        }, status=status.HTTP_201_CREATED)
+    
+    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def V_MealDetail(request, meal_id):
@@ -1,3 +1,3 @@
-from .V_Meal import V_MealList, V_MealCreate, V_MealDetail, V_MealDelete
+from .V_Meal import V_MealList, V_MealCreate, V_MealBulkCreate, V_MealDetail, V_MealDelete
 
-__all__ = ['V_MealList', 'V_MealCreate', 'V_MealDetail', 'V_MealDelete']
+__all__ = ['V_MealList', 'V_MealCreate', 'V_MealBulkCreate', 'V_MealDetail', 'V_MealDelete']
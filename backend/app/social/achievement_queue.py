@@ -0,0 +1,189 @@
+"""
+Cola de evaluación de logros en la base de datos.
+Guardar una actividad solo encola un trabajo (en la misma transacción);
+un worker lo procesa después, fuera del request. Los eventos de un mismo
+usuario se combinan en un único trabajo pendiente.
+"""
+import logging
+import threading
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+from .achievements import ALL_EVENTS, AchievementEvaluator, events_to_mask, mask_to_events
+from .models import AchievementJob
+
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+# Trabajos en proceso más antiguos se consideran de un worker caído
+STALE_AFTER = timedelta(minutes=5)
+# Espera antes de reintentar un trabajo que falló
+RETRY_DELAY = timedelta(seconds=30)
+BATCH_SIZE = 100
+# Intervalo con que el hilo revisa la cola sin notificaciones (reintentos)
+POLL_SECONDS = 30
+
+
+def _merge_pending(user_id, mask):
+    return AchievementJob.objects.filter(
+        user_id=user_id,
+        status=AchievementJob.STATUS_PENDING
+    ).update(events=F('events').bitor(mask), updated_at=timezone.now())
+
+
+def enqueue_achievement_evaluation(user_id, *events):
+    """
+    Encola la evaluación de logros de un usuario para `events`
+    (todos si no se indica ninguno). Se combina con el trabajo pendiente
+    del usuario si ya existe uno.
+    """
+    mask = events_to_mask(events or (ALL_EVENTS,))
+    if not _merge_pending(user_id, mask):
+        try:
+            with transaction.atomic():
+                AchievementJob.objects.create(user_id=user_id, events=mask)
+        except IntegrityError:
+            # Otra petición creó el pendiente entre el UPDATE y el INSERT
+            _merge_pending(user_id, mask)
+
+    transaction.on_commit(achievement_worker.notify)
+
+
+def _requeue(job, **fields):
+    """Vuelve a dejar pendiente un trabajo, combinándolo con el pendiente del usuario si existe."""
+    try:
+        with transaction.atomic():
+            AchievementJob.objects.filter(pk=job.pk).update(
+                status=AchievementJob.STATUS_PENDING,
+                updated_at=timezone.now(),
+                **fields
+            )
+    except IntegrityError:
+        with transaction.atomic():
+            _merge_pending(job.user_id, job.events)
+            AchievementJob.objects.filter(pk=job.pk).delete()
+
+
+def requeue_stale_jobs():
+    stale = AchievementJob.objects.filter(
+        status=AchievementJob.STATUS_PROCESSING,
+        started_at__lt=timezone.now() - STALE_AFTER
+    )
+    for job in stale:
+        _requeue(job)
+
+
+def _claim(job):
+    """Marca el trabajo como en proceso; False si otro worker lo tomó antes."""
+    now = timezone.now()
+    return AchievementJob.objects.filter(
+        pk=job.pk,
+        status=AchievementJob.STATUS_PENDING
+    ).update(
+        status=AchievementJob.STATUS_PROCESSING,
+        started_at=now,
+        attempts=F('attempts') + 1,
+        updated_at=now
+    ) == 1
+
+
+def _run(job):
+    from django.contrib.auth.models import User
+    from app.users.models import M_UserProfile
+
+    try:
+        user = User.objects.select_related('profile').get(pk=job.user_id)
+        AchievementEvaluator(user).evaluate(*mask_to_events(job.events))
+    except M_UserProfile.DoesNotExist:
+        pass
+    except Exception as e:
+        logger.exception('Error evaluando logros del usuario %s', job.user_id)
+        if job.attempts + 1 >= MAX_ATTEMPTS:
+            AchievementJob.objects.filter(pk=job.pk).update(
+                status=AchievementJob.STATUS_FAILED,
+                last_error=str(e),
+                updated_at=timezone.now()
+            )
+        else:
+            _requeue(job, last_error=str(e))
+        return False
+
+    AchievementJob.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def process_pending_jobs(limit=BATCH_SIZE, user_ids=None):
+    """
+    Procesa hasta `limit` trabajos pendientes, en orden de llegada.
+    Se omiten usuarios con un trabajo ya en proceso para no evaluar
+    al mismo usuario en paralelo.
+
+    Returns:
+        Cantidad de trabajos tomados
+    """
+    requeue_stale_jobs()
+
+    busy = AchievementJob.objects.filter(
+        user_id=OuterRef('user_id'),
+        status=AchievementJob.STATUS_PROCESSING
+    )
+    jobs = AchievementJob.objects.filter(
+        status=AchievementJob.STATUS_PENDING
+    ).exclude(Exists(busy)).exclude(
+        last_error__gt='',
+        updated_at__gt=timezone.now() - RETRY_DELAY
+    ).order_by('created_at')
+    if user_ids is not None:
+        jobs = jobs.filter(user_id__in=user_ids)
+
+    claimed = 0
+    for job in list(jobs[:limit]):
+        if _claim(job):
+            claimed += 1
+            _run(job)
+    return claimed
+
+
+class AchievementWorker:
+    """
+    Hilo del proceso que vacía la cola cuando se confirma un trabajo.
+    Solo se usa con ACHIEVEMENT_WORKER = 'thread'; con 'command' la cola
+    la procesa `python manage.py process_achievement_jobs`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def notify(self):
+        if getattr(settings, 'ACHIEVEMENT_WORKER', 'thread') != 'thread':
+            return
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(
+                        target=self._loop,
+                        name='achievement-worker',
+                        daemon=True
+                    )
+                    self._thread.start()
+        self._wakeup.set()
+
+    def _loop(self):
+        while True:
+            self._wakeup.wait(timeout=POLL_SECONDS)
+            self._wakeup.clear()
+            try:
+                while process_pending_jobs():
+                    pass
+            except Exception:
+                logger.exception('Error en el worker de logros')
+            finally:
+                connection.close()
+
+
+achievement_worker = AchievementWorker()
@@ -0,0 +1,235 @@
+"""
+Evaluación incremental de logros.
+Cada evento (comida registrada, viaje registrado, amistad aceptada,
+cambio de nivel) evalúa solo los tipos de requisito que puede afectar,
+calcula cada métrica una vez y escribe solo las filas que cambiaron.
+"""
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from core.cache import bump_user_version
+from .models import Achievement, UserAchievement
+
+
+MEAL_LOGGED = 'meal_logged'
+TRIP_LOGGED = 'trip_logged'
+FRIEND_ACCEPTED = 'friend_accepted'
+LEVEL_CHANGED = 'level_changed'
+ALL_EVENTS = 'all'
+
+# Registrar actividad también otorga puntos (nivel) y mueve la racha
+EVENT_REQUIREMENTS = {
+    MEAL_LOGGED: {
+        'meal_count', 'vegan_meal_count', 'vegetarian_meal_count',
+        'co2_saved', 'daily_streak', 'level_reached',
+    },
+    TRIP_LOGGED: {
+        'transport_count', 'eco_transport_count',
+        'co2_saved', 'daily_streak', 'level_reached',
+    },
+    FRIEND_ACCEPTED: {'friend_count', 'level_reached'},
+    LEVEL_CHANGED: {'level_reached'},
+    ALL_EVENTS: {choice for choice, _ in Achievement.REQUIREMENT_CHOICES},
+}
+
+# Bits con que los eventos se combinan en la cola (AchievementJob.events)
+EVENT_FLAGS = {
+    MEAL_LOGGED: 1,
+    TRIP_LOGGED: 2,
+    FRIEND_ACCEPTED: 4,
+    LEVEL_CHANGED: 8,
+}
+EVENT_FLAGS[ALL_EVENTS] = sum(EVENT_FLAGS.values())
+
+# Requisitos que son campos de M_UserStats con el mismo nombre
+STATS_REQUIREMENTS = {
+    'meal_count', 'vegan_meal_count', 'vegetarian_meal_count',
+    'transport_count', 'eco_transport_count', 'friend_count',
+}
+
+# Requisitos que salen del perfil: tipo -> campo de M_UserProfile
+PROFILE_REQUIREMENTS = {
+    'co2_saved': 'total_co2_saved',
+    'daily_streak': 'streak_days',
+    'level_reached': 'level',
+}
+
+# Cadenas de logros que suben de nivel a su vez; el límite evita ciclos
+MAX_LEVEL_ROUNDS = 5
+
+
+def requirement_types_for(event):
+    try:
+        return EVENT_REQUIREMENTS[event]
+    except KeyError:
+        raise ValueError(f'Evento de logros desconocido: {event}')
+
+
+def profile_metrics(total_co2_saved, streak_days, level):
+    return {
+        'co2_saved': int(total_co2_saved),
+        'daily_streak': streak_days,
+        'level_reached': level,
+    }
+
+
+def events_to_mask(events):
+    mask = 0
+    for event in events:
+        requirement_types_for(event)
+        mask |= EVENT_FLAGS[event]
+    return mask
+
+
+def mask_to_events(mask):
+    if mask & EVENT_FLAGS[ALL_EVENTS] == EVENT_FLAGS[ALL_EVENTS]:
+        return [ALL_EVENTS]
+    return [
+        event for event, flag in EVENT_FLAGS.items()
+        if event != ALL_EVENTS and mask & flag
+    ]
+
+
+class AchievementEvaluator:
+    """
+    Evalúa los logros de un usuario para un evento.
+
+    Las métricas salen de dos filas: los contadores del usuario
+    (M_UserStats) y su perfil, y solo se leen las que el evento necesita.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.profile = user.profile
+
+    def compute_metrics(self, requirement_types):
+        """Valor actual de cada tipo de requisito pedido."""
+        from app.users.stats import get_user_stats
+
+        metrics = {}
+        if STATS_REQUIREMENTS & requirement_types:
+            stats = get_user_stats(self.user.id)
+            for requirement_type in STATS_REQUIREMENTS:
+                metrics[requirement_type] = getattr(stats, requirement_type)
+        if PROFILE_REQUIREMENTS.keys() & requirement_types:
+            metrics.update(profile_metrics(
+                self.profile.total_co2_saved,
+                self.profile.streak_days,
+                self.profile.level
+            ))
+        return metrics
+
+    @staticmethod
+    def progress_for(achievement, value):
+        """(progreso %, alcanzado) para un valor de la métrica."""
+        if achievement.requirement_value <= 0:
+            return 100, True
+        progress = min(100, int((value / achievement.requirement_value) * 100))
+        return progress, value >= achievement.requirement_value
+
+    def evaluate(self, *events):
+        """
+        Actualiza progreso y desbloqueos de los logros afectados por `events`
+        (todos los tipos de requisito si no se indica ninguno).
+
+        Returns:
+            Lista de UserAchievement desbloqueados en esta evaluación
+        """
+        requirement_types = set()
+        for event in events or (ALL_EVENTS,):
+            requirement_types |= requirement_types_for(event)
+
+        unlocked = []
+        for _ in range(MAX_LEVEL_ROUNDS):
+            level = self.profile.level
+            unlocked += self._evaluate_once(requirement_types)
+            if self.profile.level == level:
+                break
+            requirement_types = requirement_types_for(LEVEL_CHANGED)
+        return unlocked
+
+    def _evaluate_once(self, requirement_types):
+        achievements = list(
+            Achievement.objects.filter(is_active=True, requirement_type__in=requirement_types)
+        )
+        if not achievements:
+            return []
+
+        try:
+            with transaction.atomic():
+                return self._apply(achievements)
+        except IntegrityError:
+            # Otra evaluación concurrente creó las mismas filas: reintentar con ellas
+            with transaction.atomic():
+                return self._apply(achievements)
+
+    def _apply(self, achievements):
+        existing = {
+            user_achievement.achievement_id: user_achievement
+            for user_achievement in UserAchievement.objects.filter(
+                user=self.user,
+                achievement__in=achievements
+            )
+        }
+        pending = [
+            achievement for achievement in achievements
+            if not (achievement.id in existing and existing[achievement.id].is_unlocked)
+        ]
+        if not pending:
+            return []
+
+        metrics = self.compute_metrics({achievement.requirement_type for achievement in pending})
+        now = timezone.now()
+
+        created, changed, reached_existing, unlocked = [], [], [], []
+        for achievement in pending:
+            progress, reached = self.progress_for(achievement, metrics[achievement.requirement_type])
+            user_achievement = existing.get(achievement.id)
+            if user_achievement is None:
+                user_achievement = UserAchievement(
+                    user=self.user,
+                    achievement=achievement,
+                    progress=progress,
+                    updated_at=now
+                )
+                if reached:
+                    user_achievement.is_unlocked = True
+                    user_achievement.unlocked_at = now
+                    user_achievement.progress = 100
+                    unlocked.append(user_achievement)
+                created.append(user_achievement)
+            elif reached:
+                reached_existing.append(user_achievement)
+            elif user_achievement.progress != progress:
+                user_achievement.progress = progress
+                user_achievement.updated_at = now
+                changed.append(user_achievement)
+
+        if created:
+            # La restricción (user, achievement) impide crear dos veces la misma fila
+            UserAchievement.objects.bulk_create(created)
+        if changed:
+            UserAchievement.objects.bulk_update(changed, ['progress', 'updated_at'])
+        for user_achievement in reached_existing:
+            # UPDATE condicional: solo una evaluación concurrente gana el desbloqueo
+            won = UserAchievement.objects.filter(
+                pk=user_achievement.pk,
+                is_unlocked=False
+            ).update(is_unlocked=True, unlocked_at=now, progress=100, updated_at=now)
+            if won:
+                user_achievement.is_unlocked = True
+                user_achievement.unlocked_at = now
+                user_achievement.progress = 100
+                unlocked.append(user_achievement)
+        if created or changed or unlocked:
+            from app.sync.sync import COLLECTION_ACHIEVEMENTS, record_changes
+            bump_user_version(self.user.id)
+            record_changes(COLLECTION_ACHIEVEMENTS, [
+                (self.user.id, user_achievement.pk) for user_achievement in created + changed + unlocked
+            ])
+        if unlocked:
+            from app.users.points import REASON_ACHIEVEMENT
+            self.profile.apply_activity([
+                (ua.achievement.points, REASON_ACHIEVEMENT, ua.achievement) for ua in unlocked
+            ])
+
+        return unlocked
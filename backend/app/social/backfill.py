@@ -0,0 +1,165 @@
+"""
+Re-evaluación masiva de logros cuando cambia el catálogo.
+Cada lote de usuarios calcula sus métricas con consultas agrupadas
+y escribe las filas de UserAchievement con bulk_create/bulk_update.
+Las funciones de lote son de nivel de módulo para poder ejecutarse
+en un pool de procesos.
+"""
+from collections import defaultdict
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from core.cache import bump_user_version
+from .achievements import (
+    LEVEL_CHANGED, PROFILE_REQUIREMENTS, STATS_REQUIREMENTS,
+    AchievementEvaluator, profile_metrics
+)
+from .models import Achievement, UserAchievement
+
+
+def init_worker():
+    """Inicializador de los procesos del pool."""
+    import django
+    django.setup()
+
+
+def compute_chunk_metrics(user_ids, requirement_types):
+    """
+    Métricas de un lote de usuarios.
+
+    Returns:
+        Dict {user_id: {tipo de requisito: valor}}
+    """
+    from app.users.models import M_UserProfile
+    from app.users.stats import compute_user_stats
+
+    metrics = {user_id: {} for user_id in user_ids}
+    if STATS_REQUIREMENTS & requirement_types:
+        for user_id, stats in compute_user_stats(user_ids).items():
+            for requirement_type in STATS_REQUIREMENTS:
+                metrics[user_id][requirement_type] = stats[requirement_type]
+    if PROFILE_REQUIREMENTS.keys() & requirement_types:
+        profiles = M_UserProfile.objects.filter(user_id__in=user_ids).values_list(
+            'user_id', *PROFILE_REQUIREMENTS.values()
+        )
+        for user_id, *values in profiles:
+            metrics[user_id].update(profile_metrics(*values))
+    return metrics
+
+
+def backfill_chunk(user_ids, achievement_ids):
+    """
+    Re-evalúa `achievement_ids` para un lote de usuarios (con perfil).
+
+    Returns:
+        Dict con las filas creadas, actualizadas y desbloqueadas y los puntos otorgados
+    """
+    achievements = list(Achievement.objects.filter(id__in=achievement_ids))
+    if not achievements or not user_ids:
+        return {
+            'users': len(user_ids), 'created': 0, 'updated': 0,
+            'unlocked': 0, 'points': 0, 'leveled': [],
+        }
+
+    try:
+        with transaction.atomic():
+            result = _apply_chunk(user_ids, achievements)
+    except IntegrityError:
+        # Una evaluación concurrente creó filas del lote: reintentar con ellas
+        with transaction.atomic():
+            result = _apply_chunk(user_ids, achievements)
+    result['users'] = len(user_ids)
+    return result
+
+
+def _apply_chunk(user_ids, achievements):
+    from app.social.achievement_queue import enqueue_achievement_evaluation
+    from app.users.models import M_UserProfile
+    from app.sync.sync import COLLECTION_ACHIEVEMENTS, record_changes
+    from app.users.points import REASON_ACHIEVEMENT, apply_points, ledger_entry, record_transactions
+
+    # Bloquear las filas existentes evita desbloquear (y premiar) dos veces
+    # un logro que el worker de la cola evalúa al mismo tiempo
+    existing = {
+        (user_achievement.user_id, user_achievement.achievement_id): user_achievement
+        for user_achievement in UserAchievement.objects.select_for_update().filter(
+            user_id__in=user_ids,
+            achievement__in=achievements
+        )
+    }
+    metrics = compute_chunk_metrics(
+        user_ids,
+        {achievement.requirement_type for achievement in achievements}
+    )
+    now = timezone.now()
+
+    created, changed, entries = [], [], []
+    points = defaultdict(int)
+    unlocked_count = 0
+    for user_id in user_ids:
+        user_metrics = metrics[user_id]
+        for achievement in achievements:
+            user_achievement = existing.get((user_id, achievement.id))
+            if user_achievement is not None and user_achievement.is_unlocked:
+                continue
+
+            progress, reached = AchievementEvaluator.progress_for(
+                achievement, user_metrics[achievement.requirement_type]
+            )
+            if reached:
+                progress = 100
+                points[user_id] += achievement.points
+                unlocked_count += 1
+                entries.append(ledger_entry(user_id, achievement.points, REASON_ACHIEVEMENT, achievement))
+
+            if user_achievement is None:
+                created.append(UserAchievement(
+                    user_id=user_id,
+                    achievement=achievement,
+                    progress=progress,
+                    is_unlocked=reached,
+                    unlocked_at=now if reached else None,
+                    updated_at=now
+                ))
+            elif reached or user_achievement.progress != progress:
+                user_achievement.progress = progress
+                user_achievement.is_unlocked = reached
+                user_achievement.unlocked_at = now if reached else None
+                user_achievement.updated_at = now
+                changed.append(user_achievement)
+
+    UserAchievement.objects.bulk_create(created, batch_size=1000)
+    UserAchievement.objects.bulk_update(
+        changed,
+        ['progress', 'is_unlocked', 'unlocked_at', 'updated_at'],
+        batch_size=1000
+    )
+    record_changes(COLLECTION_ACHIEVEMENTS, [
+        (user_achievement.user_id, user_achievement.pk) for user_achievement in created + changed
+    ])
+
+    # Un movimiento por logro desbloqueado y un UPDATE por cada valor distinto de puntos
+    leveled_ids = []
+    awarded = [user_id for user_id, user_points in points.items() if user_points]
+    if awarded:
+        profiles = M_UserProfile.objects.filter(user_id__in=awarded)
+        levels_before = dict(profiles.values_list('user_id', 'level'))
+        record_transactions(entries)
+        apply_points(points)
+        leveled_ids = [
+            user_id for user_id, level in profiles.values_list('user_id', 'level')
+            if level > levels_before[user_id]
+        ]
+        # Los logros de nivel los evalúa la cola con el nivel ya actualizado
+        for user_id in leveled_ids:
+            enqueue_achievement_evaluation(user_id, LEVEL_CHANGED)
+
+    touched = {user_achievement.user_id for user_achievement in created + changed}
+    transaction.on_commit(lambda: [bump_user_version(user_id) for user_id in touched])
+
+    return {
+        'created': len(created),
+        'updated': len(changed),
+        'unlocked': unlocked_count,
+        'points': sum(points.values()),
+        'leveled': leveled_ids,
+    }
@@ -0,0 +1,147 @@
+"""
+Conjuntos de amigos por usuario.
+Cada amistad aceptada se materializa en FriendEdge en ambos sentidos, así
+que los ids de amigos salen de un rango del índice (user, friend). Se
+guardan en la caché compartida de respuestas con una versión por usuario
+en la llave (como core.cache.response_cache); aceptar, rechazar o
+eliminar una amistad incrementa la versión de ambos usuarios al
+confirmar la transacción.
+
+Las sugerencias ("personas que quizá conozcas") se ordenan por amigos en
+común con una sola agregación de FriendEdge consigo misma y también se
+cachean por usuario.
+"""
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count
+
+
+# La invalidación es por versión; el timeout solo acota entradas huérfanas
+FRIEND_IDS_TIMEOUT = 60 * 60
+
+# Las sugerencias también cambian cuando los amigos hacen amigos nuevos,
+# que no invalida la caché del usuario: se recalculan cada tanto
+SUGGESTIONS_TIMEOUT = 10 * 60
+SUGGESTIONS_LIMIT = 20
+
+
+def _cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'responses')]
+
+
+def _version_key(user_id):
+    return f'friend_version:{user_id}'
+
+
+def _friend_version(cache, user_id):
+    """
+    Versión de los amigos del usuario. Si el contador no existe se
+    inicializa con el reloj, para no coincidir con una versión anterior.
+    """
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _friend_ids_key(user_id, version):
+    return f'friend_ids:{user_id}:{version}'
+
+
+def _suggestions_key(user_id, version):
+    return f'friend_suggestions:{user_id}:{version}'
+
+
+def fetch_friend_ids(user_id):
+    """Ids de los amigos del usuario, consultados sin caché."""
+    from .models import FriendEdge
+
+    return frozenset(
+        FriendEdge.objects.filter(user_id=user_id).order_by().values_list('friend_id', flat=True)
+    )
+
+
+def get_friend_ids(user_id):
+    """Ids de los amigos del usuario (frozenset), desde la caché si están."""
+    cache = _cache()
+    key = _friend_ids_key(user_id, _friend_version(cache, user_id))
+    friend_ids = cache.get(key)
+    if friend_ids is None:
+        friend_ids = fetch_friend_ids(user_id)
+        cache.set(key, friend_ids, FRIEND_IDS_TIMEOUT)
+    return friend_ids
+
+
+def fetch_friend_suggestions(user_id, limit=SUGGESTIONS_LIMIT):
+    """
+    Amigos de amigos ordenados por cantidad de amigos en común, sin
+    consultar caché. Excluye al usuario, a sus amigos y a quienes ya
+    tienen una solicitud con él (en cualquier estado).
+
+    Returns:
+        Lista de (user_id, amigos en común)
+    """
+    from .models import FriendEdge, Friendship
+
+    friends = FriendEdge.objects.filter(user_id=user_id).values('friend_id')
+    related = Friendship.objects.order_by()
+    rows = FriendEdge.objects.filter(
+        user_id__in=friends
+    ).exclude(
+        friend_id=user_id
+    ).exclude(
+        friend_id__in=friends
+    ).exclude(
+        friend_id__in=related.filter(from_user_id=user_id).values('to_user_id')
+    ).exclude(
+        friend_id__in=related.filter(to_user_id=user_id).values('from_user_id')
+    ).order_by().values('friend_id').annotate(
+        mutual=Count('id')
+    ).order_by('-mutual', 'friend_id')[:limit]
+    return [(row['friend_id'], row['mutual']) for row in rows]
+
+
+def get_friend_suggestions(user_id):
+    """Sugerencias del usuario (hasta SUGGESTIONS_LIMIT), desde la caché si están."""
+    cache = _cache()
+    key = _suggestions_key(user_id, _friend_version(cache, user_id))
+    suggestions = cache.get(key)
+    if suggestions is None:
+        suggestions = fetch_friend_suggestions(user_id)
+        cache.set(key, suggestions, SUGGESTIONS_TIMEOUT)
+    return suggestions
+
+
+def invalidate_friend_ids(*user_ids):
+    """
+    Deja obsoletos los amigos y las sugerencias cacheados de los usuarios
+    incrementando su versión al confirmar la transacción en curso. Una
+    lectura concurrente que todavía ve el conjunto anterior lo guarda con
+    la versión vieja, que ya nadie consulta.
+    """
+    def bump():
+        cache = _cache()
+        for user_id in user_ids:
+            try:
+                cache.incr(_version_key(user_id))
+            except ValueError:
+                cache.set(_version_key(user_id), time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def sync_friend_edges(friendship, is_accepted):
+    """Crea o elimina las dos filas FriendEdge de una amistad según su estado."""
+    from .models import FriendEdge
+
+    if is_accepted:
+        FriendEdge.objects.bulk_create([
+            FriendEdge(user_id=friendship.from_user_id, friend_id=friendship.to_user_id, friendship=friendship),
+            FriendEdge(user_id=friendship.to_user_id, friend_id=friendship.from_user_id, friendship=friendship),
+        ], ignore_conflicts=True)
+    else:
+        FriendEdge.objects.filter(friendship=friendship).delete()
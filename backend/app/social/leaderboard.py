@@ -0,0 +1,54 @@
+"""
+Consultas de los leaderboards.
+Cada fila sale como diccionario (values) con los datos del perfil y la
+cantidad de logros desbloqueados ya anotados, así el serializer no
+consulta nada por fila.
+"""
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from .models import UserAchievement
+
+
+# Orden del ranking; el id desempata igual que app.social.ranking
+LEADERBOARD_ORDER = (
+    '-profile__total_points',
+    '-profile__level',
+    '-profile__total_co2_saved',
+    'id',
+)
+
+
+def unlocked_count_subquery():
+    """Logros desbloqueados del usuario de la fila (subconsulta correlacionada)."""
+    unlocked = UserAchievement.objects.filter(
+        user=OuterRef('pk'),
+        is_unlocked=True
+    ).order_by().values('user').annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(unlocked, output_field=IntegerField()), Value(0))
+
+
+def leaderboard_values(users):
+    """
+    Filas del leaderboard para el queryset de usuarios `users`, ordenadas.
+    Los usuarios sin perfil toman los valores por defecto del perfil.
+    """
+    return users.order_by(*LEADERBOARD_ORDER).values(
+        'id',
+        'username',
+        'first_name',
+        'last_name',
+        picture=F('profile__profile_picture'),
+        level=Coalesce('profile__level', Value(1)),
+        total_points=Coalesce('profile__total_points', Value(0)),
+        total_co2_saved=Coalesce('profile__total_co2_saved', Value(0.0)),
+        streak_days=Coalesce('profile__streak_days', Value(0)),
+        achievements_count=unlocked_count_subquery(),
+    )
+
+
+def rank_rows(rows, start=1):
+    """Agrega la posición a cada fila, en orden."""
+    rows = list(rows)
+    for rank, row in enumerate(rows, start=start):
+        row['rank'] = rank
+    return rows
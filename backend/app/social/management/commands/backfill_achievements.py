@@ -0,0 +1,106 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from app.social.achievement_queue import process_pending_jobs
+from app.social.backfill import backfill_chunk, init_worker
+from app.social.models import Achievement
+from app.users.models import M_UserProfile
+
+
+class Command(BaseCommand):
+    help = 'Re-evaluar logros para todos los usuarios (tras agregar o modificar logros)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--achievement',
+            type=int,
+            action='append',
+            dest='achievement_ids',
+            help='ID de logro a re-evaluar (se puede repetir)'
+        )
+        parser.add_argument(
+            '--requirement-type',
+            action='append',
+            dest='requirement_types',
+            help='Re-evaluar los logros de este tipo de requisito (se puede repetir)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Procesos en paralelo (1 = en este proceso)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Usuarios por lote'
+        )
+
+    def handle(self, *args, **options):
+        achievements = Achievement.objects.filter(is_active=True)
+        if options['achievement_ids']:
+            achievements = achievements.filter(id__in=options['achievement_ids'])
+        if options['requirement_types']:
+            achievements = achievements.filter(requirement_type__in=options['requirement_types'])
+        achievement_ids = list(achievements.values_list('id', flat=True))
+        if not achievement_ids:
+            raise CommandError('No hay logros activos que coincidan con los filtros')
+
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError('--chunk-size debe ser mayor que 0')
+
+        # Solo los usuarios con perfil tienen logros
+        user_ids = list(M_UserProfile.objects.order_by('user_id').values_list('user_id', flat=True))
+        chunks = [user_ids[start:start + chunk_size] for start in range(0, len(user_ids), chunk_size)]
+        workers = max(1, min(options['workers'], len(chunks)))
+
+        self.stdout.write(
+            f'Re-evaluando {len(achievement_ids)} logros para {len(user_ids)} usuarios '
+            f'({len(chunks)} lotes, {workers} procesos)...'
+        )
+
+        totals = {'users': 0, 'created': 0, 'updated': 0, 'unlocked': 0, 'points': 0}
+        leveled = []
+        started = time.monotonic()
+        for result in self._run(chunks, achievement_ids, workers):
+            for key in totals:
+                totals[key] += result[key]
+            leveled += result['leveled']
+            elapsed = time.monotonic() - started
+            rate = totals['users'] / elapsed if elapsed else 0
+            remaining = (len(user_ids) - totals['users']) / rate if rate else 0
+            self.stdout.write(
+                f'  - {totals["users"]}/{len(user_ids)} usuarios '
+                f'({rate:.0f} usuarios/s, faltan ~{remaining:.0f}s)'
+            )
+
+        # Usuarios que subieron de nivel: evaluar sus logros de nivel ahora
+        for start in range(0, len(leveled), chunk_size):
+            ids = leveled[start:start + chunk_size]
+            process_pending_jobs(limit=len(ids), user_ids=ids)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'\n✓ Proceso completado en {elapsed:.1f}s:'))
+        self.stdout.write(self.style.SUCCESS(f'  - {totals["created"]} logros de usuario creados'))
+        self.stdout.write(self.style.SUCCESS(f'  - {totals["updated"]} logros de usuario actualizados'))
+        self.stdout.write(self.style.SUCCESS(f'  - {totals["unlocked"]} desbloqueados ({totals["points"]} puntos)'))
+        self.stdout.write(self.style.SUCCESS(f'  - {len(leveled)} usuarios subieron de nivel'))
+        if elapsed:
+            self.stdout.write(self.style.SUCCESS(f'  - {totals["users"] / elapsed:.0f} usuarios/s'))
+
+    def _run(self, chunks, achievement_ids, workers):
+        if workers == 1:
+            for chunk in chunks:
+                yield backfill_chunk(chunk, achievement_ids)
+            return
+
+        # Los procesos hijos no deben heredar las conexiones abiertas
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            futures = [pool.submit(backfill_chunk, chunk, achievement_ids) for chunk in chunks]
+            for future in as_completed(futures):
+                yield future.result()
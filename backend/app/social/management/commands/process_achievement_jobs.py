@@ -0,0 +1,46 @@
+import time
+from django.core.management.base import BaseCommand
+from app.social.achievement_queue import BATCH_SIZE, process_pending_jobs
+
+
+class Command(BaseCommand):
+    help = 'Procesar la cola de evaluación de logros'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Vaciar la cola una vez y terminar'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=BATCH_SIZE,
+            help='Trabajos tomados por iteración'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=1.0,
+            help='Segundos de espera cuando la cola está vacía'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        self.stdout.write('Procesando cola de logros...')
+
+        total = 0
+        try:
+            while True:
+                processed = process_pending_jobs(limit=batch_size)
+                total += processed
+                if processed:
+                    self.stdout.write(f'  - {processed} trabajos procesados')
+                    continue
+                if options['once']:
+                    break
+                time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'\n✓ {total} trabajos procesados'))
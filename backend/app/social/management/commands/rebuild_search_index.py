@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth.models import User
+from app.social.search import SEARCH_FIELDS, index_users
+
+
+class Command(BaseCommand):
+    help = 'Regenerar el índice de búsqueda de usuarios (tras cargas masivas o cambios de normalización)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Usuarios procesados por lote'
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+
+        self.stdout.write(f'Indexando {len(user_ids)} usuarios...')
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            index_users(User.objects.filter(id__in=chunk).only(*SEARCH_FIELDS))
+            self.stdout.write(f'  - {min(start + chunk_size, len(user_ids))}/{len(user_ids)} usuarios')
+
+        self.stdout.write(self.style.SUCCESS('\n✓ Índice de búsqueda actualizado'))
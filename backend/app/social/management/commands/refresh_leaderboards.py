@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from app.social.models import PeriodPoints
+from app.social.period_leaderboards import current_periods, refresh_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Regenerar los rankings semanales, mensuales y de temporada vigentes (programar cada 5 minutos)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--period',
+            action='append',
+            dest='period_types',
+            choices=[choice for choice, _ in PeriodPoints.PERIOD_CHOICES],
+            help='Tipo de periodo a regenerar (se puede repetir)'
+        )
+
+    def handle(self, *args, **options):
+        period_types = options['period_types']
+
+        self.stdout.write('Regenerando rankings por periodo...')
+        for period_type, period_key in current_periods():
+            if period_types and period_type not in period_types:
+                continue
+            snapshot = refresh_snapshot(period_type, period_key)
+            self.stdout.write(f'  - {period_type} {period_key}: {snapshot.total_users} usuarios')
+
+        self.stdout.write(self.style.SUCCESS('\n✓ Rankings actualizados'))
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0002_remove_achievement_icon'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AchievementJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('events', models.IntegerField(default=0, verbose_name='Eventos')),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('processing', 'Procesando'), ('failed', 'Fallido')], default='pending', max_length=10, verbose_name='Estado')),
+                ('attempts', models.IntegerField(default=0, verbose_name='Intentos')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Iniciado el')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='Último error')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='achievement_jobs', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Evaluación de Logros',
+                'verbose_name_plural': 'Evaluaciones de Logros',
+                'db_table': 'achievement_jobs',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='achievement_status_694ba8_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('user',), name='unique_pending_achievement_job')],
+            },
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0003_achievementjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Season',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('name', models.CharField(max_length=100, verbose_name='Nombre')),
+                ('start_date', models.DateField(verbose_name='Inicio')),
+                ('end_date', models.DateField(verbose_name='Fin')),
+            ],
+            options={
+                'verbose_name': 'Temporada',
+                'verbose_name_plural': 'Temporadas',
+                'db_table': 'seasons',
+                'ordering': ['-start_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='LeaderboardSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('period_type', models.CharField(choices=[('week', 'Semanal'), ('month', 'Mensual'), ('season', 'Temporada')], max_length=10, verbose_name='Tipo de periodo')),
+                ('period_key', models.CharField(max_length=20, verbose_name='Periodo')),
+                ('refreshed_at', models.DateTimeField(verbose_name='Actualizado el')),
+                ('total_users', models.IntegerField(default=0, verbose_name='Usuarios')),
+            ],
+            options={
+                'verbose_name': 'Ranking por Periodo',
+                'verbose_name_plural': 'Rankings por Periodo',
+                'db_table': 'leaderboard_snapshots',
+                'constraints': [models.UniqueConstraint(fields=('period_type', 'period_key'), name='unique_leaderboard_snapshot')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LeaderboardSnapshotEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.IntegerField(verbose_name='Posición')),
+                ('points', models.IntegerField(verbose_name='Puntos')),
+                ('snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entries', to='social.leaderboardsnapshot', verbose_name='Ranking')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Posición en Ranking',
+                'verbose_name_plural': 'Posiciones en Ranking',
+                'db_table': 'leaderboard_snapshot_entries',
+                'indexes': [models.Index(fields=['snapshot', 'rank'], name='leaderboard_snapsho_29eeba_idx')],
+                'constraints': [models.UniqueConstraint(fields=('snapshot', 'user'), name='unique_leaderboard_snapshot_user')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PeriodPoints',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('period_type', models.CharField(choices=[('week', 'Semanal'), ('month', 'Mensual'), ('season', 'Temporada')], max_length=10, verbose_name='Tipo de periodo')),
+                ('period_key', models.CharField(max_length=20, verbose_name='Periodo')),
+                ('points', models.IntegerField(default=0, verbose_name='Puntos')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='period_points', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Puntos por Periodo',
+                'verbose_name_plural': 'Puntos por Periodo',
+                'db_table': 'period_points',
+                'indexes': [models.Index(fields=['period_type', 'period_key', '-points'], name='period_poin_period__884ee1_idx')],
+                'constraints': [models.UniqueConstraint(fields=('period_type', 'period_key', 'user'), name='unique_period_points')],
+            },
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def create_friend_edges(apps, schema_editor):
+    # Una fila por sentido de cada amistad ya aceptada
+    Friendship = apps.get_model('social', 'Friendship')
+    FriendEdge = apps.get_model('social', 'FriendEdge')
+
+    accepted = Friendship.objects.filter(status='accepted')
+    edges = []
+    for friendship_id, from_user_id, to_user_id in accepted.values_list(
+        'id', 'from_user_id', 'to_user_id'
+    ).iterator():
+        for user_id, friend_id in ((from_user_id, to_user_id), (to_user_id, from_user_id)):
+            edges.append(FriendEdge(user_id=user_id, friend_id=friend_id, friendship_id=friendship_id))
+    FriendEdge.objects.bulk_create(edges, batch_size=1000, ignore_conflicts=True)
+
+    # Fechadas al aceptarse la amistad, para ordenar la lista de amigos
+    accepted_at = accepted.filter(pk=OuterRef('friendship_id')).values('accepted_at')
+    FriendEdge.objects.update(created_at=Coalesce(Subquery(accepted_at), 'created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0004_period_leaderboards'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FriendEdge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('friend', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Amigo')),
+                ('friendship', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='edges', to='social.friendship', verbose_name='Amistad')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='friend_edges', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Relación de Amistad',
+                'verbose_name_plural': 'Relaciones de Amistad',
+                'db_table': 'friend_edges',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at'], name='friend_edge_user_id_fa3bc8_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'friend'), name='unique_friend_edge')],
+            },
+        ),
+        migrations.RunPython(create_friend_edges, migrations.RunPython.noop),
+    ]
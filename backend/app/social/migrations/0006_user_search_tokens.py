@@ -0,0 +1,81 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:10
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Copia de app.social.search al crear la migración: si el tokenizador
+# cambia, el índice se regenera con `python manage.py rebuild_search_index`
+MIN_TOKEN_LENGTH = 2
+MAX_TERM_LENGTH = 30
+WORD_SEPARATOR = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize(text):
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def split_words(text):
+    return [word[:MAX_TERM_LENGTH] for word in WORD_SEPARATOR.split(normalize(text)) if word]
+
+
+def user_tokens(username, first_name, last_name):
+    tokens = set()
+    for value in (username, first_name, last_name):
+        for word in split_words(value):
+            for offset in range(len(word) - MIN_TOKEN_LENGTH + 1):
+                tokens.add((word[offset:], offset, len(word)))
+            if len(word) < MIN_TOKEN_LENGTH:
+                tokens.add((word, 0, len(word)))
+    return tokens
+
+
+def index_existing_users(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    UserSearchToken = apps.get_model('social', 'UserSearchToken')
+
+    batch = []
+    for user_id, *names in User.objects.values_list(
+        'id', 'username', 'first_name', 'last_name'
+    ).iterator():
+        batch += [
+            UserSearchToken(user_id=user_id, token=token, offset=offset, term_length=term_length)
+            for token, offset, term_length in user_tokens(*names)
+        ]
+        if len(batch) >= 5000:
+            UserSearchToken.objects.bulk_create(batch, batch_size=1000)
+            batch = []
+    UserSearchToken.objects.bulk_create(batch, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0005_friend_edges'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=30, verbose_name='Token')),
+                ('offset', models.PositiveSmallIntegerField(verbose_name='Posición en la palabra')),
+                ('term_length', models.PositiveSmallIntegerField(verbose_name='Largo de la palabra')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Token de Búsqueda',
+                'verbose_name_plural': 'Tokens de Búsqueda',
+                'db_table': 'user_search_tokens',
+                'indexes': [models.Index(fields=['token', 'offset', 'term_length', 'user'], name='user_search_token_idx')],
+            },
+        ),
+        migrations.RunPython(index_existing_users, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0006_user_search_tokens'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='friendship',
+            index=models.Index(fields=['from_user', 'updated_at', 'id'], name='friendships_from_us_84d5ec_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='friendship',
+            index=models.Index(fields=['to_user', 'updated_at', 'id'], name='friendships_to_user_9011af_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userachievement',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='user_achiev_user_id_3f52ec_idx'),
+        ),
+    ]
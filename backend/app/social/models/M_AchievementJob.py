@@ -0,0 +1,75 @@
+from django.db import models
+from django.contrib.auth.models import User
+from core.models import M_BaseModel
+
+
+class AchievementJob(M_BaseModel):
+    """
+    Evaluación de logros pendiente para un usuario.
+    Hay como máximo un trabajo pendiente por usuario: los eventos nuevos
+    se combinan en `events` (máscara de bits de app.social.achievements).
+    """
+    STATUS_PENDING = 'pending'
+    STATUS_PROCESSING = 'processing'
+    STATUS_FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pendiente'),
+        (STATUS_PROCESSING, 'Procesando'),
+        (STATUS_FAILED, 'Fallido'),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='achievement_jobs',
+        verbose_name='Usuario'
+    )
+
+    events = models.IntegerField(
+        default=0,
+        verbose_name='Eventos'
+    )
+
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name='Estado'
+    )
+
+    attempts = models.IntegerField(
+        default=0,
+        verbose_name='Intentos'
+    )
+
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Iniciado el'
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        default='',
+        verbose_name='Último error'
+    )
+
+    class Meta:
+        db_table = 'achievement_jobs'
+        verbose_name = 'Evaluación de Logros'
+        verbose_name_plural = 'Evaluaciones de Logros'
+        ordering = ['created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=models.Q(status='pending'),
+                name='unique_pending_achievement_job'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.events} ({self.status})"
@@ -0,0 +1,52 @@
+from django.db import models
+from django.contrib.auth.models import User
+from core.models import M_BaseModel
+from .M_Friendship import Friendship
+
+
+class FriendEdge(M_BaseModel):
+    """
+    Amistad aceptada vista desde cada usuario: una fila (user, friend) por
+    sentido. Los amigos de un usuario salen de un rango del índice único
+    (user, friend) sin combinar ambos lados de Friendship con OR.
+    Se mantiene desde Friendship.save y Friendship.delete.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='friend_edges',
+        verbose_name='Usuario'
+    )
+
+    friend = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Amigo'
+    )
+
+    friendship = models.ForeignKey(
+        Friendship,
+        on_delete=models.CASCADE,
+        related_name='edges',
+        verbose_name='Amistad'
+    )
+
+    class Meta:
+        db_table = 'friend_edges'
+        verbose_name = 'Relación de Amistad'
+        verbose_name_plural = 'Relaciones de Amistad'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'friend'],
+                name='unique_friend_edge'
+            ),
+        ]
+        indexes = [
+            # Lista de amigos, la más reciente primero
+            models.Index(fields=['user', '-created_at']),
+        ]
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.user_id} <-> {self.friend_id}"
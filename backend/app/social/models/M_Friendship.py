@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from core.models import M_BaseModel
 
@@ -43,10 +43,61 @@ class Friendship(M_BaseModel):
         verbose_name_plural = 'Amistades'
         unique_together = ['from_user', 'to_user']
         ordering = ['-created_at']
+        indexes = [
+            # Sincronización incremental (app.sync), un índice por lado
+            models.Index(fields=['from_user', 'updated_at', 'id']),
+            models.Index(fields=['to_user', 'updated_at', 'id']),
+        ]
     
     def __str__(self):
         return f"{self.from_user.username} -> {self.to_user.username} ({self.status})"
     
+    def save(self, *args, **kwargs):
+        from app.social.friends import invalidate_friend_ids, sync_friend_edges
+        from app.sync.sync import COLLECTION_FRIENDSHIPS, record_changes
+        from app.users.stats import track_friendship_change
+        
+        is_accepted = self.status == 'accepted'
+        with transaction.atomic():
+            # Estado anterior leído con la fila bloqueada: dos aceptaciones
+            # concurrentes no pueden sumar dos veces la misma amistad
+            was_accepted = False
+            if self.pk is not None:
+                was_accepted = Friendship.objects.select_for_update().filter(
+                    pk=self.pk, status='accepted'
+                ).exists()
+            
+            super().save(*args, **kwargs)
+            if was_accepted != is_accepted:
+                sync_friend_edges(self, is_accepted)
+            # Mantener friend_count de ambos usuarios
+            track_friendship_change(
+                self.from_user_id,
+                self.to_user_id,
+                was_accepted,
+                is_accepted
+            )
+            invalidate_friend_ids(self.from_user_id, self.to_user_id)
+            record_changes(COLLECTION_FRIENDSHIPS, [(self.from_user_id, self.pk), (self.to_user_id, self.pk)])
+    
+    def delete(self, *args, **kwargs):
+        from app.social.friends import invalidate_friend_ids, sync_friend_edges
+        from app.sync.sync import COLLECTION_FRIENDSHIPS, record_deletion
+        from app.users.stats import track_friendship_change
+        
+        with transaction.atomic():
+            was_accepted = Friendship.objects.select_for_update().filter(
+                pk=self.pk, status='accepted'
+            ).exists()
+            if was_accepted:
+                sync_friend_edges(self, False)
+            # Avisar a ambos usuarios en su próxima sincronización
+            record_deletion(COLLECTION_FRIENDSHIPS, self.pk, [self.from_user_id, self.to_user_id])
+            result = super().delete(*args, **kwargs)
+            track_friendship_change(self.from_user_id, self.to_user_id, was_accepted, False)
+            invalidate_friend_ids(self.from_user_id, self.to_user_id)
+        return result
+    
     def accept(self):
 
         from django.utils import timezone
@@ -61,23 +112,14 @@ class Friendship(M_BaseModel):
     
     @classmethod
     def are_friends(cls, user1, user2):
-        return cls.objects.filter(
-            models.Q(from_user=user1, to_user=user2, status='accepted') |
-            models.Q(from_user=user2, to_user=user1, status='accepted')
-        ).exists()
+        from app.social.friends import get_friend_ids
+        return user2.id in get_friend_ids(user1.id)
+    
+    @classmethod
+    def get_friend_ids(cls, user):
+        from app.social.friends import get_friend_ids
+        return get_friend_ids(user.id)
     
     @classmethod
     def get_friends(cls, user):
-        friendships = cls.objects.filter(
-            models.Q(from_user=user, status='accepted') |
-            models.Q(to_user=user, status='accepted')
-        )
-        
-        friend_ids = []
-        for friendship in friendships:
-            if friendship.from_user == user:
-                friend_ids.append(friendship.to_user.id)
-            else:
-                friend_ids.append(friendship.from_user.id)
-        
-        return User.objects.filter(id__in=friend_ids)
+        return User.objects.filter(id__in=cls.get_friend_ids(user))
@@ -0,0 +1,79 @@
+from django.db import models
+from django.contrib.auth.models import User
+from core.models import M_BaseModel
+from .M_PeriodPoints import PeriodPoints
+
+
+class LeaderboardSnapshot(M_BaseModel):
+    """Ranking precalculado de un periodo, servido hasta que vence."""
+    period_type = models.CharField(
+        max_length=10,
+        choices=PeriodPoints.PERIOD_CHOICES,
+        verbose_name='Tipo de periodo'
+    )
+    
+    period_key = models.CharField(
+        max_length=20,
+        verbose_name='Periodo'
+    )
+    
+    refreshed_at = models.DateTimeField(
+        verbose_name='Actualizado el'
+    )
+    
+    total_users = models.IntegerField(
+        default=0,
+        verbose_name='Usuarios'
+    )
+    
+    class Meta:
+        db_table = 'leaderboard_snapshots'
+        verbose_name = 'Ranking por Periodo'
+        verbose_name_plural = 'Rankings por Periodo'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['period_type', 'period_key'],
+                name='unique_leaderboard_snapshot'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.period_type} {self.period_key} ({self.refreshed_at})"
+
+
+class LeaderboardSnapshotEntry(models.Model):
+    snapshot = models.ForeignKey(
+        LeaderboardSnapshot,
+        on_delete=models.CASCADE,
+        related_name='entries',
+        verbose_name='Ranking'
+    )
+    
+    rank = models.IntegerField(
+        verbose_name='Posición'
+    )
+    
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Usuario'
+    )
+    
+    points = models.IntegerField(
+        verbose_name='Puntos'
+    )
+    
+    class Meta:
+        db_table = 'leaderboard_snapshot_entries'
+        verbose_name = 'Posición en Ranking'
+        verbose_name_plural = 'Posiciones en Ranking'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['snapshot', 'user'],
+                name='unique_leaderboard_snapshot_user'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['snapshot', 'rank']),
+        ]
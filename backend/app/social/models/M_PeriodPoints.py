@@ -0,0 +1,61 @@
+from django.db import models
+from django.contrib.auth.models import User
+from core.models import M_BaseModel
+
+
+class PeriodPoints(M_BaseModel):
+    """
+    Puntos ganados por un usuario en un periodo (semana, mes o temporada).
+    Se incrementa con UPDATE atómicos al otorgar puntos;
+    ver app.social.period_leaderboards.
+    """
+    PERIOD_WEEK = 'week'
+    PERIOD_MONTH = 'month'
+    PERIOD_SEASON = 'season'
+    
+    PERIOD_CHOICES = [
+        (PERIOD_WEEK, 'Semanal'),
+        (PERIOD_MONTH, 'Mensual'),
+        (PERIOD_SEASON, 'Temporada'),
+    ]
+    
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='period_points',
+        verbose_name='Usuario'
+    )
+    
+    period_type = models.CharField(
+        max_length=10,
+        choices=PERIOD_CHOICES,
+        verbose_name='Tipo de periodo'
+    )
+    
+    # '2026-W42', '2026-10' o el id de la temporada
+    period_key = models.CharField(
+        max_length=20,
+        verbose_name='Periodo'
+    )
+    
+    points = models.IntegerField(
+        default=0,
+        verbose_name='Puntos'
+    )
+    
+    class Meta:
+        db_table = 'period_points'
+        verbose_name = 'Puntos por Periodo'
+        verbose_name_plural = 'Puntos por Periodo'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['period_type', 'period_key', 'user'],
+                name='unique_period_points'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['period_type', 'period_key', '-points']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user_id} - {self.period_type} {self.period_key}: {self.points}"
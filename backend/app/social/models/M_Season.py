@@ -0,0 +1,27 @@
+from django.db import models
+from core.models import M_BaseModel
+
+
+class Season(M_BaseModel):
+    """Temporada con su propio leaderboard (puntos ganados entre start_date y end_date)."""
+    name = models.CharField(
+        max_length=100,
+        verbose_name='Nombre'
+    )
+    
+    start_date = models.DateField(
+        verbose_name='Inicio'
+    )
+    
+    end_date = models.DateField(
+        verbose_name='Fin'
+    )
+    
+    class Meta:
+        db_table = 'seasons'
+        verbose_name = 'Temporada'
+        verbose_name_plural = 'Temporadas'
+        ordering = ['-start_date']
+    
+    def __str__(self):
+        return f"{self.name} ({self.start_date} - {self.end_date})"
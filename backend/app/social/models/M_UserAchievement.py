@@ -1,5 +1,6 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
+from core.cache import bump_user_version
 from core.models import M_BaseModel
 from .M_Achievement import Achievement
 
@@ -41,11 +42,24 @@ class UserAchievement(M_BaseModel):
         verbose_name_plural = 'Logros de Usuarios'
         unique_together = ['user', 'achievement']
         ordering = ['-unlocked_at', '-created_at']
+        indexes = [
+            # Sincronización incremental (app.sync)
+            models.Index(fields=['user', 'updated_at', 'id']),
+        ]
     
     def __str__(self):
         status = "✅" if self.is_unlocked else f"{self.progress}%"
         return f"{self.user.username} - {self.achievement.name} ({status})"
     
+    def save(self, *args, **kwargs):
+        from app.sync.sync import COLLECTION_ACHIEVEMENTS, record_changes
+        
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            record_changes(COLLECTION_ACHIEVEMENTS, [(self.user_id, self.pk)])
+        # Progreso o desbloqueo cambiaron
+        bump_user_version(self.user_id)
+    
     def unlock(self):
         from django.utils import timezone
         
@@ -58,73 +72,22 @@ class UserAchievement(M_BaseModel):
             # Otorgar puntos al perfil del usuario
             try:
                 profile = self.user.profile
-                profile.add_points(self.achievement.points)
+                profile.add_points(self.achievement.points, 'achievement', self.achievement)
             except:
                 pass
     
     @classmethod
-    def check_and_unlock_achievements(cls, user):
-        from app.meals.models import M_Meal
-        from app.transport.models import M_Transport
+    def check_and_unlock_achievements(cls, user, event=None):
+        """
+        Evalúa los logros del usuario afectados por `event` (todos si es None).
+        Ver app.social.achievements para los eventos disponibles.
+        """
+        from app.social.achievements import ALL_EVENTS, AchievementEvaluator
+        from app.users.models import M_UserProfile
         
         try:
-            profile = user.profile
-        except:
-            return
+            evaluator = AchievementEvaluator(user)
+        except M_UserProfile.DoesNotExist:
+            return []
         
-        # Obtener todos los logros activos
-        achievements = Achievement.objects.filter(is_active=True)
-        
-        for achievement in achievements:
-            # Verificar si ya está desbloqueado
-            user_achievement, created = cls.objects.get_or_create(
-                user=user,
-                achievement=achievement
-            )
-            
-            if user_achievement.is_unlocked:
-                continue
-            
-            # Calcular progreso según el tipo de requisito
-            current_value = 0
-            
-            if achievement.requirement_type == 'meal_count':
-                current_value = M_Meal.objects.filter(user=user).count()
-            
-            elif achievement.requirement_type == 'vegan_meal_count':
-                current_value = M_Meal.objects.filter(user=user, is_vegan=True).count()
-            
-            elif achievement.requirement_type == 'vegetarian_meal_count':
-                current_value = M_Meal.objects.filter(user=user, is_vegetarian=True).count()
-            
-            elif achievement.requirement_type == 'transport_count':
-                current_value = M_Transport.objects.filter(user=user).count()
-            
-            elif achievement.requirement_type == 'eco_transport_count':
-                eco_types = ['bicycle', 'walk', 'electric_bike', 'electric_scooter']
-                current_value = M_Transport.objects.filter(
-                    user=user,
-                    transport_type__in=eco_types
-                ).count()
-            
-            elif achievement.requirement_type == 'co2_saved':
-                current_value = int(profile.total_co2_saved)
-            
-            elif achievement.requirement_type == 'daily_streak':
-                current_value = profile.streak_days
-            
-            elif achievement.requirement_type == 'friend_count':
-                from .M_Friendship import Friendship
-                current_value = Friendship.get_friends(user).count()
-            
-            elif achievement.requirement_type == 'level_reached':
-                current_value = profile.level
-            
-            # Calcular progreso
-            progress = min(100, int((current_value / achievement.requirement_value) * 100))
-            user_achievement.progress = progress
-            user_achievement.save()
-            
-            # Desbloquear si se alcanzó el requisito
-            if current_value >= achievement.requirement_value:
-                user_achievement.unlock()
+        return evaluator.evaluate(event or ALL_EVENTS)
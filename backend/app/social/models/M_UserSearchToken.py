@@ -0,0 +1,43 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class UserSearchToken(models.Model):
+    """
+    Sufijo normalizado de una palabra del usuario (nombre de usuario,
+    nombre o apellido); ver app.social.search.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='search_tokens',
+        verbose_name='Usuario'
+    )
+    
+    token = models.CharField(
+        max_length=30,
+        verbose_name='Token'
+    )
+    
+    offset = models.PositiveSmallIntegerField(
+        verbose_name='Posición en la palabra'
+    )
+    
+    term_length = models.PositiveSmallIntegerField(
+        verbose_name='Largo de la palabra'
+    )
+    
+    class Meta:
+        db_table = 'user_search_tokens'
+        verbose_name = 'Token de Búsqueda'
+        verbose_name_plural = 'Tokens de Búsqueda'
+        indexes = [
+            # Cubre la búsqueda por rango de prefijo sin leer la tabla
+            models.Index(
+                fields=['token', 'offset', 'term_length', 'user'],
+                name='user_search_token_idx'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.token} ({self.user_id})"
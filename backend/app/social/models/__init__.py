@@ -1,5 +1,15 @@
 from .M_Friendship import Friendship
+from .M_FriendEdge import FriendEdge
 from .M_Achievement import Achievement
 from .M_UserAchievement import UserAchievement
+from .M_AchievementJob import AchievementJob
+from .M_Season import Season
+from .M_PeriodPoints import PeriodPoints
+from .M_LeaderboardSnapshot import LeaderboardSnapshot, LeaderboardSnapshotEntry
+from .M_UserSearchToken import UserSearchToken
 
-__all__ = ['Friendship', 'Achievement', 'UserAchievement']
+__all__ = [
+    'Friendship', 'FriendEdge', 'Achievement', 'UserAchievement', 'AchievementJob',
+    'Season', 'PeriodPoints', 'LeaderboardSnapshot', 'LeaderboardSnapshotEntry',
+    'UserSearchToken',
+]
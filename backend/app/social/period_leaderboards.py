@@ -0,0 +1,182 @@
+"""
+Leaderboards por periodo (semana, mes y temporada).
+Los puntos otorgados se suman a PeriodPoints de cada periodo vigente con
+UPDATE atómicos; los rankings se sirven desde snapshots precalculados que
+regenera `python manage.py refresh_leaderboards` (programado cada
+REFRESH_INTERVAL). Las lecturas nunca regeneran: un periodo sin snapshot
+todavía se ordena en vivo sobre el índice (periodo, -points).
+"""
+from collections import defaultdict
+from datetime import timedelta
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from .models import LeaderboardSnapshot, LeaderboardSnapshotEntry, PeriodPoints, Season
+
+
+# Cada cuánto debe programarse refresh_leaderboards
+REFRESH_INTERVAL = timedelta(minutes=5)
+SNAPSHOT_BATCH_SIZE = 1000
+
+
+def week_key(day):
+    year, week, _ = day.isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def month_key(day):
+    return f'{day.year}-{day.month:02d}'
+
+
+def period_key_for(period_type, day):
+    if period_type == PeriodPoints.PERIOD_WEEK:
+        return week_key(day)
+    if period_type == PeriodPoints.PERIOD_MONTH:
+        return month_key(day)
+    raise ValueError(f'Periodo desconocido: {period_type}')
+
+
+def current_season(day=None):
+    day = day or timezone.localdate()
+    return Season.objects.filter(
+        is_active=True,
+        start_date__lte=day,
+        end_date__gte=day
+    ).order_by('start_date').first()
+
+
+def periods_for(day):
+    """Periodos (tipo, llave) en los que cuentan los puntos ganados el día `day`."""
+    periods = [
+        (PeriodPoints.PERIOD_WEEK, week_key(day)),
+        (PeriodPoints.PERIOD_MONTH, month_key(day)),
+    ]
+    seasons = Season.objects.filter(
+        is_active=True,
+        start_date__lte=day,
+        end_date__gte=day
+    ).values_list('id', flat=True)
+    periods += [(PeriodPoints.PERIOD_SEASON, str(season_id)) for season_id in seasons]
+    return periods
+
+
+def _period_row(user_id, period_type, period_key, points):
+    return PeriodPoints(user_id=user_id, period_type=period_type, period_key=period_key, points=points)
+
+
+def add_period_points(points_by_user, day=None):
+    """
+    Suma puntos a los periodos vigentes del día `day` (hoy si no se indica).
+
+    Args:
+        points_by_user: Dict {user_id: puntos}
+    """
+    points_by_user = {user_id: points for user_id, points in points_by_user.items() if points}
+    if not points_by_user:
+        return
+
+    for period_type, period_key in periods_for(day or timezone.localdate()):
+        rows = PeriodPoints.objects.filter(period_type=period_type, period_key=period_key)
+        existing = set(rows.filter(user_id__in=points_by_user).values_list('user_id', flat=True))
+        missing = [user_id for user_id in points_by_user if user_id not in existing]
+        if missing:
+            try:
+                with transaction.atomic():
+                    PeriodPoints.objects.bulk_create([
+                        _period_row(user_id, period_type, period_key, points_by_user[user_id])
+                        for user_id in missing
+                    ])
+            except IntegrityError:
+                # Otra petición creó alguna de las filas y el lote completo se
+                # revirtió: insertar de a una y sumar sobre las que ya existen
+                for user_id in missing:
+                    try:
+                        with transaction.atomic():
+                            _period_row(user_id, period_type, period_key, points_by_user[user_id]).save()
+                    except IntegrityError:
+                        existing.add(user_id)
+
+        # Un UPDATE por cada valor distinto de puntos
+        by_points = defaultdict(list)
+        for user_id in existing:
+            by_points[points_by_user[user_id]].append(user_id)
+        for points, user_ids in by_points.items():
+            rows.filter(user_id__in=user_ids).update(
+                points=F('points') + points,
+                updated_at=timezone.now()
+            )
+
+
+def refresh_snapshot(period_type, period_key):
+    """Regenera el ranking precalculado de un periodo."""
+    now = timezone.now()
+    ranking = PeriodPoints.objects.filter(
+        period_type=period_type,
+        period_key=period_key,
+        points__gt=0
+    ).order_by('-points', 'user_id').values_list('user_id', 'points')
+
+    with transaction.atomic():
+        snapshot, _ = LeaderboardSnapshot.objects.select_for_update().get_or_create(
+            period_type=period_type,
+            period_key=period_key,
+            defaults={'refreshed_at': now}
+        )
+        snapshot.entries.all().delete()
+
+        total_users = 0
+        batch = []
+        for rank, (user_id, points) in enumerate(ranking.iterator(chunk_size=SNAPSHOT_BATCH_SIZE), start=1):
+            batch.append(LeaderboardSnapshotEntry(
+                snapshot=snapshot,
+                rank=rank,
+                user_id=user_id,
+                points=points
+            ))
+            total_users = rank
+            if len(batch) >= SNAPSHOT_BATCH_SIZE:
+                LeaderboardSnapshotEntry.objects.bulk_create(batch)
+                batch = []
+        LeaderboardSnapshotEntry.objects.bulk_create(batch)
+
+        snapshot.refreshed_at = now
+        snapshot.total_users = total_users
+        snapshot.save(update_fields=['refreshed_at', 'total_users', 'updated_at'])
+    return snapshot
+
+
+def get_snapshot(period_type, period_key):
+    """Snapshot del periodo o None si todavía no se generó (solo lectura)."""
+    return LeaderboardSnapshot.objects.filter(
+        period_type=period_type,
+        period_key=period_key
+    ).first()
+
+
+def live_ranking(period_type, period_key):
+    """Puntos del periodo en el orden del snapshot, para cuando aún no existe."""
+    return PeriodPoints.objects.filter(
+        period_type=period_type,
+        period_key=period_key,
+        points__gt=0
+    ).order_by('-points', 'user_id')
+
+
+def live_rank(period_type, period_key, user_id):
+    """
+    Posición en vivo del usuario.
+
+    Returns:
+        Dict con rank y points, o None si no tiene puntos en el periodo
+    """
+    ranking = live_ranking(period_type, period_key)
+    points = ranking.filter(user_id=user_id).values_list('points', flat=True).first()
+    if points is None:
+        return None
+    ahead = ranking.filter(Q(points__gt=points) | Q(points=points, user_id__lt=user_id)).count()
+    return {'rank': ahead + 1, 'points': points}
+
+
+def current_periods():
+    """Periodos que hoy reciben puntos, para regenerarlos en bloque."""
+    return periods_for(timezone.localdate())
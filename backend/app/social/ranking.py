@@ -0,0 +1,133 @@
+"""
+Índice de ranking global en memoria.
+Mantiene las claves de orden de todos los perfiles en una lista ordenada:
+la posición, los vecinos y el percentil de un usuario salen de una
+búsqueda binaria. Se actualiza al guardar un perfil en este proceso y se
+reconstruye cada REBUILD_SECONDS para incorporar cambios de otros procesos
+y actualizaciones masivas (UPDATE con F()).
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+
+
+# Antigüedad máxima del índice antes de reconstruirlo desde la base de datos
+REBUILD_SECONDS = 60
+NEIGHBOURS = 2
+
+
+def rank_key(user_id, total_points, level, total_co2_saved):
+    """Clave de orden: puntos, nivel y CO2 ahorrado descendentes; el id desempata."""
+    return (-total_points, -level, -total_co2_saved, user_id)
+
+
+class RankIndex:
+
+    def __init__(self, rebuild_seconds=REBUILD_SECONDS):
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.RLock()
+        self._keys = []
+        self._key_by_user = {}
+        self._built_at = None
+
+    def rebuild(self):
+        from app.users.models import M_UserProfile
+
+        rows = M_UserProfile.objects.values_list(
+            'user_id', 'total_points', 'level', 'total_co2_saved'
+        )
+        key_by_user = {row[0]: rank_key(*row) for row in rows.iterator(chunk_size=5000)}
+        keys = sorted(key_by_user.values())
+        with self._lock:
+            self._keys = keys
+            self._key_by_user = key_by_user
+            self._built_at = time.monotonic()
+
+    def invalidate(self):
+        with self._lock:
+            self._built_at = None
+
+    def _is_stale(self):
+        built_at = self._built_at
+        return built_at is None or time.monotonic() - built_at > self.rebuild_seconds
+
+    def _ensure_fresh(self):
+        # Doble verificación: solo el primer hilo que encuentra el índice
+        # vencido lo reconstruye; los demás esperan y usan el resultado
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self.rebuild()
+
+    def update(self, user_id, total_points, level, total_co2_saved):
+        """Reubica a un usuario tras cambiar sus puntos, nivel o CO2."""
+        with self._lock:
+            if self._built_at is None:
+                # Sin índice todavía: la primera consulta lo construye completo
+                return
+            self._discard(user_id)
+            key = rank_key(user_id, total_points, level, total_co2_saved)
+            insort(self._keys, key)
+            self._key_by_user[user_id] = key
+
+    def update_points(self, user_id, total_points, level):
+        """Reubica a un usuario tras sumar puntos, conservando su CO2 ahorrado."""
+        with self._lock:
+            key = self._key_by_user.get(user_id)
+            if key is not None:
+                self.update(user_id, total_points, level, -key[2])
+
+    def remove(self, user_id):
+        with self._lock:
+            self._discard(user_id)
+
+    def _discard(self, user_id):
+        key = self._key_by_user.pop(user_id, None)
+        if key is not None:
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    def size(self):
+        self._ensure_fresh()
+        return len(self._keys)
+
+    def rank(self, user_id):
+        """Posición (desde 1) del usuario, o None si no tiene perfil."""
+        self._ensure_fresh()
+        with self._lock:
+            key = self._key_by_user.get(user_id)
+            if key is None:
+                return None
+            return bisect_left(self._keys, key) + 1
+
+    def percentile(self, user_id):
+        """Porcentaje de usuarios que quedan por debajo del usuario."""
+        self._ensure_fresh()
+        with self._lock:
+            key = self._key_by_user.get(user_id)
+            if key is None:
+                return None
+            total = len(self._keys)
+            below = total - bisect_left(self._keys, key) - 1
+            return round(below / total * 100, 1)
+
+    def neighbours(self, user_id, count=NEIGHBOURS):
+        """
+        Usuarios alrededor del usuario, él incluido.
+
+        Returns:
+            Lista de (posición, user_id) ordenada por posición
+        """
+        self._ensure_fresh()
+        with self._lock:
+            key = self._key_by_user.get(user_id)
+            if key is None:
+                return []
+            position = bisect_left(self._keys, key)
+            start = max(0, position - count)
+            window = self._keys[start:position + count + 1]
+            return [(start + offset + 1, key[-1]) for offset, key in enumerate(window)]
+
+
+rank_index = RankIndex()
@@ -0,0 +1,171 @@
+"""
+Búsqueda de usuarios por nombre de usuario, nombre o apellido.
+Cada palabra se normaliza (minúsculas, sin acentos; las letras no
+latinas se conservan) y se guardan todos
+sus sufijos en UserSearchToken: buscar el inicio de un sufijo es un rango
+sobre el índice de `token` que encuentra tanto prefijos como palabras que
+contienen el texto. Los resultados se ordenan por coincidencia exacta,
+luego prefijo y luego infijo. El índice se actualiza al guardar el
+usuario (app.social.signals) o con `python manage.py rebuild_search_index`.
+"""
+import re
+import unicodedata
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Max, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+
+# Campos de User que se indexan
+SEARCH_FIELDS = ('username', 'first_name', 'last_name')
+
+# Los sufijos más cortos no se guardan: palabras de una letra solo buscan por prefijo
+MIN_TOKEN_LENGTH = 2
+MAX_TERM_LENGTH = 30
+MAX_QUERY_WORDS = 3
+SEARCH_LIMIT = 10
+
+RANK_EXACT = 3
+RANK_PREFIX = 2
+RANK_INFIX = 1
+
+# Mayor que cualquier carácter de un token: cierra el rango de prefijo
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
+
+# Todo lo que no es letra o número separa palabras (también '_' y '.')
+_WORD_SEPARATOR = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize(text):
+    """Minúsculas sin acentos: 'José Pérez' -> 'jose perez', 'Йоханна' -> 'иоханна'."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def split_words(text):
+    """Palabras normalizadas, truncadas a MAX_TERM_LENGTH como en el índice."""
+    return [word[:MAX_TERM_LENGTH] for word in _WORD_SEPARATOR.split(normalize(text)) if word]
+
+
+def user_tokens(username, first_name, last_name):
+    """
+    Tokens de búsqueda de un usuario.
+
+    Returns:
+        Set de (sufijo, posición en la palabra, largo de la palabra)
+    """
+    tokens = set()
+    for value in (username, first_name, last_name):
+        for word in split_words(value):
+            for offset in range(len(word) - MIN_TOKEN_LENGTH + 1):
+                tokens.add((word[offset:], offset, len(word)))
+            if len(word) < MIN_TOKEN_LENGTH:
+                tokens.add((word, 0, len(word)))
+    return tokens
+
+
+def index_users(users):
+    """Reemplaza los tokens de los usuarios dados (instancias de User)."""
+    from .models import UserSearchToken
+
+    users = list(users)
+    with transaction.atomic(savepoint=False):
+        UserSearchToken.objects.filter(user__in=users).delete()
+        UserSearchToken.objects.bulk_create(
+            [
+                UserSearchToken(user_id=user.id, token=token, offset=offset, term_length=term_length)
+                for user in users
+                for token, offset, term_length in user_tokens(
+                    *(getattr(user, field) for field in SEARCH_FIELDS)
+                )
+            ],
+            batch_size=1000
+        )
+
+
+def _word_rank(word):
+    """Rango de un token para `word`; 0 si el token no coincide con la palabra."""
+    matches = Q(token__gte=word, token__lt=word + PREFIX_UPPER_BOUND)
+    if len(word) < MIN_TOKEN_LENGTH:
+        matches &= Q(offset=0)
+    return Case(
+        When(matches & Q(offset=0, term_length=len(word)), then=Value(RANK_EXACT)),
+        When(matches & Q(offset=0), then=Value(RANK_PREFIX)),
+        When(matches, then=Value(RANK_INFIX)),
+        default=Value(0),
+        output_field=IntegerField()
+    )
+
+
+def search_user_ids(query, exclude_user_id=None, limit=SEARCH_LIMIT):
+    """
+    Usuarios cuyas palabras coinciden con todas las palabras de `query`.
+
+    Returns:
+        Lista de user_id ordenada por relevancia
+    """
+    from .models import UserSearchToken
+
+    words = list(dict.fromkeys(split_words(query)))[:MAX_QUERY_WORDS]
+    if not words:
+        return []
+
+    matches = Q()
+    for word in words:
+        matches |= Q(token__gte=word, token__lt=word + PREFIX_UPPER_BOUND)
+    tokens = UserSearchToken.objects.filter(matches)
+    if exclude_user_id is not None:
+        tokens = tokens.exclude(user_id=exclude_user_id)
+
+    # Mejor coincidencia de cada palabra por usuario; todas deben coincidir
+    ranks = {f'rank_{position}': Max(_word_rank(word)) for position, word in enumerate(words)}
+    score = sum((F(name) for name in ranks), Value(0))
+    rows = tokens.order_by().values('user_id').annotate(**ranks).filter(
+        **{f'{name}__gt': 0 for name in ranks}
+    ).annotate(score=score).order_by('-score', 'user__username')[:limit]
+    return [row['user_id'] for row in rows]
+
+
+def search_users(user, query, limit=SEARCH_LIMIT):
+    """
+    Usuarios encontrados para `query`, en orden de relevancia, con
+    `mutual_friends` y el estado de la amistad con `user` ya anotados.
+    """
+    from django.contrib.auth.models import User
+    from .models import FriendEdge, Friendship
+
+    user_ids = search_user_ids(query, exclude_user_id=user.id, limit=limit)
+    if not user_ids:
+        return []
+
+    my_friends = FriendEdge.objects.filter(user_id=user.id).values('friend_id')
+    mutual = FriendEdge.objects.filter(
+        user_id=OuterRef('id'),
+        friend_id__in=my_friends
+    ).order_by().values('user_id').annotate(count=Count('id')).values('count')
+    sent = Friendship.objects.filter(from_user_id=user.id, to_user_id=OuterRef('id')).values('status')
+    received = Friendship.objects.filter(from_user_id=OuterRef('id'), to_user_id=user.id).values('status')
+
+    users = User.objects.filter(id__in=user_ids).select_related('profile').annotate(
+        mutual_friends=Coalesce(Subquery(mutual), 0),
+        sent_status=Subquery(sent[:1]),
+        received_status=Subquery(received[:1])
+    ).in_bulk()
+
+    results = []
+    for user_id in user_ids:
+        found = users.get(user_id)
+        if found is not None:
+            found.friendship_status = friendship_status(found.sent_status, found.received_status)
+            results.append(found)
+    return results
+
+
+def friendship_status(sent_status, received_status):
+    """'friends', 'request_sent', 'request_received' o None."""
+    if 'accepted' in (sent_status, received_status):
+        return 'friends'
+    if sent_status == 'pending':
+        return 'request_sent'
+    if received_status == 'pending':
+        return 'request_received'
+    return None
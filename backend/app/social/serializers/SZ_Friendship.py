@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from app.social.models import Friendship
+from app.social.models import FriendEdge, Friendship
 
 
 class UserBasicSerializer(serializers.ModelSerializer):
@@ -36,6 +36,23 @@ class UserBasicSerializer(serializers.ModelSerializer):
             return 0
 
 
+class FriendSuggestionSerializer(UserBasicSerializer):
+    """Usuario sugerido con la cantidad de amigos en común"""
+    mutual_friends = serializers.IntegerField(read_only=True)
+    
+    class Meta(UserBasicSerializer.Meta):
+        fields = UserBasicSerializer.Meta.fields + ['mutual_friends']
+
+
+class UserSearchResultSerializer(UserBasicSerializer):
+    """Usuario encontrado con amigos en común y estado de la amistad con el usuario actual"""
+    mutual_friends = serializers.IntegerField(read_only=True)
+    friendship_status = serializers.CharField(read_only=True, allow_null=True)
+    
+    class Meta(UserBasicSerializer.Meta):
+        fields = UserBasicSerializer.Meta.fields + ['mutual_friends', 'friendship_status']
+
+
 class FriendshipSerializer(serializers.ModelSerializer):
     """Serializer completo de amistad"""
     from_user = UserBasicSerializer(read_only=True)
@@ -102,21 +119,11 @@ class FriendRequestSerializer(serializers.ModelSerializer):
 
 
 class FriendListSerializer(serializers.ModelSerializer):
-    """Serializer para listar amigos con información adicional"""
-    friend = serializers.SerializerMethodField()
-    friendship_date = serializers.DateTimeField(source='accepted_at', read_only=True)
+    """Serializer para listar amigos con información adicional (desde FriendEdge)"""
+    id = serializers.IntegerField(source='friendship_id', read_only=True)
+    friend = UserBasicSerializer(read_only=True)
+    friendship_date = serializers.DateTimeField(source='friendship.accepted_at', read_only=True)
     
     class Meta:
-        model = Friendship
+        model = FriendEdge
         fields = ['id', 'friend', 'friendship_date']
-    
-    def get_friend(self, obj):
-        """Retorna el usuario que no es el actual (el amigo)"""
-        request_user = self.context.get('request').user
-        
-        if obj.from_user == request_user:
-            friend = obj.to_user
-        else:
-            friend = obj.from_user
-        
-        return UserBasicSerializer(friend, context=self.context).data
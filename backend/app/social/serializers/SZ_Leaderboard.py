@@ -1,69 +1,44 @@
 from rest_framework import serializers
-from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
 
 
-class LeaderboardEntrySerializer(serializers.ModelSerializer):
+class LeaderboardEntrySerializer(serializers.Serializer):
+    """
+    Fila del leaderboard a partir de un diccionario de
+    app.social.leaderboard.leaderboard_values (más su 'rank').
+    """
+    id = serializers.IntegerField(read_only=True)
     rank = serializers.IntegerField(read_only=True)
     username = serializers.CharField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
     profile_picture = serializers.SerializerMethodField()
-    level = serializers.SerializerMethodField()
-    total_points = serializers.SerializerMethodField()
-    total_co2_saved = serializers.SerializerMethodField()
-    streak_days = serializers.SerializerMethodField()
-    achievements_count = serializers.SerializerMethodField()
+    level = serializers.IntegerField(read_only=True)
+    total_points = serializers.IntegerField(read_only=True)
+    total_co2_saved = serializers.FloatField(read_only=True)
+    streak_days = serializers.IntegerField(read_only=True)
+    achievements_count = serializers.IntegerField(read_only=True)
     
-    class Meta:
-        model = User
-        fields = [
-            'id',
-            'rank',
-            'username',
-            'first_name',
-            'last_name',
-            'profile_picture',
-            'level',
-            'total_points',
-            'total_co2_saved',
-            'streak_days',
-            'achievements_count'
-        ]
-    
-    def get_profile_picture(self, obj):
-        try:
-            if obj.profile.profile_picture:
-                request = self.context.get('request')
-                if request:
-                    return request.build_absolute_uri(obj.profile.profile_picture.url)
-        except:
-            pass
+    def get_profile_picture(self, row):
+        request = self.context.get('request')
+        if row['picture'] and request:
+            return request.build_absolute_uri(default_storage.url(row['picture']))
         return None
+
+
+class PeriodLeaderboardEntrySerializer(serializers.Serializer):
+    """Fila de un leaderboard por periodo (ver app.social.period_leaderboards)."""
+    id = serializers.IntegerField(source='user_id', read_only=True)
+    rank = serializers.IntegerField(read_only=True)
+    username = serializers.CharField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    profile_picture = serializers.SerializerMethodField()
+    level = serializers.IntegerField(read_only=True)
+    points = serializers.IntegerField(read_only=True)
     
-    def get_level(self, obj):
-        try:
-            return obj.profile.level
-        except:
-            return 1
-    
-    def get_total_points(self, obj):
-        try:
-            return obj.profile.total_points
-        except:
-            return 0
-    
-    def get_total_co2_saved(self, obj):
-        try:
-            return float(obj.profile.total_co2_saved)
-        except:
-            return 0.0
-    
-    def get_streak_days(self, obj):
-        try:
-            return obj.profile.streak_days
-        except:
-            return 0
-    
-    def get_achievements_count(self, obj):
-        try:
-            return obj.user_achievements.filter(is_unlocked=True).count()
-        except:
-            return 0
+    def get_profile_picture(self, row):
+        request = self.context.get('request')
+        if row['picture'] and request:
+            return request.build_absolute_uri(default_storage.url(row['picture']))
+        return None
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from app.social.models import UserAchievement
+from app.social.models import Achievement, UserAchievement
 from .SZ_Achievement import AchievementSerializer
 
 
@@ -40,3 +40,33 @@ class UserAchievementListSerializer(serializers.ModelSerializer):
             'unlocked_at'
         ]
         read_only_fields = ['id', 'unlocked_at']
+
+
+class AchievementProgressSerializer(serializers.ModelSerializer):
+    """
+    Mismo formato que UserAchievementListSerializer, a partir de un logro
+    anotado con el progreso guardado del usuario (ver V_AchievementList).
+    `id` es None si el usuario aún no tiene fila para el logro.
+    """
+    id = serializers.IntegerField(source='user_achievement_id', read_only=True)
+    achievement_id = serializers.IntegerField(source='pk', read_only=True)
+    achievement_name = serializers.CharField(source='name', read_only=True)
+    achievement_description = serializers.CharField(source='description', read_only=True)
+    achievement_points = serializers.IntegerField(source='points', read_only=True)
+    progress = serializers.IntegerField(read_only=True)
+    is_unlocked = serializers.BooleanField(read_only=True)
+    unlocked_at = serializers.DateTimeField(read_only=True)
+
+    class Meta:
+        model = Achievement
+        fields = [
+            'id',
+            'achievement_id',
+            'achievement_name',
+            'achievement_description',
+            'achievement_points',
+            'category',
+            'progress',
+            'is_unlocked',
+            'unlocked_at'
+        ]
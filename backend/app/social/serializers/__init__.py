@@ -1,15 +1,30 @@
-from .SZ_Friendship import FriendshipSerializer, FriendRequestSerializer, FriendListSerializer, UserBasicSerializer
+from .SZ_Friendship import (
+    FriendshipSerializer,
+    FriendRequestSerializer,
+    FriendListSerializer,
+    FriendSuggestionSerializer,
+    UserSearchResultSerializer,
+    UserBasicSerializer,
+)
 from .SZ_Achievement import AchievementSerializer
-from .SZ_UserAchievement import UserAchievementSerializer, UserAchievementListSerializer
-from .SZ_Leaderboard import LeaderboardEntrySerializer
+from .SZ_UserAchievement import (
+    UserAchievementSerializer,
+    UserAchievementListSerializer,
+    AchievementProgressSerializer,
+)
+from .SZ_Leaderboard import LeaderboardEntrySerializer, PeriodLeaderboardEntrySerializer
 
 __all__ = [
     'FriendshipSerializer',
     'FriendRequestSerializer',
     'FriendListSerializer',
+    'FriendSuggestionSerializer',
+    'UserSearchResultSerializer',
     'UserBasicSerializer',
     'AchievementSerializer',
     'UserAchievementSerializer',
     'UserAchievementListSerializer',
+    'AchievementProgressSerializer',
     'LeaderboardEntrySerializer',
+    'PeriodLeaderboardEntrySerializer',
 ]
@@ -0,0 +1,43 @@
+"""
+Señales de la app social.
+User es el modelo de Django, así que su índice de búsqueda se mantiene
+desde post_save en lugar de sobrescribir save().
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .search import SEARCH_FIELDS, index_users
+
+
+def _names_saved(update_fields, raw):
+    # Guardados parciales que no tocan los nombres (p. ej. last_login al iniciar sesión)
+    return not raw and (update_fields is None or bool(set(update_fields) & set(SEARCH_FIELDS)))
+
+
+@receiver(post_save, sender=User, dispatch_uid='social_index_user_search')
+def index_user_search(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if _names_saved(update_fields, raw):
+        index_users([instance])
+
+
+@receiver(post_save, sender=User, dispatch_uid='social_sync_friend_names')
+def sync_friend_names(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    # Las amistades sincronizadas llevan el nombre del amigo: la otra parte
+    # tiene que recibirlas de nuevo cuando cambia
+    if created or not _names_saved(update_fields, raw):
+        return
+    from app.sync.sync import COLLECTION_FRIENDSHIPS, record_changes
+    from .models import Friendship
+
+    friendships = Friendship.objects.filter(Q(from_user=instance) | Q(to_user=instance))
+    with transaction.atomic():
+        changes = [
+            (to_user_id if from_user_id == instance.id else from_user_id, friendship_id)
+            for friendship_id, from_user_id, to_user_id in friendships.values_list('id', 'from_user_id', 'to_user_id')
+        ]
+        if changes:
+            friendships.update(updated_at=timezone.now())
+            record_changes(COLLECTION_FRIENDSHIPS, changes)
@@ -0,0 +1,310 @@
+import builtins
+import threading
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from app.users.stats import get_user_stats
+from .friends import fetch_friend_suggestions, get_friend_ids, get_friend_suggestions, invalidate_friend_ids
+from .models import FriendEdge, Friendship, LeaderboardSnapshot, PeriodPoints
+from .period_leaderboards import add_period_points, month_key, refresh_snapshot, week_key
+from .ranking import RankIndex, rank_index
+from .search import MAX_TERM_LENGTH, normalize, search_user_ids, split_words
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class PeriodPointsTests(TestCase):
+
+    def setUp(self):
+        self.day = date(2025, 3, 5)
+        self.users = [User.objects.create_user(username=f'user{i}', password='x') for i in range(3)]
+
+    def points(self, period_type, period_key):
+        return dict(PeriodPoints.objects.filter(
+            period_type=period_type,
+            period_key=period_key
+        ).values_list('user_id', 'points'))
+
+    def test_adds_to_week_and_month(self):
+        first, second, _ = self.users
+        add_period_points({first.id: 10, second.id: 5}, self.day)
+        add_period_points({first.id: 3}, self.day)
+
+        expected = {first.id: 13, second.id: 5}
+        self.assertEqual(self.points(PeriodPoints.PERIOD_WEEK, week_key(self.day)), expected)
+        self.assertEqual(self.points(PeriodPoints.PERIOD_MONTH, month_key(self.day)), expected)
+
+    def test_conflicting_insert_keeps_every_award(self):
+        racer, newcomer, existing = self.users
+        add_period_points({existing.id: 1}, self.day)
+        # Otra petición crea la fila de `racer` después de que se consultaron
+        # las existentes: la consulta no la ve y el bulk_create choca
+        for period_type, period_key in (
+            (PeriodPoints.PERIOD_WEEK, week_key(self.day)),
+            (PeriodPoints.PERIOD_MONTH, month_key(self.day)),
+        ):
+            PeriodPoints.objects.create(user=racer, period_type=period_type, period_key=period_key, points=7)
+
+        def stale_set(iterable=()):
+            return builtins.set(user_id for user_id in iterable if user_id == existing.id)
+
+        with mock.patch('app.social.period_leaderboards.set', stale_set, create=True):
+            add_period_points({racer.id: 10, newcomer.id: 20, existing.id: 2}, self.day)
+
+        self.assertEqual(
+            self.points(PeriodPoints.PERIOD_WEEK, week_key(self.day)),
+            {racer.id: 17, newcomer.id: 20, existing.id: 3}
+        )
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class PeriodLeaderboardViewTests(TestCase):
+
+    def setUp(self):
+        self.users = [User.objects.create_user(username=f'user{i}', password='x') for i in range(3)]
+        self.client = APIClient()
+        self.client.force_authenticate(self.users[2])
+        self.key = week_key(timezone.localdate())
+        add_period_points({self.users[0].id: 5, self.users[1].id: 30, self.users[2].id: 10})
+
+    def get(self, **params):
+        return self.client.get('/api/social/leaderboard/period/', {'period': 'week', **params}).json()
+
+    def test_without_snapshot_ranks_live_and_writes_nothing(self):
+        data = self.get()
+
+        self.assertFalse(LeaderboardSnapshot.objects.exists())
+        self.assertEqual([row['rank'] for row in data['leaderboard']], [1, 2, 3])
+        self.assertEqual([row['points'] for row in data['leaderboard']], [30, 10, 5])
+        self.assertEqual((data['current_user_rank'], data['current_user_points']), (2, 10))
+        self.assertIsNone(data['refreshed_at'])
+
+    def test_stale_snapshot_is_served_without_rebuilding(self):
+        snapshot = refresh_snapshot(PeriodPoints.PERIOD_WEEK, self.key)
+        LeaderboardSnapshot.objects.filter(pk=snapshot.pk).update(
+            refreshed_at=timezone.now() - timedelta(days=1)
+        )
+        add_period_points({self.users[0].id: 100})
+
+        data = self.get()
+
+        # Sigue el snapshot anterior hasta que refresh_leaderboards lo regenere
+        self.assertEqual(data['leaderboard'][0]['id'], self.users[1].id)
+        self.assertEqual(data['current_user_rank'], 2)
+
+    def test_negative_limit_returns_an_empty_page(self):
+        self.assertEqual(self.get(limit=-1)['leaderboard'], [])
+        refresh_snapshot(PeriodPoints.PERIOD_WEEK, self.key)
+        self.assertEqual(self.get(limit=-1)['leaderboard'], [])
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class FriendEdgeTests(TestCase):
+
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE_ALIAS].clear()
+        self.ana, self.beto = (User.objects.create_user(username=name, password='x') for name in ('ana', 'beto'))
+        self.friendship = Friendship.objects.create(from_user=self.ana, to_user=self.beto)
+
+    def edges(self):
+        return set(FriendEdge.objects.values_list('user_id', 'friend_id'))
+
+    def test_edges_follow_the_friendship(self):
+        self.assertEqual(get_friend_ids(self.ana.id), frozenset())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.friendship.accept()
+        self.assertEqual(self.edges(), {(self.ana.id, self.beto.id), (self.beto.id, self.ana.id)})
+        self.assertTrue(Friendship.are_friends(self.ana, self.beto))
+        self.assertEqual(get_friend_ids(self.beto.id), frozenset({self.ana.id}))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.friendship.delete()
+        self.assertEqual(self.edges(), set())
+        self.assertFalse(Friendship.are_friends(self.ana, self.beto))
+        self.assertEqual(get_friend_ids(self.beto.id), frozenset())
+
+    def test_accepting_twice_counts_the_friendship_once(self):
+        # Dos peticiones con su propia copia; la segunda lee el estado que
+        # dejó la primera (SQLite ignora FOR UPDATE: se prueba la cuenta)
+        copy = Friendship.objects.get(pk=self.friendship.pk)
+        self.friendship.accept()
+        copy.accept()
+
+        self.assertEqual(self.edges(), {(self.ana.id, self.beto.id), (self.beto.id, self.ana.id)})
+        self.assertEqual([get_user_stats(user.id).friend_count for user in (self.ana, self.beto)], [1, 1])
+
+    def test_concurrent_reader_cannot_cache_a_stale_set(self):
+        def read_before_commit(user_id):
+            # Se leyó el conjunto anterior y la amistad se confirma antes de guardarlo
+            with self.captureOnCommitCallbacks(execute=True):
+                self.friendship.accept()
+            return frozenset()
+
+        with mock.patch('app.social.friends.fetch_friend_ids', read_before_commit):
+            self.assertEqual(get_friend_ids(self.ana.id), frozenset())
+
+        self.assertEqual(get_friend_ids(self.ana.id), frozenset({self.beto.id}))
+
+    def test_invalidation_waits_for_commit(self):
+        get_friend_ids(self.ana.id)
+        with self.captureOnCommitCallbacks() as callbacks:
+            FriendEdge.objects.create(user=self.ana, friend=self.beto, friendship=self.friendship)
+            invalidate_friend_ids(self.ana.id)
+            self.assertEqual(get_friend_ids(self.ana.id), frozenset())
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_friend_ids(self.ana.id), frozenset({self.beto.id}))
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class FriendSuggestionTests(TestCase):
+
+    def setUp(self):
+        caches[settings.RESPONSE_CACHE_ALIAS].clear()
+        names = ('ana', 'beto', 'caro', 'dani', 'eva', 'fede', 'gabi', 'hugo', 'ines')
+        self.ana, self.beto, self.caro, self.dani, self.eva, self.fede, self.gabi, self.hugo, self.ines = (
+            User.objects.create_user(username=name, password='x') for name in names
+        )
+        self.ana_beto = self.befriend(self.ana, self.beto)
+        self.befriend(self.ana, self.caro)
+        self.befriend(self.beto, self.caro)
+        self.befriend(self.beto, self.dani)
+        self.befriend(self.caro, self.dani)
+        self.befriend(self.beto, self.eva)
+        self.befriend(self.caro, self.fede)
+        self.befriend(self.beto, self.gabi)
+        self.befriend(self.beto, self.hugo)
+        self.befriend(self.eva, self.ines)
+        # Solicitudes con el usuario en cualquier dirección y estado
+        Friendship.objects.create(from_user=self.gabi, to_user=self.ana)
+        Friendship.objects.create(from_user=self.ana, to_user=self.hugo, status='rejected')
+
+    def befriend(self, from_user, to_user):
+        return Friendship.objects.create(from_user=from_user, to_user=to_user, status='accepted')
+
+    def named(self, suggestions):
+        names = dict(User.objects.values_list('id', 'username'))
+        return [(names[user_id], mutual) for user_id, mutual in suggestions]
+
+    def test_orders_by_mutual_friends_and_excludes_known_users(self):
+        # Sin el usuario, sus amigos (beto, caro) ni quienes tienen solicitud con él (gabi, hugo)
+        self.assertEqual(self.named(fetch_friend_suggestions(self.ana.id)), [('dani', 2), ('eva', 1), ('fede', 1)])
+        self.assertEqual(self.named(fetch_friend_suggestions(self.ana.id, limit=1)), [('dani', 2)])
+
+    def test_cache_is_invalidated_on_accept_and_remove(self):
+        self.assertEqual(self.named(get_friend_suggestions(self.ana.id)), [('dani', 2), ('eva', 1), ('fede', 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            request = Friendship.objects.create(from_user=self.eva, to_user=self.ana)
+        self.assertEqual(self.named(get_friend_suggestions(self.ana.id)), [('dani', 2), ('fede', 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            request.accept()
+        self.assertEqual(self.named(get_friend_suggestions(self.ana.id)), [('dani', 2), ('fede', 1), ('ines', 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ana_beto.delete()
+        self.assertEqual(self.named(get_friend_suggestions(self.ana.id)), [('beto', 2), ('dani', 1), ('fede', 1), ('ines', 1)])
+
+
+class RankIndexTests(TestCase):
+
+    def test_concurrent_readers_rebuild_once(self):
+        index = RankIndex()
+        calls = []
+
+        def slow_rebuild():
+            calls.append(1)
+            time.sleep(0.05)
+            index._built_at = time.monotonic()
+
+        with mock.patch.object(index, 'rebuild', slow_rebuild):
+            threads = [threading.Thread(target=index.size) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+
+    @override_settings(ACHIEVEMENT_WORKER='command')
+    def test_apply_points_moves_users_on_commit(self):
+        from app.users.points import apply_points
+
+        from app.users.models import M_UserProfile
+
+        first, second = (User.objects.create_user(username=f'rank{i}', password='x') for i in range(2))
+        M_UserProfile.objects.bulk_create([M_UserProfile(user=first), M_UserProfile(user=second)])
+        apply_points({first.id: 10})
+        rank_index.rebuild()
+        self.assertEqual(rank_index.rank(second.id), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_points({second.id: 50})
+
+        self.assertEqual(rank_index.rank(second.id), 1)
+        self.assertEqual(rank_index.rank(first.id), 2)
+
+
+class SearchNormalizationTests(TestCase):
+
+    def test_accents_are_folded(self):
+        self.assertEqual(normalize('José Núñez'), 'jose nunez')
+        self.assertEqual(split_words('María_José.Pérez'), ['maria', 'jose', 'perez'])
+
+    def test_non_latin_letters_are_kept(self):
+        self.assertEqual(split_words('Иван Петров'), ['иван', 'петров'])
+        self.assertEqual(split_words('李明'), ['李明'])
+
+    def test_words_are_truncated_like_the_index(self):
+        self.assertEqual(split_words('a' * 40), ['a' * MAX_TERM_LENGTH])
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class SearchRankingTests(TestCase):
+
+    def setUp(self):
+        self.me = User.objects.create_user(username='me', password='x')
+
+    def user(self, username, first_name='', last_name=''):
+        return User.objects.create_user(
+            username=username, password='x', first_name=first_name, last_name=last_name
+        )
+
+    def test_exact_before_prefix_before_infix(self):
+        infix = self.user('aaa', 'Rosamar')
+        prefix = self.user('bbb', 'Mariana')
+        exact = self.user('ccc', 'Mar')
+        self.assertEqual(search_user_ids('mar', self.me.id), [exact.id, prefix.id, infix.id])
+
+    def test_accent_insensitive_and_every_word_must_match(self):
+        match = self.user('jp', 'Juan', 'Núñez')
+        self.user('jg', 'Juan', 'González')
+        self.assertEqual(search_user_ids('JUAN nuñez', self.me.id), [match.id])
+
+    def test_non_latin_names(self):
+        ivan = self.user('ivan1', 'Иван', 'Петров')
+        li = self.user('li1', '李明')
+        self.assertEqual(search_user_ids('иван', self.me.id), [ivan.id])
+        self.assertEqual(search_user_ids('李', self.me.id), [li.id])
+
+    def test_long_words_still_match(self):
+        word = 'x' * 35
+        long_name = self.user('long', word)
+        self.assertEqual(search_user_ids(word, self.me.id), [long_name.id])
+
+    def test_rename_reindexes_and_excludes_self(self):
+        renamed = self.user('renamed', 'Pedro')
+        renamed.first_name = 'Lucía'
+        renamed.save()
+        self.assertEqual(search_user_ids('lucia', self.me.id), [renamed.id])
+        self.assertEqual(search_user_ids('pedro', self.me.id), [])
+        self.assertNotIn(self.me.id, search_user_ids('me', self.me.id))
@@ -6,9 +6,12 @@ from app.social.views import (
     V_RejectFriendRequest,
     V_FriendList,
     V_RemoveFriend,
+    V_FriendSuggestions,
     V_SearchUsers,
     V_GlobalLeaderboard,
     V_FriendsLeaderboard,
+    V_UserRank,
+    V_PeriodLeaderboard,
     V_AchievementList,
     V_UserAchievementList,
     V_CheckAchievements,
@@ -24,6 +27,7 @@ urlpatterns = [
     # Friends
     path('friends/', V_FriendList.as_view(), name='friend-list'),
     path('friends/<int:pk>/', V_RemoveFriend.as_view(), name='remove-friend'),
+    path('friends/suggestions/', V_FriendSuggestions.as_view(), name='friend-suggestions'),
     
     # Search users
     path('users/search/', V_SearchUsers.as_view(), name='search-users'),
@@ -31,6 +35,8 @@ urlpatterns = [
     # Leaderboard
     path('leaderboard/global/', V_GlobalLeaderboard.as_view(), name='global-leaderboard'),
     path('leaderboard/friends/', V_FriendsLeaderboard.as_view(), name='friends-leaderboard'),
+    path('leaderboard/rank/', V_UserRank.as_view(), name='user-rank'),
+    path('leaderboard/period/', V_PeriodLeaderboard.as_view(), name='period-leaderboard'),
     
     # Achievements
     path('achievements/', V_AchievementList.as_view(), name='achievement-list'),
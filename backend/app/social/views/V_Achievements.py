@@ -2,52 +2,68 @@ from rest_framework import generics
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from django.db.models import F, FilteredRelation, Q, Value
+from django.db.models.functions import Coalesce
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from core.cache import cache_user_response
+from core.utils import build_etag, queryset_fingerprint
 
 from app.social.models import Achievement, UserAchievement
 from app.social.serializers import (
+    AchievementProgressSerializer,
     AchievementSerializer,
     UserAchievementListSerializer,
 )
 
 
+def _achievement_list_etag(request):
+    return build_etag(
+        'achievements',
+        request.user.id,
+        request.get_full_path(),
+        queryset_fingerprint(Achievement.objects.all()),
+        queryset_fingerprint(UserAchievement.objects.filter(user=request.user)),
+    )
+
+
+@method_decorator(condition(etag_func=_achievement_list_etag), name='get')
 class V_AchievementList(generics.ListAPIView):
+    """
+    Logros activos con el progreso guardado del usuario, sin escrituras.
+    El progreso lo mantiene la cola de logros (app.social.achievement_queue)
+    al registrar actividad; los logros sin fila se muestran en 0%.
+    """
 
-    serializer_class = UserAchievementListSerializer
+    serializer_class = AchievementProgressSerializer
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
         user = self.request.user
         category = self.request.query_params.get('category', None)
         
-        # Obtener todos los logros activos
         achievements = Achievement.objects.filter(is_active=True)
         
         if category:
             achievements = achievements.filter(category=category)
         
-        # Crear o actualizar UserAchievement para cada logro
-        user_achievements = []
-        for achievement in achievements:
-            user_achievement, created = UserAchievement.objects.get_or_create(
-                user=user,
-                achievement=achievement
-            )
-            user_achievements.append(user_achievement)
-        
-        # Verificar progreso de todos los logros
-        UserAchievement.check_and_unlock_achievements(user)
-        
-        # Retornar ordenado: desbloqueados primero, luego por progreso
-        return UserAchievement.objects.filter(
-            user=user,
-            achievement__in=achievements
-        ).select_related('achievement').order_by(
+        # LEFT JOIN con la fila del usuario (índice único user, achievement)
+        return achievements.annotate(
+            mine=FilteredRelation('unlocked_by', condition=Q(unlocked_by__user=user)),
+            user_achievement_id=F('mine__id'),
+            progress=Coalesce('mine__progress', Value(0)),
+            is_unlocked=Coalesce('mine__is_unlocked', Value(False)),
+            unlocked_at=F('mine__unlocked_at'),
+        ).order_by(
+            # Desbloqueados primero, luego por progreso
             '-is_unlocked',
             '-progress',
-            'achievement__category'
+            'category',
+            'id'
         )
 
 
+@method_decorator(cache_user_response('unlocked_achievements'), name='list')
 class V_UserAchievementList(generics.ListAPIView):
     serializer_class = UserAchievementListSerializer
     permission_classes = [IsAuthenticated]
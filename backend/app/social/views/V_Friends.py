@@ -3,15 +3,17 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth.models import User
-from django.db.models import Q
 
-from app.social.models import Friendship
+from app.social.models import FriendEdge, Friendship
 from app.social.serializers import (
     FriendshipSerializer,
     FriendRequestSerializer,
     FriendListSerializer,
+    FriendSuggestionSerializer,
+    UserSearchResultSerializer,
 )
-from app.social.serializers.SZ_Friendship import UserBasicSerializer
+from app.social.friends import SUGGESTIONS_LIMIT, get_friend_suggestions
+from app.social.search import search_users
 
 
 class V_SendFriendRequest(generics.CreateAPIView):
@@ -65,9 +67,10 @@ class V_AcceptFriendRequest(APIView):
         friendship.accept()
         
         # Verificar y desbloquear logros de amistad
-        from app.social.models import UserAchievement
-        UserAchievement.check_and_unlock_achievements(request.user)
-        UserAchievement.check_and_unlock_achievements(friendship.from_user)
+        from app.social.achievement_queue import enqueue_achievement_evaluation
+        from app.social.achievements import FRIEND_ACCEPTED
+        enqueue_achievement_evaluation(request.user.id, FRIEND_ACCEPTED)
+        enqueue_achievement_evaluation(friendship.from_user_id, FRIEND_ACCEPTED)
         
         serializer = FriendshipSerializer(friendship, context={'request': request})
         return Response(serializer.data)
@@ -107,11 +110,9 @@ class V_FriendList(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        user = self.request.user
-        return Friendship.objects.filter(
-            Q(from_user=user, status='accepted') |
-            Q(to_user=user, status='accepted')
-        ).select_related('from_user', 'to_user')
+        return FriendEdge.objects.filter(
+            user=self.request.user
+        ).select_related('friend__profile', 'friendship')
 
 
 class V_RemoveFriend(APIView):
@@ -123,46 +124,67 @@ class V_RemoveFriend(APIView):
     
     def delete(self, request, pk):
         try:
-            friendship = Friendship.objects.get(
-                Q(id=pk) &
-                (Q(from_user=request.user) | Q(to_user=request.user)),
-                status='accepted'
+            edge = FriendEdge.objects.select_related('friendship').get(
+                user=request.user,
+                friendship_id=pk
             )
-        except Friendship.DoesNotExist:
+        except FriendEdge.DoesNotExist:
             return Response(
                 {'error': 'Amistad no encontrada'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        friendship.delete()
+        # Elimina también las dos filas FriendEdge
+        edge.friendship.delete()
         return Response(
             {'message': 'Amistad eliminada exitosamente'},
             status=status.HTTP_204_NO_CONTENT
         )
 
 
+class V_FriendSuggestions(APIView):
+    """
+    GET /api/social/friends/suggestions/?limit=10
+    Personas que quizá conozcas, ordenadas por amigos en común
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            limit = min(int(request.query_params.get('limit', SUGGESTIONS_LIMIT)), SUGGESTIONS_LIMIT)
+        except ValueError:
+            limit = SUGGESTIONS_LIMIT
+        
+        suggestions = get_friend_suggestions(request.user.id)[:max(limit, 0)]
+        users = User.objects.select_related('profile').in_bulk(
+            [user_id for user_id, _ in suggestions]
+        )
+        
+        results = []
+        for user_id, mutual_friends in suggestions:
+            user = users.get(user_id)
+            if user is not None:
+                user.mutual_friends = mutual_friends
+                results.append(user)
+        
+        serializer = FriendSuggestionSerializer(results, many=True, context={'request': request})
+        return Response(serializer.data)
+
+
 class V_SearchUsers(generics.ListAPIView):
     """
     GET /api/social/users/search/?q=username
     Busca usuarios por nombre de usuario, nombre o apellido
+    (sin acentos; coincidencia exacta, luego prefijo, luego infijo)
     """
-    serializer_class = UserBasicSerializer
+    serializer_class = UserSearchResultSerializer
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        query = self.request.query_params.get('q', '')
+        query = self.request.query_params.get('q', '').strip()
         
         if not query or len(query) < 2:
-            return User.objects.none()
-        
-        # Excluir al usuario actual
-        queryset = User.objects.exclude(id=self.request.user.id)
-        
-        # Buscar por username, first_name o last_name
-        queryset = queryset.filter(
-            Q(username__icontains=query) |
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query)
-        ).select_related('profile')[:10]  # Limitar a 10 resultados
+            return []
         
-        return queryset
+        # Limitado a 10 resultados, excluyendo al usuario actual
+        return search_users(self.request.user, query[:100])
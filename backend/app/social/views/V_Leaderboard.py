@@ -1,13 +1,50 @@
-from rest_framework import generics
+from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
-from app.social.models import Friendship
-from app.social.serializers import LeaderboardEntrySerializer
+from app.social.leaderboard import leaderboard_values, rank_rows
+from app.social.models import FriendEdge, Friendship, PeriodPoints, Season
+from app.social.period_leaderboards import (
+    current_season, get_snapshot, live_rank, live_ranking, period_key_for
+)
+from app.social.ranking import rank_index
+from app.social.serializers import LeaderboardEntrySerializer, PeriodLeaderboardEntrySerializer
+from app.users.models import M_UserProfile
+from core.utils import build_etag, queryset_fingerprint
 
 
+def _global_leaderboard_etag(request):
+    return build_etag(
+        'global_leaderboard',
+        request.user.id,
+        request.get_full_path(),
+        User.objects.count(),
+        queryset_fingerprint(M_UserProfile.objects.all()),
+    )
+
+
+def _friends_leaderboard_etag(request):
+    user = request.user
+    edges = FriendEdge.objects.filter(user=user)
+    profiles = M_UserProfile.objects.filter(
+        user_id__in=Friendship.get_friend_ids(user) | {user.id}
+    )
+    return build_etag(
+        'friends_leaderboard',
+        user.id,
+        queryset_fingerprint(edges),
+        queryset_fingerprint(profiles),
+    )
+
+
+@method_decorator(condition(etag_func=_global_leaderboard_etag), name='get')
 class V_GlobalLeaderboard(generics.ListAPIView):
     serializer_class = LeaderboardEntrySerializer
     permission_classes = [IsAuthenticated]
@@ -16,39 +53,58 @@ class V_GlobalLeaderboard(generics.ListAPIView):
         limit = int(self.request.query_params.get('limit', 100))
         
         # Ordenar usuarios por total_points de su perfil
-        queryset = User.objects.select_related('profile').order_by(
-            '-profile__total_points',
-            '-profile__level',
-            '-profile__total_co2_saved'
-        )[:limit]
-        
-        return queryset
+        return leaderboard_values(User.objects.all())[:limit]
     
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        
-        # Agregar ranking a cada usuario
-        ranked_users = []
-        for rank, user in enumerate(queryset, start=1):
-            user.rank = rank
-            ranked_users.append(user)
-        
-        serializer = self.get_serializer(ranked_users, many=True)
-        
-        # Encontrar la posición del usuario actual
-        current_user_rank = None
-        for item in serializer.data:
-            if item['id'] == request.user.id:
-                current_user_rank = item['rank']
-                break
+        serializer = self.get_serializer(rank_rows(self.get_queryset()), many=True)
         
+        # La posición del usuario actual sale del índice aunque no esté en el top
         return Response({
             'leaderboard': serializer.data,
-            'current_user_rank': current_user_rank,
+            'current_user_rank': rank_index.rank(request.user.id),
+            'current_user_percentile': rank_index.percentile(request.user.id),
             'total_users': User.objects.count()
         })
 
 
+class V_UserRank(APIView):
+    """Posición global del usuario actual, su percentil y los usuarios a su alrededor."""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            count = min(int(request.query_params.get('neighbours', 2)), 10)
+        except ValueError:
+            count = 2
+        
+        neighbours = rank_index.neighbours(request.user.id, max(count, 0))
+        rows = {
+            row['id']: row
+            for row in leaderboard_values(
+                User.objects.filter(id__in=[user_id for _, user_id in neighbours])
+            )
+        }
+        ranked_rows = []
+        for rank, user_id in neighbours:
+            row = rows.get(user_id)
+            if row is not None:
+                row['rank'] = rank
+                ranked_rows.append(row)
+        
+        serializer = LeaderboardEntrySerializer(
+            ranked_rows,
+            many=True,
+            context={'request': request}
+        )
+        return Response({
+            'rank': rank_index.rank(request.user.id),
+            'percentile': rank_index.percentile(request.user.id),
+            'total_users': rank_index.size(),
+            'neighbours': serializer.data
+        })
+
+
+@method_decorator(condition(etag_func=_friends_leaderboard_etag), name='get')
 class V_FriendsLeaderboard(generics.ListAPIView):
     serializer_class = LeaderboardEntrySerializer
     permission_classes = [IsAuthenticated]
@@ -56,34 +112,14 @@ class V_FriendsLeaderboard(generics.ListAPIView):
     def get_queryset(self):
         user = self.request.user
         
-        # Obtener IDs de amigos
-        friends = Friendship.get_friends(user)
-        friend_ids = list(friends.values_list('id', flat=True))
-        
-        # Incluir al usuario actual
-        friend_ids.append(user.id)
+        # Amigos (desde la caché) más el usuario actual
+        user_ids = Friendship.get_friend_ids(user) | {user.id}
         
         # Ordenar por puntos
-        queryset = User.objects.filter(
-            id__in=friend_ids
-        ).select_related('profile').order_by(
-            '-profile__total_points',
-            '-profile__level',
-            '-profile__total_co2_saved'
-        )
-        
-        return queryset
+        return leaderboard_values(User.objects.filter(id__in=user_ids))
     
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        
-        # Agregar ranking a cada usuario
-        ranked_users = []
-        for rank, user in enumerate(queryset, start=1):
-            user.rank = rank
-            ranked_users.append(user)
-        
-        serializer = self.get_serializer(ranked_users, many=True)
+        serializer = self.get_serializer(rank_rows(self.get_queryset()), many=True)
         
         # Encontrar la posición del usuario actual
         current_user_rank = None
@@ -97,3 +133,84 @@ class V_FriendsLeaderboard(generics.ListAPIView):
             'current_user_rank': current_user_rank,
             'total_friends': len(serializer.data) - 1  # -1 para excluir al usuario
         })
+
+
+class V_PeriodLeaderboard(APIView):
+    """
+    Leaderboard semanal, mensual o de temporada desde el snapshot del periodo.
+    Parámetros: period=week|month|season, season=<id> (por defecto la vigente), limit.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        period_type = request.query_params.get('period', PeriodPoints.PERIOD_WEEK)
+        try:
+            limit = min(int(request.query_params.get('limit', 100)), 500)
+        except ValueError:
+            limit = 100
+        limit = max(limit, 0)
+        
+        if period_type == PeriodPoints.PERIOD_SEASON:
+            season_id = request.query_params.get('season')
+            if season_id:
+                season = Season.objects.filter(pk=season_id, is_active=True).first() if season_id.isdigit() else None
+            else:
+                season = current_season()
+            if season is None:
+                return Response(
+                    {'error': 'Temporada no encontrada'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            period_key = str(season.id)
+        elif period_type in (PeriodPoints.PERIOD_WEEK, PeriodPoints.PERIOD_MONTH):
+            season = None
+            period_key = period_key_for(period_type, timezone.localdate())
+        else:
+            return Response(
+                {'error': 'Periodo inválido. Opciones: week, month, season'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        snapshot = get_snapshot(period_type, period_key)
+        if snapshot is not None:
+            entries = snapshot.entries.filter(rank__lte=limit).order_by('rank')
+            current = snapshot.entries.filter(user=request.user).values('rank', 'points').first()
+            total_users = snapshot.total_users
+            refreshed_at = snapshot.refreshed_at
+        else:
+            # Periodo recién iniciado y aún sin snapshot: orden en vivo, sin escribir
+            ranking = live_ranking(period_type, period_key)
+            entries = ranking[:limit]
+            current = live_rank(period_type, period_key, request.user.id)
+            total_users = ranking.count()
+            refreshed_at = None
+        
+        rows = list(entries.values(
+            'points',
+            'user_id',
+            username=F('user__username'),
+            first_name=F('user__first_name'),
+            last_name=F('user__last_name'),
+            picture=F('user__profile__profile_picture'),
+            level=Coalesce('user__profile__level', Value(1)),
+        ))
+        # Las filas vienen ordenadas por posición en ambos casos
+        for rank, row in enumerate(rows, start=1):
+            row['rank'] = rank
+        serializer = PeriodLeaderboardEntrySerializer(rows, many=True, context={'request': request})
+        
+        return Response({
+            'period': period_type,
+            'period_key': period_key,
+            'season': {
+                'id': season.id,
+                'name': season.name,
+                'start_date': season.start_date,
+                'end_date': season.end_date,
+            } if season else None,
+            'leaderboard': serializer.data,
+            'current_user_rank': current['rank'] if current else None,
+            'current_user_points': current['points'] if current else 0,
+            'total_users': total_users,
+            'refreshed_at': refreshed_at
+        })
@@ -5,9 +5,10 @@ from .V_Friends import (
     V_RejectFriendRequest,
     V_FriendList,
     V_RemoveFriend,
+    V_FriendSuggestions,
     V_SearchUsers
 )
-from .V_Leaderboard import V_GlobalLeaderboard, V_FriendsLeaderboard
+from .V_Leaderboard import V_GlobalLeaderboard, V_FriendsLeaderboard, V_UserRank, V_PeriodLeaderboard
 from .V_Achievements import V_AchievementList, V_UserAchievementList, V_CheckAchievements
 
 __all__ = [
@@ -17,9 +18,12 @@ __all__ = [
     'V_RejectFriendRequest',
     'V_FriendList',
     'V_RemoveFriend',
+    'V_FriendSuggestions',
     'V_SearchUsers',
     'V_GlobalLeaderboard',
     'V_FriendsLeaderboard',
+    'V_UserRank',
+    'V_PeriodLeaderboard',
     'V_AchievementList',
     'V_UserAchievementList',
     'V_CheckAchievements',
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from app.sync.models import SyncChange, SyncState
+from app.sync.sync import TOMBSTONE_RETENTION
+
+
+class Command(BaseCommand):
+    help = 'Eliminar los registros eliminados de la sincronización más viejos que la retención'
+
+    def handle(self, *args, **options):
+        before = timezone.now() - TOMBSTONE_RETENTION
+        purged = SyncChange.objects.filter(deleted=True, seq__isnull=False, changed_at__lt=before)
+
+        with transaction.atomic():
+            # Los cursores anteriores a lo purgado reciben una copia completa
+            for row in purged.order_by().values('user_id').annotate(seq=Max('seq')):
+                SyncState.objects.filter(
+                    user_id=row['user_id'],
+                    purged_seq__lt=row['seq']
+                ).update(purged_seq=row['seq'])
+            deleted, _ = purged.delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {deleted} eliminados purgados (anteriores a {before:%Y-%m-%d})'
+        ))
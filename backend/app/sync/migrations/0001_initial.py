@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('collection', models.CharField(max_length=30, verbose_name='Colección')),
+                ('object_id', models.BigIntegerField(verbose_name='ID del registro')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='Eliminado el')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sync_tombstones', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Registro Eliminado',
+                'verbose_name_plural': 'Registros Eliminados',
+                'db_table': 'sync_tombstones',
+                'indexes': [models.Index(fields=['user', 'deleted_at', 'id'], name='sync_tombst_user_id_7db33b_idx')],
+            },
+        ),
+    ]
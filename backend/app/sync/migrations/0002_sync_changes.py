@@ -0,0 +1,58 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('sync', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncState',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sync_state', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+                ('seq', models.BigIntegerField(default=0, verbose_name='Última secuencia')),
+                ('purged_seq', models.BigIntegerField(default=0, help_text='Un cursor anterior ya no sabe qué se eliminó y recibe todo de nuevo', verbose_name='Secuencia purgada')),
+            ],
+            options={
+                'verbose_name': 'Estado de Sincronización',
+                'verbose_name_plural': 'Estados de Sincronización',
+                'db_table': 'sync_states',
+            },
+        ),
+        migrations.CreateModel(
+            name='SyncChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('collection', models.CharField(max_length=30, verbose_name='Colección')),
+                ('object_id', models.BigIntegerField(verbose_name='ID del registro')),
+                ('seq', models.BigIntegerField(blank=True, help_text='Vacía hasta que una sincronización la numera', null=True, verbose_name='Secuencia')),
+                ('deleted', models.BooleanField(default=False, verbose_name='Eliminado')),
+                ('changed_at', models.DateTimeField(auto_now=True, verbose_name='Cambiado el')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sync_changes', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Cambio Sincronizable',
+                'verbose_name_plural': 'Cambios Sincronizables',
+                'db_table': 'sync_changes',
+            },
+        ),
+        migrations.DeleteModel(
+            name='SyncTombstone',
+        ),
+        migrations.AddIndex(
+            model_name='syncchange',
+            index=models.Index(fields=['user', 'seq', 'id'], name='sync_change_user_id_1b1aab_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='syncchange',
+            constraint=models.UniqueConstraint(fields=('user', 'collection', 'object_id'), name='unique_sync_change'),
+        ),
+    ]
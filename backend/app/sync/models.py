@@ -0,0 +1,93 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class SyncState(models.Model):
+    """
+    Secuencia de cambios de un usuario. Cada lectura de la sincronización
+    numera con el siguiente valor los cambios ya confirmados.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='sync_state',
+        verbose_name='Usuario'
+    )
+
+    seq = models.BigIntegerField(
+        default=0,
+        verbose_name='Última secuencia'
+    )
+
+    purged_seq = models.BigIntegerField(
+        default=0,
+        verbose_name='Secuencia purgada',
+        help_text='Un cursor anterior ya no sabe qué se eliminó y recibe todo de nuevo'
+    )
+
+    class Meta:
+        db_table = 'sync_states'
+        verbose_name = 'Estado de Sincronización'
+        verbose_name_plural = 'Estados de Sincronización'
+
+    def __str__(self):
+        return f"{self.user_id} @ {self.seq}"
+
+
+class SyncChange(models.Model):
+    """
+    Último cambio de un registro para la sincronización de un usuario.
+    Se escribe (sin secuencia) en la misma transacción que el cambio; la
+    secuencia se asigna recién cuando la transacción ya se confirmó.
+    Los eliminados físicamente (p. ej. una amistad) quedan con `deleted`.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='sync_changes',
+        verbose_name='Usuario'
+    )
+
+    collection = models.CharField(
+        max_length=30,
+        verbose_name='Colección'
+    )
+
+    object_id = models.BigIntegerField(
+        verbose_name='ID del registro'
+    )
+
+    seq = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Secuencia',
+        help_text='Vacía hasta que una sincronización la numera'
+    )
+
+    deleted = models.BooleanField(
+        default=False,
+        verbose_name='Eliminado'
+    )
+
+    changed_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Cambiado el'
+    )
+
+    class Meta:
+        db_table = 'sync_changes'
+        verbose_name = 'Cambio Sincronizable'
+        verbose_name_plural = 'Cambios Sincronizables'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'collection', 'object_id'],
+                name='unique_sync_change'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'seq', 'id']),
+        ]
+
+    def __str__(self):
+        return f"{self.collection} {self.object_id} ({self.user_id} @ {self.seq})"
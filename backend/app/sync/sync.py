@@ -0,0 +1,323 @@
+"""
+Sincronización incremental para la app móvil.
+Cada escritura sobre datos sincronizables deja, en su misma transacción,
+una fila SyncChange por registro y usuario afectado, todavía sin
+secuencia. Al leer, la sincronización numera con el siguiente valor de
+SyncState los cambios que ya se confirmaron (un UPDATE no ve filas de
+transacciones abiertas) y entrega los que quedan después del cursor en
+orden (seq, id). Una transacción larga se confirma con su cambio sin
+numerar y lo recibe la sincronización siguiente: el cursor nunca deja
+atrás un cambio que todavía no era visible.
+
+Sin cursor, o con uno anterior a los eliminados purgados, se entrega una
+copia completa recorriendo cada colección en orden (updated_at, id); lo
+que cambie mientras tanto llega después, con secuencia mayor.
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+from app.meals.models import M_Meal
+from app.social.models import Friendship, UserAchievement
+from app.transport.models import M_Transport
+from app.users.models import M_UserProfile
+from core.utils import InvalidCursor
+from .models import SyncChange, SyncState
+
+
+SYNC_BATCH_SIZE = 500
+
+# Los eliminados más viejos se purgan (purge_sync_tombstones): un cursor
+# anterior ya no puede saber qué se eliminó y recibe una sincronización completa
+TOMBSTONE_RETENTION = timedelta(days=90)
+
+MEAL_FIELDS = (
+    'id', 'meal_type', 'description', 'ingredients', 'total_co2', 'meal_date',
+    'is_vegetarian', 'is_vegan', 'created_at', 'updated_at', 'is_active',
+)
+TRANSPORT_FIELDS = (
+    'id', 'transport_type', 'distance_km', 'origin', 'destination', 'total_co2',
+    'trip_date', 'created_at', 'updated_at', 'is_active',
+)
+ACHIEVEMENT_FIELDS = (
+    'id', 'achievement_id', 'progress', 'is_unlocked', 'unlocked_at', 'updated_at', 'is_active',
+)
+PROFILE_FIELDS = (
+    'id', 'bio', 'total_points', 'level', 'total_co2_saved', 'streak_days',
+    'last_activity_date', 'daily_co2_goal', 'notifications_enabled', 'updated_at',
+)
+
+# El perfil es uno por usuario: sus cambios se registran con el user_id
+COLLECTION_PROFILE = 'profile'
+COLLECTION_MEALS = 'meals'
+COLLECTION_TRANSPORTS = 'transports'
+COLLECTION_ACHIEVEMENTS = 'achievements'
+COLLECTION_FRIENDSHIPS = 'friendships'
+
+
+def encode_cursor(position):
+    raw = json.dumps(position, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Returns:
+        Dict con `seq` y, en una sincronización incremental, el `id` del
+        último cambio entregado de esa secuencia (o None); en una completa,
+        `full` con {colección: (updated_at, id)} de lo último entregado.
+        None si el cursor obliga a empezar de cero
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if isinstance(raw, dict) and 'seq' not in raw:
+            # Cursor de antes de la secuencia de cambios: copia completa
+            return None
+        seq = raw['seq']
+        if not isinstance(seq, int):
+            raise ValueError(seq)
+        if 'full' not in raw:
+            pk = raw['id']
+            if not (pk is None or isinstance(pk, int)):
+                raise ValueError(pk)
+            return {'seq': seq, 'id': pk}
+        positions = {}
+        for name, (moment, pk) in raw['full'].items():
+            if name not in SYNC_COLLECTIONS or not isinstance(pk, int):
+                raise ValueError(name)
+            moment = datetime.fromisoformat(moment)
+            if timezone.is_naive(moment):
+                raise ValueError(moment)
+            positions[name] = (moment, pk)
+        return {'seq': seq, 'full': positions}
+    except (KeyError, ValueError, TypeError, AttributeError, UnicodeDecodeError):
+        raise InvalidCursor('Cursor inválido.')
+
+
+def _meals(user):
+    return M_Meal.objects.filter(user=user).values(*MEAL_FIELDS)
+
+
+def _transports(user):
+    return M_Transport.objects.filter(user=user).values(*TRANSPORT_FIELDS)
+
+
+def _achievements(user):
+    return UserAchievement.objects.filter(user=user).values(*ACHIEVEMENT_FIELDS)
+
+
+def _profile(user):
+    return M_UserProfile.objects.filter(user=user).values(*PROFILE_FIELDS)
+
+
+def _friendships(user):
+    sent = Q(from_user_id=user.id)
+
+    def friend(field):
+        return Case(When(sent, then=F(f'to_user__{field}')), default=F(f'from_user__{field}'))
+
+    return Friendship.objects.filter(Q(from_user=user) | Q(to_user=user)).values(
+        'id', 'status', 'accepted_at', 'created_at', 'updated_at', 'is_active',
+        direction=Case(When(sent, then=Value('sent')), default=Value('received')),
+        friend_id=friend('id'),
+        friend_username=friend('username'),
+        friend_first_name=friend('first_name'),
+        friend_last_name=friend('last_name'),
+    )
+
+
+# Colección: queryset de valores del usuario
+SYNC_COLLECTIONS = {
+    COLLECTION_PROFILE: _profile,
+    COLLECTION_MEALS: _meals,
+    COLLECTION_TRANSPORTS: _transports,
+    COLLECTION_ACHIEVEMENTS: _achievements,
+    COLLECTION_FRIENDSHIPS: _friendships,
+}
+
+
+def record_changes(collection, changes, deleted=False):
+    """
+    Registra registros cambiados para la próxima sincronización de cada
+    usuario. Se llama dentro de la transacción que los modifica, así el
+    cambio queda visible solo cuando se confirma.
+
+    Args:
+        collection: Nombre de la colección (SYNC_COLLECTIONS)
+        changes: Iterable de (user_id, id del registro)
+        deleted: True si los registros se eliminaron físicamente
+    """
+    changes = set(changes)
+    if not changes:
+        return
+    SyncChange.objects.bulk_create(
+        [
+            SyncChange(user_id=user_id, collection=collection, object_id=object_id, deleted=deleted)
+            for user_id, object_id in changes
+        ],
+        update_conflicts=True,
+        unique_fields=['user', 'collection', 'object_id'],
+        update_fields=['seq', 'deleted', 'changed_at'],
+        batch_size=1000
+    )
+
+
+def record_deletion(collection, object_id, user_ids):
+    """Avisa a cada usuario que tenía el registro que se eliminó."""
+    record_changes(collection, [(user_id, object_id) for user_id in user_ids], deleted=True)
+
+
+def number_changes(user_id):
+    """
+    Asigna la siguiente secuencia del usuario a sus cambios confirmados
+    que todavía no tienen. El bloqueo de SyncState ordena las
+    numeraciones concurrentes: una secuencia visible implica que las
+    anteriores ya se confirmaron.
+
+    Returns:
+        SyncState con la última secuencia asignada
+    """
+    pending = SyncChange.objects.filter(user_id=user_id, seq__isnull=True)
+    if not pending.exists():
+        return SyncState.objects.filter(user_id=user_id).first() or SyncState(user_id=user_id)
+
+    with transaction.atomic():
+        SyncState.objects.bulk_create([SyncState(user_id=user_id)], ignore_conflicts=True)
+        state = SyncState.objects.select_for_update().get(user_id=user_id)
+        state.seq += 1
+        state.save(update_fields=['seq'])
+        pending.update(seq=state.seq)
+    return state
+
+
+def _read_snapshot(queryset, position, limit):
+    """
+    Siguiente lote de la colección después de `position`, en orden (updated_at, id).
+
+    Returns:
+        (filas, hay más, nueva posición)
+    """
+    if position is not None:
+        moment, pk = position
+        queryset = queryset.filter(Q(updated_at__gt=moment) | Q(updated_at=moment, id__gt=pk))
+
+    rows = list(queryset.order_by('updated_at', 'id')[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        position = (rows[-1]['updated_at'], rows[-1]['id'])
+    return rows, has_more, position
+
+
+def _snapshot_payload(user, seq, positions, limit):
+    """Página de una copia completa: los registros activos de cada colección."""
+    payload = {'has_more': False}
+    next_positions = {}
+    for name, queryset_for in SYNC_COLLECTIONS.items():
+        queryset = queryset_for(user)
+        if name != COLLECTION_PROFILE:
+            queryset = queryset.filter(is_active=True)
+        rows, has_more, position = _read_snapshot(queryset, positions.get(name), limit)
+        payload['has_more'] |= has_more
+        if position is not None:
+            next_positions[name] = position
+        if name == COLLECTION_PROFILE:
+            payload['profile'] = rows[0] if rows else None
+        else:
+            for row in rows:
+                row.pop('is_active')
+            payload[name] = {'changed': rows, 'deleted': []}
+
+    if payload['has_more']:
+        payload['cursor'] = encode_cursor({
+            'seq': seq,
+            'full': {
+                name: [moment.isoformat(), pk] for name, (moment, pk) in next_positions.items()
+            },
+        })
+    else:
+        # Copia terminada: lo cambiado desde que empezó tiene secuencia mayor
+        payload['cursor'] = encode_cursor({'seq': seq, 'id': None})
+    return payload
+
+
+def _changes_payload(user, state, position, limit):
+    """Página de cambios numerados después de `position` y hasta la secuencia de `state`."""
+    entries = SyncChange.objects.filter(user=user, seq__lte=state.seq)
+    after = Q(seq__gt=position['seq'])
+    if position['id'] is not None:
+        after |= Q(seq=position['seq'], id__gt=position['id'])
+    entries = list(
+        entries.filter(after).order_by('seq', 'id').values(
+            'id', 'seq', 'collection', 'object_id', 'deleted'
+        )[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    payload = {'has_more': has_more, 'profile': None}
+    # Ids cambiados de cada colección en el orden de los cambios
+    changed_ids = {name: {} for name in SYNC_COLLECTIONS}
+    deleted_ids = {name: [] for name in SYNC_COLLECTIONS}
+    for entry in entries:
+        if entry['collection'] not in SYNC_COLLECTIONS:
+            continue
+        if entry['deleted']:
+            deleted_ids[entry['collection']].append(entry['object_id'])
+        else:
+            changed_ids[entry['collection']][entry['object_id']] = None
+
+    if changed_ids.pop(COLLECTION_PROFILE):
+        payload['profile'] = _profile(user).first()
+    deleted_ids.pop(COLLECTION_PROFILE)
+
+    for name, ids in changed_ids.items():
+        changed = []
+        deleted = deleted_ids[name]
+        rows = {row['id']: row for row in SYNC_COLLECTIONS[name](user).filter(id__in=ids)} if ids else {}
+        for object_id in ids:
+            row = rows.get(object_id)
+            # Registros que ya no existen (o ya no son del usuario)
+            if row is None or not row.pop('is_active'):
+                deleted.append(object_id)
+            else:
+                changed.append(row)
+        payload[name] = {'changed': changed, 'deleted': deleted}
+
+    if has_more:
+        payload['cursor'] = encode_cursor({'seq': entries[-1]['seq'], 'id': entries[-1]['id']})
+    else:
+        payload['cursor'] = encode_cursor({'seq': state.seq, 'id': None})
+    return payload
+
+
+def sync_changes(user, cursor=None, limit=SYNC_BATCH_SIZE):
+    """
+    Cambios del usuario desde `cursor` (todo, si no se indica).
+
+    Returns:
+        Dict con el perfil, los registros cambiados y eliminados de cada
+        colección, el cursor siguiente y si quedan más cambios por pedir
+    """
+    position = decode_cursor(cursor) if cursor else None
+    state = number_changes(user.id)
+
+    # Sin cursor, anterior a los eliminados purgados o de una secuencia que
+    # el servidor no conoce (p. ej. base restaurada): copia completa
+    full = (
+        position is None
+        or position['seq'] < state.purged_seq
+        or position['seq'] > state.seq
+    )
+    if full:
+        payload = _snapshot_payload(user, state.seq, {}, limit)
+    elif 'full' in position:
+        # Páginas siguientes de una copia completa: completan, no reemplazan
+        payload = _snapshot_payload(user, position['seq'], position['full'], limit)
+    else:
+        payload = _changes_payload(user, state, position, limit)
+    payload['full'] = full
+    return payload
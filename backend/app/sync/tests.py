@@ -0,0 +1,132 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from app.meals.models import M_Meal
+from app.social.models import Friendship
+from .models import SyncChange
+from .sync import TOMBSTONE_RETENTION, encode_cursor, sync_changes
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class SyncChangesTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='ana', password='x')
+        self.friend = User.objects.create_user(username='beto', password='x', first_name='Beto')
+
+    def meal(self, description='Arroz'):
+        return M_Meal.objects.create(
+            user=self.user, meal_type='lunch', description=description,
+            ingredients={'rice': 0.2}, meal_date=date(2025, 3, 4)
+        )
+
+    def changed_ids(self, payload, collection):
+        return [row['id'] for row in payload[collection]['changed']]
+
+    def test_full_sync_then_changes(self):
+        kept, removed = self.meal(), self.meal()
+        removed.soft_delete()
+
+        first = sync_changes(self.user)
+        self.assertTrue(first['full'])
+        self.assertEqual(self.changed_ids(first, 'meals'), [kept.id])
+
+        added = self.meal()
+        kept.soft_delete()
+        second = sync_changes(self.user, first['cursor'])
+        self.assertFalse(second['full'])
+        self.assertEqual(self.changed_ids(second, 'meals'), [added.id])
+        self.assertEqual(second['meals']['deleted'], [kept.id])
+
+        self.assertEqual(self.changed_ids(sync_changes(self.user, second['cursor']), 'meals'), [])
+
+    def test_pages_follow_the_cursor(self):
+        meals = [self.meal(f'Comida {i}') for i in range(5)]
+        seen, cursor, pages = [], None, 0
+        while True:
+            payload = sync_changes(self.user, cursor, limit=2)
+            seen += self.changed_ids(payload, 'meals')
+            cursor, pages = payload['cursor'], pages + 1
+            if not payload['has_more']:
+                break
+        self.assertEqual(seen, [meal.id for meal in meals])
+        self.assertEqual(pages, 3)
+
+        more = [self.meal(f'Nueva {i}') for i in range(3)]
+        first = sync_changes(self.user, cursor, limit=2)
+        second = sync_changes(self.user, first['cursor'], limit=2)
+        self.assertTrue(first['has_more'])
+        self.assertEqual(
+            self.changed_ids(first, 'meals') + self.changed_ids(second, 'meals'),
+            [meal.id for meal in more]
+        )
+
+    def test_change_committed_after_a_sync_is_not_skipped(self):
+        cursor = sync_changes(self.user)['cursor']
+        self.meal('Antes')
+        cursor = sync_changes(self.user, cursor)['cursor']
+
+        # Una transacción larga: su updated_at quedó antes de la última
+        # sincronización pero recién ahora se confirma
+        late = self.meal('Tarde')
+        M_Meal.objects.filter(pk=late.pk).update(updated_at=timezone.now() - timedelta(minutes=30))
+
+        self.assertEqual(self.changed_ids(sync_changes(self.user, cursor), 'meals'), [late.id])
+
+    def test_changes_are_numbered_when_read(self):
+        cursor = sync_changes(self.user)['cursor']
+        meal = self.meal()
+        self.assertTrue(SyncChange.objects.filter(object_id=meal.id, seq__isnull=True).exists())
+        payload = sync_changes(self.user, cursor)
+        self.assertEqual(self.changed_ids(payload, 'meals'), [meal.id])
+        self.assertFalse(SyncChange.objects.filter(seq__isnull=True).exists())
+
+    def test_deleted_friendship_reaches_both_users(self):
+        friendship = Friendship.objects.create(from_user=self.user, to_user=self.friend)
+        cursors = {user.id: sync_changes(user)['cursor'] for user in (self.user, self.friend)}
+        friendship_id = friendship.id
+        friendship.delete()
+
+        for user in (self.user, self.friend):
+            payload = sync_changes(user, cursors[user.id])
+            self.assertEqual(payload['friendships']['deleted'], [friendship_id])
+
+    def test_rename_resends_friendships_to_the_friend(self):
+        friendship = Friendship.objects.create(from_user=self.user, to_user=self.friend)
+        cursor = sync_changes(self.friend)['cursor']
+
+        self.user.first_name = 'Ana María'
+        self.user.save()
+
+        rows = sync_changes(self.friend, cursor)['friendships']['changed']
+        self.assertEqual([(row['id'], row['friend_first_name']) for row in rows], [(friendship.id, 'Ana María')])
+
+    def test_purged_deletions_force_a_full_sync(self):
+        friendship = Friendship.objects.create(from_user=self.user, to_user=self.friend)
+        cursor = sync_changes(self.user)['cursor']
+        friendship.delete()
+        after_delete = sync_changes(self.user, cursor)['cursor']
+        SyncChange.objects.filter(deleted=True).update(changed_at=timezone.now() - TOMBSTONE_RETENTION * 2)
+
+        call_command('purge_sync_tombstones', stdout=StringIO())
+
+        self.assertTrue(sync_changes(self.user, cursor)['full'])
+        self.assertFalse(sync_changes(self.user, after_delete)['full'])
+
+    def test_cursor_validation(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        self.assertEqual(client.get('/api/sync/', {'since': 'garbage'}).status_code, 400)
+        self.assertEqual(client.get('/api/sync/', {'since': encode_cursor({'seq': 'x', 'id': None})}).status_code, 400)
+        # Un cursor de antes de la secuencia de cambios, o de una secuencia
+        # que el servidor no conoce, empieza de cero
+        old = encode_cursor({'meals': [timezone.now().isoformat(), 1]})
+        self.assertTrue(client.get('/api/sync/', {'since': old}).json()['full'])
+        self.assertTrue(client.get('/api/sync/', {'since': encode_cursor({'seq': 99, 'id': None})}).json()['full'])
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import V_Sync
+
+urlpatterns = [
+    path('', V_Sync.as_view(), name='sync'),
+]
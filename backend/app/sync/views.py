@@ -0,0 +1,23 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework import status
+from core.utils import InvalidCursor
+from .sync import sync_changes
+
+
+class V_Sync(APIView):
+    """
+    GET /api/sync/?since=<cursor>
+    Cambios del usuario desde el cursor de la sincronización anterior
+    (todo, sin cursor). Si `has_more` es true se vuelve a pedir con el
+    cursor recibido; si `full` es true el cliente reemplaza sus datos locales.
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request):
+        try:
+            payload = sync_changes(request.user, request.query_params.get('since') or None)
+        except InvalidCursor as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(payload)
@@ -0,0 +1,291 @@
+"""
+Importación masiva de viajes desde CSV o GPX.
+Los parsers son generadores que leen el archivo de forma incremental y
+el importador inserta en lotes de tamaño fijo, de modo que la memoria
+no crece con el tamaño del historial importado.
+"""
+import csv
+import math
+import xml.etree.ElementTree as ET
+from datetime import date, datetime
+from django.db import transaction
+from app.transport.models import M_Transport
+from app.transport.serializers.SZ_Transport import transport_points
+from app.users.points import REASON_TRANSPORT, apply_activity, ledger_entry, record_transactions
+from core.cache import bump_user_version
+from core.utils import CarbonCalculator
+
+
+# Sinónimos usados por otras apps de seguimiento
+TRANSPORT_ALIASES = {
+    'bicycle': 'bike',
+    'biking': 'bike',
+    'cycling': 'bike',
+    'walking': 'walk',
+    'running': 'walk',
+    'hiking': 'walk',
+    'driving': 'car',
+    'flight': 'plane',
+    'flying': 'plane',
+    'subway': 'metro',
+    'motorbike': 'motorcycle',
+}
+
+VALID_TRANSPORT_TYPES = {choice for choice, _ in M_Transport.TRANSPORT_CHOICES}
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Ningún viaje supera media vuelta al mundo; más es un dato corrupto
+MAX_DISTANCE_KM = 20000
+
+# Máximo de errores de fila detallados en el resumen
+MAX_REPORTED_ERRORS = 50
+
+
+class TripImportError(ValueError):
+    """Error en una fila o pista del archivo importado."""
+
+    def __init__(self, position, message):
+        super().__init__(f'{position}: {message}')
+        self.position = position
+        self.message = message
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> float:
+    """Distancia en km entre dos coordenadas."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def normalize_transport_type(value) -> str:
+    transport_type = (value or '').strip().lower().replace(' ', '_')
+    return TRANSPORT_ALIASES.get(transport_type, transport_type)
+
+
+def parse_trip_date(value) -> date:
+    value = (value or '').strip()
+    if not value:
+        raise ValueError('fecha vacía')
+    if len(value) == 10:
+        return date.fromisoformat(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).date()
+
+
+def iter_csv_trips(stream):
+    """
+    Genera viajes desde un CSV con encabezados.
+
+    Columnas: transport_type, trip_date y distance_km, o bien
+    start_lat/start_lon/end_lat/end_lon para derivar la distancia.
+    origin y destination son opcionales. Las filas inválidas se generan
+    como TripImportError para que el importador las reporte.
+    """
+    reader = csv.DictReader(stream)
+    for line, row in enumerate(reader, start=2):
+        try:
+            distance = (row.get('distance_km') or '').strip()
+            if distance:
+                distance_km = float(distance)
+            else:
+                distance_km = haversine_km(
+                    float(row['start_lat']), float(row['start_lon']),
+                    float(row['end_lat']), float(row['end_lon'])
+                )
+            yield {
+                'transport_type': normalize_transport_type(row.get('transport_type')),
+                'distance_km': distance_km,
+                'trip_date': parse_trip_date(row.get('trip_date')),
+                'origin': (row.get('origin') or '').strip()[:255],
+                'destination': (row.get('destination') or '').strip()[:255],
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            yield TripImportError(f'línea {line}', str(e) or 'fila inválida')
+
+
+def _local_name(tag) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_gpx_trips(stream, default_type='walk'):
+    """
+    Genera un viaje por cada <trk> de un archivo GPX.
+
+    La distancia es la suma de tramos entre <trkpt> consecutivos, la
+    fecha sale del primer <time> y el tipo de <type> (o `default_type`).
+    Usa iterparse y quita cada punto de su <trkseg> al procesarlo, así
+    que la memoria no depende de la cantidad de puntos.
+    """
+    # Elementos abiertos: el anterior a cada uno es su padre
+    open_elements = []
+    track = None
+    track_number = 0
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        tag = _local_name(element.tag)
+
+        if event == 'start':
+            open_elements.append(element)
+            if tag == 'trk':
+                track_number += 1
+                track = {'name': '', 'type': '', 'time': None, 'last': None, 'distance': 0.0}
+            continue
+
+        open_elements.pop()
+        if track is None:
+            continue
+
+        if tag == 'trkpt':
+            try:
+                point = (float(element.get('lat')), float(element.get('lon')))
+            except (TypeError, ValueError):
+                point = None
+            if point is not None:
+                if track['last'] is not None:
+                    track['distance'] += haversine_km(*track['last'], *point)
+                track['last'] = point
+            open_elements[-1].remove(element)
+        elif tag == 'time' and track['time'] is None:
+            track['time'] = element.text
+        elif tag in ('name', 'type') and not track[tag]:
+            track[tag] = (element.text or '').strip()
+        elif tag == 'trk':
+            try:
+                yield {
+                    'transport_type': normalize_transport_type(track['type'] or default_type),
+                    'distance_km': round(track['distance'], 3),
+                    'trip_date': parse_trip_date(track['time']),
+                    'origin': track['name'][:255],
+                    'destination': '',
+                }
+            except (TypeError, ValueError) as e:
+                yield TripImportError(f'pista {track_number}', str(e) or 'pista inválida')
+            track = None
+            # Soltar las pistas ya procesadas
+            if open_elements:
+                open_elements[0].clear()
+
+
+class TripImporter:
+    """
+    Inserta viajes en lotes de `chunk_size` con bulk_create.
+
+    Cada lote actualiza los acumulados diarios en su propia transacción.
+    Puntos, racha y caché se aplican una sola vez al terminar, y se encola
+    una única evaluación de logros.
+    """
+
+    def __init__(self, user, chunk_size=500):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.created = 0
+        self.skipped = 0
+        self.total_co2 = 0.0
+        self.points = 0
+        self.trip_dates = set()
+        self.errors = []
+
+    def _error(self, error):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(str(error))
+
+    def _build(self, trip):
+        if trip['transport_type'] not in VALID_TRANSPORT_TYPES:
+            raise ValueError(f"tipo de transporte desconocido '{trip['transport_type']}'")
+        if not math.isfinite(trip['distance_km']):
+            raise ValueError('distancia inválida')
+        if not 0.1 <= trip['distance_km'] <= MAX_DISTANCE_KM:
+            raise ValueError(f'la distancia debe estar entre 0.1 y {MAX_DISTANCE_KM} km')
+
+        return M_Transport(user=self.user, **trip)
+
+    def _flush(self, chunk):
+        from app.dashboard.rollups import track_bulk_activities
+        from app.sync.sync import COLLECTION_TRANSPORTS, record_changes
+        from app.users.stats import track_bulk_stats
+
+        emissions = CarbonCalculator.calculate_transport_emissions_batch(
+            (transport.transport_type, transport.distance_km) for transport in chunk
+        )
+        for transport, total_co2 in zip(chunk, emissions):
+            transport.total_co2 = total_co2
+
+        with transaction.atomic():
+            M_Transport.objects.bulk_create(chunk)
+            record_changes(COLLECTION_TRANSPORTS, [(self.user.id, transport.pk) for transport in chunk])
+            track_bulk_activities(
+                self.user.id,
+                'transport',
+                [transport.rollup_state() for transport in chunk]
+            )
+            track_bulk_stats(
+                self.user.id,
+                'transport',
+                [transport.stats_state() for transport in chunk]
+            )
+
+            # Un movimiento de puntos por viaje; el total se suma al terminar
+            record_transactions([
+                ledger_entry(self.user.id, transport_points(transport), REASON_TRANSPORT, transport)
+                for transport in chunk
+            ])
+
+        self.created += len(chunk)
+        for transport in chunk:
+            self.total_co2 += transport.total_co2
+            self.points += transport_points(transport)
+            self.trip_dates.add(transport.trip_date)
+
+    def _finish(self):
+        from app.social.achievement_queue import enqueue_achievement_evaluation
+        from app.social.achievements import TRIP_LOGGED
+
+        if not self.created:
+            return
+
+        with transaction.atomic():
+            bump_user_version(self.user.id)
+            # Los movimientos ya se registraron por lote; puntos, nivel y racha
+            # con un solo UPDATE (las fechas anteriores a la última actividad no cuentan)
+            apply_activity(self.user.id, self.points, self.trip_dates)
+            enqueue_achievement_evaluation(self.user.id, TRIP_LOGGED)
+
+    def run(self, trips):
+        """
+        Importa los viajes generados por un parser.
+
+        Returns:
+            Dict con created, skipped, total_co2 y errors
+        """
+        chunk = []
+        position = 0
+        try:
+            for position, trip in enumerate(trips, start=1):
+                if isinstance(trip, TripImportError):
+                    self._error(trip)
+                    continue
+                try:
+                    chunk.append(self._build(trip))
+                except ValueError as e:
+                    self._error(TripImportError(f'registro {position}', str(e)))
+                    continue
+
+                if len(chunk) >= self.chunk_size:
+                    self._flush(chunk)
+                    chunk = []
+        except (csv.Error, ET.ParseError, UnicodeDecodeError) as e:
+            # Archivo corrupto: se conserva lo leído hasta ese punto
+            self.errors.append(str(TripImportError(f'después del registro {position}', f'archivo inválido ({e})')))
+
+        if chunk:
+            self._flush(chunk)
+        self._finish()
+
+        return {
+            'created': self.created,
+            'skipped': self.skipped,
+            'total_co2': round(self.total_co2, 3),
+            'errors': self.errors,
+        }
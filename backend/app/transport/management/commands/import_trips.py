@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from app.social.achievement_queue import process_pending_jobs
+from app.transport.importers import TripImporter, iter_csv_trips, iter_gpx_trips
+
+
+class Command(BaseCommand):
+    help = 'Importar viajes de un usuario desde un archivo CSV o GPX'
+
+    def add_arguments(self, parser):
+        parser.add_argument('user', help='Nombre de usuario o ID')
+        parser.add_argument('path', help='Ruta del archivo a importar')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'gpx'],
+            help='Formato del archivo (por defecto se deduce de la extensión)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Viajes insertados por lote'
+        )
+
+    def handle(self, *args, **options):
+        user = self._get_user(options['user'])
+        path = options['path']
+        file_format = options['format'] or path.rsplit('.', 1)[-1].lower()
+        if file_format not in ('csv', 'gpx'):
+            raise CommandError('Formato no soportado. Usa --format csv o --format gpx.')
+
+        self.stdout.write(f'Importando viajes de {user.username}...')
+
+        importer = TripImporter(user, chunk_size=options['chunk_size'])
+        try:
+            if file_format == 'csv':
+                with open(path, encoding='utf-8-sig', newline='') as stream:
+                    summary = importer.run(iter_csv_trips(stream))
+            else:
+                with open(path, 'rb') as stream:
+                    summary = importer.run(iter_gpx_trips(stream))
+        except OSError as e:
+            raise CommandError(f'No se pudo leer el archivo: {e}')
+
+        # Este proceso termina enseguida: evaluar aquí los logros encolados
+        process_pending_jobs(user_ids=[user.id])
+
+        for error in summary['errors']:
+            self.stdout.write(self.style.WARNING(f'  - {error}'))
+
+        self.stdout.write(self.style.SUCCESS(f'\n✓ Proceso completado:'))
+        self.stdout.write(self.style.SUCCESS(f'  - {summary["created"]} viajes importados'))
+        self.stdout.write(self.style.SUCCESS(f'  - {summary["skipped"]} registros omitidos'))
+        self.stdout.write(self.style.SUCCESS(f'  - {summary["total_co2"]} kg CO2'))
+
+    def _get_user(self, value):
+        lookup = {'id': int(value)} if value.isdigit() else {'username': value}
+        try:
+            return User.objects.get(**lookup)
+        except User.DoesNotExist:
+            raise CommandError(f'Usuario no encontrado: {value}')
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transport', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='m_transport',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='transport_m_user_id_c248a0_idx'),
+        ),
+    ]
@@ -1,6 +1,7 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from core.cache import bump_user_version
 from core.models import M_BaseModel
 from core.utils import CarbonCalculator, TRANSPORT_EMISSIONS
 
@@ -19,6 +20,10 @@ class M_Transport(M_BaseModel):
         ('plane', 'Avión'),
     ]
     
+    # Transportes sin emisiones directas: cuentan para eco_transport_count
+    # (contadores y logros de transporte ecológico)
+    ECO_TRANSPORT_TYPES = ('bike', 'walk', 'scooter')
+    
     user = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -66,6 +71,8 @@ class M_Transport(M_BaseModel):
         ordering = ['-trip_date', '-created_at']
         indexes = [
             models.Index(fields=['user', '-trip_date']),
+            # Sincronización incremental (app.sync)
+            models.Index(fields=['user', 'updated_at', 'id']),
         ]
 
     def __str__(self):
@@ -79,15 +86,49 @@ class M_Transport(M_BaseModel):
             )
         
         is_new = self.pk is None
-        super().save(*args, **kwargs)
-        
-        # Verificar logros después de crear un transporte
-        if is_new:
-            try:
-                from app.social.models import UserAchievement
-                UserAchievement.check_and_unlock_achievements(self.user)
-            except:
-                pass
+        with transaction.atomic():
+            # Estado anterior leído con la fila bloqueada: dos guardados
+            # concurrentes no pueden descontar dos veces el mismo estado
+            previous = None
+            if not is_new:
+                previous = M_Transport.objects.select_for_update().filter(pk=self.pk).values(
+                    'is_active', 'trip_date', 'total_co2', 'transport_type'
+                ).first()
+            
+            super().save(*args, **kwargs)
+            
+            # Mantener el acumulado diario de emisiones y los contadores
+            from app.dashboard.rollups import track_activity_change
+            from app.users.stats import track_stats_change
+            before = None
+            stats_before = None
+            if previous and previous['is_active']:
+                before = (previous['trip_date'], previous['total_co2'])
+                stats_before = (previous['transport_type'], previous['total_co2'])
+            track_activity_change(self.user_id, 'transport', before, self.rollup_state())
+            track_stats_change(self.user_id, 'transport', stats_before, self.stats_state())
+            bump_user_version(self.user_id)
+            
+            from app.sync.sync import COLLECTION_TRANSPORTS, record_changes
+            record_changes(COLLECTION_TRANSPORTS, [(self.user_id, self.pk)])
+            
+            # Los logros se evalúan fuera del request
+            if is_new:
+                from app.social.achievement_queue import enqueue_achievement_evaluation
+                from app.social.achievements import TRIP_LOGGED
+                enqueue_achievement_evaluation(self.user_id, TRIP_LOGGED)
+
+    def rollup_state(self):
+        """Fecha y CO2 con que el viaje cuenta en el acumulado diario."""
+        if not self.is_active:
+            return None
+        return (self.trip_date, self.total_co2)
+
+    def stats_state(self):
+        """Tipo y CO2 con que el viaje cuenta en los contadores del usuario."""
+        if not self.is_active:
+            return None
+        return (self.transport_type, self.total_co2)
 
     def is_sustainable(self):
         return CarbonCalculator.is_sustainable_choice('transport', self.transport_type)
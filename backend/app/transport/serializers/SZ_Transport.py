@@ -2,11 +2,24 @@
 Serializers para transporte.
 """
 from rest_framework import serializers
+from django.db import transaction
 from app.transport.models import M_Transport
+from app.users.points import REASON_TRANSPORT, award_points
 from core.utils import SUSTAINABILITY_POINTS
 from datetime import date
 
 
+def transport_points(transport):
+    """Puntos por registrar un viaje, con bonus por transporte activo."""
+    points = SUSTAINABILITY_POINTS['log_transport']
+    
+    if transport.is_sustainable():
+        if transport.transport_type in ['bike', 'walk']:
+            points += SUSTAINABILITY_POINTS.get('bike_used', 30)
+    
+    return points
+
+
 class SZ_TransportCreate(serializers.ModelSerializer):
     
     class Meta:
@@ -23,20 +36,17 @@ class SZ_TransportCreate(serializers.ModelSerializer):
         # Asignar usuario actual
         validated_data['user'] = self.context['request'].user
         
-        # El CO2 se calcula automáticamente en el modelo
-        transport = M_Transport.objects.create(**validated_data)
-        
-        # Dar puntos al usuario
-        user_profile = transport.user.profile
-        points = SUSTAINABILITY_POINTS['log_transport']
-        
-        # Bonus por transporte sostenible
-        if transport.is_sustainable():
-            if transport.transport_type in ['bike', 'walk']:
-                points += SUSTAINABILITY_POINTS.get('bike_used', 30)
-        
-        user_profile.add_points(points)
-        user_profile.update_streak(transport.trip_date)
+        # Los logros encolados se evalúan con puntos y racha ya guardados
+        with transaction.atomic():
+            # El CO2 se calcula automáticamente en el modelo
+            transport = M_Transport.objects.create(**validated_data)
+            
+            # Puntos, nivel y racha con un solo UPDATE del perfil
+            award_points(
+                transport.user_id,
+                [(transport_points(transport), REASON_TRANSPORT, transport)],
+                [transport.trip_date]
+            )
         
         return transport
 
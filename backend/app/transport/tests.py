@@ -1,3 +1,98 @@
-from django.test import TestCase
+import math
+import xml.etree.ElementTree as ET
+from datetime import date
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from app.social.achievements import TRIP_LOGGED, AchievementEvaluator
+from app.social.models import Achievement
+from app.users.models import M_UserProfile
+from app.users.stats import compute_user_stats, get_user_stats
+from .importers import TripImporter, iter_csv_trips, iter_gpx_trips
+from .models import M_Transport
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class EcoTransportTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='ana', password='x')
+        M_UserProfile.objects.create(user=self.user)
+
+    def trip(self, transport_type):
+        return M_Transport.objects.create(
+            user=self.user, transport_type=transport_type, distance_km=3, trip_date=date(2025, 3, 4)
+        )
+
+    def test_eco_types_are_transport_choices(self):
+        choices = {key for key, _ in M_Transport.TRANSPORT_CHOICES}
+        self.assertTrue(set(M_Transport.ECO_TRANSPORT_TYPES) <= choices)
+
+    def test_eco_trips_are_counted_and_unlock_achievements(self):
+        achievement = Achievement.objects.create(
+            name='Ciclista', description='3 viajes ecológicos', category='transport',
+            requirement_type='eco_transport_count', requirement_value=3, points=50
+        )
+        for transport_type in ('bike', 'walk', 'car', 'scooter'):
+            self.trip(transport_type)
+
+        self.assertEqual(get_user_stats(self.user.id).eco_transport_count, 3)
+        self.assertEqual(compute_user_stats([self.user.id])[self.user.id]['eco_transport_count'], 3)
+
+        unlocked = AchievementEvaluator(self.user).evaluate(TRIP_LOGGED)
+        self.assertEqual([user_achievement.achievement_id for user_achievement in unlocked], [achievement.id])
+
+
+GPX = b"""<?xml version="1.0"?>
+<gpx xmlns="http://www.topografix.com/GPX/1/1">
+  <trk>
+    <name>Parque</name>
+    <type>cycling</type>
+    <trkseg>
+      <trkpt lat="0" lon="0"><time>2025-03-04T08:00:00Z</time></trkpt>
+      <trkpt lat="0" lon="0.01"><time>2025-03-04T08:05:00Z</time></trkpt>
+      <trkpt lat="0" lon="0.02"><time>2025-03-04T08:10:00Z</time></trkpt>
+    </trkseg>
+  </trk>
+</gpx>
+"""
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class TripImportTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='ana', password='x')
+        M_UserProfile.objects.create(user=self.user)
+
+    def test_rejects_non_finite_and_huge_distances(self):
+        rows = 'transport_type,trip_date,distance_km\n' + ''.join(
+            f'car,2025-01-01,{distance}\n' for distance in ('inf', 'nan', '-inf', '1e9', '12.5')
+        )
+        summary = TripImporter(self.user).run(iter_csv_trips(StringIO(rows)))
+
+        self.assertEqual((summary['created'], summary['skipped']), (1, 4))
+        self.assertEqual(list(M_Transport.objects.values_list('distance_km', flat=True)), [12.5])
+        self.assertTrue(math.isfinite(summary['total_co2']))
+
+    def test_gpx_points_are_released_before_the_track_ends(self):
+        segment_sizes = []
+        iterparse = ET.iterparse
+
+        def spy(*args, **kwargs):
+            for event, element in iterparse(*args, **kwargs):
+                if event == 'end' and element.tag.endswith('trkseg'):
+                    segment_sizes.append(len(element))
+                yield event, element
+
+        with mock.patch.object(ET, 'iterparse', spy):
+            trips = list(iter_gpx_trips(BytesIO(GPX)))
+
+        self.assertEqual(segment_sizes, [0])
+        self.assertEqual(len(trips), 1)
+        self.assertEqual(trips[0]['transport_type'], 'bike')
+        self.assertEqual(trips[0]['trip_date'], date(2025, 3, 4))
+        self.assertAlmostEqual(trips[0]['distance_km'], 2.224, places=2)
@@ -1,17 +1,28 @@
 """
 Vistas para gestión de transporte.
 """
+import io
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, parser_classes
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
+from django.views.decorators.http import condition
 from app.transport.models import M_Transport
+from app.transport.importers import TripImporter, iter_csv_trips, iter_gpx_trips
 from app.transport.serializers import SZ_Transport, SZ_TransportCreate, SZ_TransportList
+from core.utils import InvalidCursor, KeysetPaginator, build_etag, queryset_fingerprint
+
+
+def _transport_list_etag(request):
+    transports = M_Transport.objects.filter(user=request.user)
+    return build_etag('transports', request.user.id, request.get_full_path(), queryset_fingerprint(transports))
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@condition(etag_func=_transport_list_etag)
 def V_TransportList(request):
     transports = M_Transport.objects.filter(user=request.user, is_active=True)
     
@@ -25,12 +36,22 @@ def V_TransportList(request):
     if transport_type:
         transports = transports.filter(transport_type=transport_type)
     
-    serializer = SZ_TransportList(transports, many=True)
+    # Paginación por cursor sobre (user, -trip_date)
+    try:
+        page, next_cursor, count = KeysetPaginator(transports, 'trip_date').paginate(request.query_params)
+    except InvalidCursor as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
-    return Response({
-        'count': transports.count(),
-        'transports': serializer.data
-    }, status=status.HTTP_200_OK)
+    serializer = SZ_TransportList(page, many=True)
+    
+    data = {
+        'transports': serializer.data,
+        'next_cursor': next_cursor,
+    }
+    if count is not None:
+        data['count'] = count
+    
+    return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -57,6 +78,47 @@ def V_TransportCreate(request):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+@parser_classes([MultiPartParser])
+def V_TransportImport(request):
+    """
+    Importar viajes desde un archivo CSV o GPX.
+    
+    POST /api/transport/import/
+    Campos: file, format (csv|gpx, opcional: se deduce de la extensión)
+    """
+    upload = request.FILES.get('file')
+    if upload is None:
+        return Response({
+            'error': 'Debes adjuntar un archivo en el campo "file".'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    file_format = (request.data.get('format') or upload.name.rsplit('.', 1)[-1]).lower()
+    
+    if file_format == 'csv':
+        trips = iter_csv_trips(io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline=''))
+    elif file_format == 'gpx':
+        trips = iter_gpx_trips(upload.file)
+    else:
+        return Response({
+            'error': 'Formato no soportado. Usa csv o gpx.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    summary = TripImporter(request.user).run(trips)
+    
+    if not summary['created']:
+        return Response({
+            'error': 'No se importó ningún viaje.',
+            **summary
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    return Response({
+        'message': f'¡{summary["created"]} viajes importados exitosamente!',
+        **summary
+    }, status=status.HTTP_201_CREATED)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def V_TransportDetail(request, transport_id):
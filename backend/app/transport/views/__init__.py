@@ -1,3 +1,3 @@
-from .V_Transport import V_TransportList, V_TransportCreate, V_TransportDetail, V_TransportDelete
+from .V_Transport import V_TransportList, V_TransportCreate, V_TransportImport, V_TransportDetail, V_TransportDelete
 
-__all__ = ['V_TransportList', 'V_TransportCreate', 'V_TransportDetail', 'V_TransportDelete']
+__all__ = ['V_TransportList', 'V_TransportCreate', 'V_TransportImport', 'V_TransportDetail', 'V_TransportDelete']
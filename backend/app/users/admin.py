@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import M_UserProfile
+from .models import M_PointsSummary, M_PointsTransaction, M_UserProfile, M_UserStats
 
 
 @admin.register(M_UserProfile)
@@ -8,3 +8,25 @@ class UserProfileAdmin(admin.ModelAdmin):
     list_filter = ('level', 'is_active', 'notifications_enabled')
     search_fields = ('user__username', 'user__email')
     ordering = ('-total_points',)
+
+
+@admin.register(M_UserStats)
+class UserStatsAdmin(admin.ModelAdmin):
+    list_display = ('user', 'meal_count', 'transport_count', 'friend_count', 'updated_at')
+    search_fields = ('user__username', 'user__email')
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(M_PointsTransaction)
+class PointsTransactionAdmin(admin.ModelAdmin):
+    list_display = ('user', 'amount', 'reason', 'source_type', 'source_id', 'created_at')
+    list_filter = ('reason',)
+    search_fields = ('user__username',)
+    readonly_fields = ('created_at',)
+
+
+@admin.register(M_PointsSummary)
+class PointsSummaryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'period', 'reason', 'amount', 'transaction_count')
+    list_filter = ('reason', 'period')
+    search_fields = ('user__username',)
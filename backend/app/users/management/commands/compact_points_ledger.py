@@ -0,0 +1,39 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from app.users.points import compact_ledger
+
+
+class Command(BaseCommand):
+    help = 'Compactar los movimientos de puntos antiguos en resúmenes mensuales'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Compactar movimientos con más de estos días'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Movimientos compactados por transacción'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 0 or options['chunk_size'] < 1:
+            raise CommandError('--days debe ser >= 0 y --chunk-size mayor que 0')
+
+        before = timezone.now() - timedelta(days=options['days'])
+        self.stdout.write(f'Compactando movimientos anteriores a {before:%Y-%m-%d}...')
+
+        total = 0
+        while True:
+            compacted = compact_ledger(before, options['chunk_size'])
+            if not compacted:
+                break
+            total += compacted
+            self.stdout.write(f'  - {total} movimientos compactados')
+
+        self.stdout.write(self.style.SUCCESS(f'\n✓ {total} movimientos compactados'))
@@ -0,0 +1,108 @@
+from django.core.management.base import BaseCommand
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from app.users.models import M_UserStats
+from app.users.stats import STAT_FIELDS, compute_user_stats
+
+
+# Tolerancia para diferencias de redondeo acumuladas en los totales de CO2
+CO2_TOLERANCE = 1e-6
+
+
+class Command(BaseCommand):
+    help = 'Recalcular o verificar los contadores por usuario desde las tablas de origen'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Solo reportar diferencias, sin modificar la base de datos'
+        )
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='ID de usuario a procesar (se puede repetir)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Usuarios procesados por lote'
+        )
+
+    def handle(self, *args, **options):
+        verify = options['verify']
+        chunk_size = options['chunk_size']
+
+        user_ids = options['user_ids'] or list(
+            User.objects.order_by('id').values_list('id', flat=True)
+        )
+
+        self.stdout.write(
+            'Verificando contadores...' if verify else 'Reconciliando contadores...'
+        )
+
+        drift_count = 0
+        created_count = 0
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            expected = compute_user_stats(chunk)
+            current = {
+                stats.user_id: stats
+                for stats in M_UserStats.objects.filter(user_id__in=chunk)
+            }
+
+            missing = [user_id for user_id in chunk if user_id not in current]
+            drifted = []
+            for user_id, stats in current.items():
+                fields = self._diff(expected[user_id], stats)
+                if fields:
+                    drifted.append(stats)
+                    self.stdout.write(self.style.WARNING(
+                        f'  - Usuario {user_id}: ' + ', '.join(
+                            f'{field} {getattr(stats, field)} -> {expected[user_id][field]}'
+                            for field in fields
+                        )
+                    ))
+            drift_count += len(drifted)
+            created_count += len(missing)
+
+            if not verify and (drifted or missing):
+                self._write(expected, drifted, missing)
+
+        if verify:
+            style = self.style.SUCCESS if not (drift_count or created_count) else self.style.ERROR
+            self.stdout.write(style(f'\n✓ {drift_count} usuarios con diferencias'))
+            self.stdout.write(style(f'  - {created_count} usuarios sin contadores'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'\n✓ Proceso completado:'))
+            self.stdout.write(self.style.SUCCESS(f'  - {drift_count} usuarios corregidos'))
+            self.stdout.write(self.style.SUCCESS(f'  - {created_count} contadores creados'))
+
+    def _diff(self, expected, stats):
+        fields = []
+        for field in STAT_FIELDS:
+            current_value = getattr(stats, field)
+            if field.endswith('_co2'):
+                if abs(expected[field] - current_value) > CO2_TOLERANCE:
+                    fields.append(field)
+            elif expected[field] != current_value:
+                fields.append(field)
+        return fields
+
+    @transaction.atomic
+    def _write(self, expected, drifted, missing):
+        now = timezone.now()
+        for stats in drifted:
+            for field in STAT_FIELDS:
+                setattr(stats, field, expected[stats.user_id][field])
+            stats.updated_at = now
+        M_UserStats.objects.bulk_update(drifted, [*STAT_FIELDS, 'updated_at'], batch_size=1000)
+        M_UserStats.objects.bulk_create(
+            [M_UserStats(user_id=user_id, **expected[user_id]) for user_id in missing],
+            batch_size=1000,
+            ignore_conflicts=True
+        )
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+# M_Transport.ECO_TRANSPORT_TYPES al crear la migración
+ECO_TRANSPORT_TYPES = ['bike', 'walk', 'scooter']
+
+
+def backfill_user_stats(apps, schema_editor):
+    User = apps.get_model('auth', 'User')
+    Meal = apps.get_model('meals', 'M_Meal')
+    Transport = apps.get_model('transport', 'M_Transport')
+    Friendship = apps.get_model('social', 'Friendship')
+    UserStats = apps.get_model('users', 'M_UserStats')
+
+    stats = {user_id: {} for user_id in User.objects.values_list('id', flat=True)}
+
+    meals = Meal.objects.filter(is_active=True).order_by().values('user_id').annotate(
+        meal_count=Count('id'),
+        vegan_meal_count=Count('id', filter=Q(is_vegan=True)),
+        vegetarian_meal_count=Count('id', filter=Q(is_vegetarian=True)),
+        meals_co2=Sum('total_co2'),
+    )
+    transports = Transport.objects.filter(is_active=True).order_by().values('user_id').annotate(
+        transport_count=Count('id'),
+        eco_transport_count=Count('id', filter=Q(transport_type__in=ECO_TRANSPORT_TYPES)),
+        transport_co2=Sum('total_co2'),
+    )
+    for row in list(meals) + list(transports):
+        stats[row.pop('user_id')].update(row)
+
+    accepted = Friendship.objects.filter(status='accepted').order_by()
+    for side in ('from_user_id', 'to_user_id'):
+        for row in accepted.values(side).annotate(count=Count('id')):
+            user_stats = stats[row[side]]
+            user_stats['friend_count'] = user_stats.get('friend_count', 0) + row['count']
+
+    UserStats.objects.bulk_create(
+        [
+            UserStats(user_id=user_id, **{field: value or 0 for field, value in values.items()})
+            for user_id, values in stats.items()
+        ],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('meals', '0001_initial'),
+        ('social', '0001_initial'),
+        ('transport', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='M_UserStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp automático de creación', verbose_name='Fecha de creación')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp automático de última modificación', verbose_name='Última actualización')),
+                ('is_active', models.BooleanField(default=True, help_text='Indica si el registro está activo', verbose_name='Activo')),
+                ('meal_count', models.IntegerField(default=0, verbose_name='Comidas')),
+                ('vegan_meal_count', models.IntegerField(default=0, verbose_name='Comidas veganas')),
+                ('vegetarian_meal_count', models.IntegerField(default=0, verbose_name='Comidas vegetarianas')),
+                ('meals_co2', models.FloatField(default=0.0, verbose_name='CO2 de comidas (kg)')),
+                ('transport_count', models.IntegerField(default=0, verbose_name='Viajes')),
+                ('eco_transport_count', models.IntegerField(default=0, verbose_name='Viajes ecológicos')),
+                ('transport_co2', models.FloatField(default=0.0, verbose_name='CO2 de transporte (kg)')),
+                ('friend_count', models.IntegerField(default=0, verbose_name='Amigos')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Estadísticas de Usuario',
+                'verbose_name_plural': 'Estadísticas de Usuarios',
+                'db_table': 'user_stats',
+            },
+        ),
+        migrations.RunPython(backfill_user_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.7 on 2026-10-18 19:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_opening_balances(apps, schema_editor):
+    # Los puntos acumulados antes del historial quedan como saldo inicial
+    UserProfile = apps.get_model('users', 'M_UserProfile')
+    PointsTransaction = apps.get_model('users', 'M_PointsTransaction')
+
+    profiles = UserProfile.objects.filter(total_points__gt=0).values_list('user_id', 'total_points')
+    PointsTransaction.objects.bulk_create(
+        [
+            PointsTransaction(user_id=user_id, amount=total_points, reason='opening_balance')
+            for user_id, total_points in profiles.iterator()
+        ],
+        batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_userstats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='M_PointsSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(max_length=7, verbose_name='Mes')),
+                ('reason', models.CharField(choices=[('meal', 'Comida registrada'), ('transport', 'Viaje registrado'), ('achievement', 'Logro desbloqueado'), ('opening_balance', 'Saldo inicial'), ('adjustment', 'Ajuste')], max_length=20, verbose_name='Motivo')),
+                ('amount', models.IntegerField(default=0, verbose_name='Puntos')),
+                ('transaction_count', models.IntegerField(default=0, verbose_name='Movimientos')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Última actualización')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points_summaries', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Resumen de Puntos',
+                'verbose_name_plural': 'Resúmenes de Puntos',
+                'db_table': 'points_summaries',
+                'ordering': ['-period'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'period', 'reason'), name='unique_points_summary')],
+            },
+        ),
+        migrations.CreateModel(
+            name='M_PointsTransaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.IntegerField(verbose_name='Puntos')),
+                ('reason', models.CharField(choices=[('meal', 'Comida registrada'), ('transport', 'Viaje registrado'), ('achievement', 'Logro desbloqueado'), ('opening_balance', 'Saldo inicial'), ('adjustment', 'Ajuste')], max_length=20, verbose_name='Motivo')),
+                ('source_type', models.CharField(blank=True, default='', max_length=50, verbose_name='Tipo de origen')),
+                ('source_id', models.BigIntegerField(blank=True, null=True, verbose_name='ID de origen')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Fecha')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points_transactions', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Movimiento de Puntos',
+                'verbose_name_plural': 'Movimientos de Puntos',
+                'db_table': 'points_transactions',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at'], name='points_tran_user_id_c020a4_idx')],
+            },
+        ),
+        migrations.RunPython(create_opening_balances, migrations.RunPython.noop),
+    ]
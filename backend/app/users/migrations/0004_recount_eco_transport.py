@@ -0,0 +1,33 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# M_Transport.ECO_TRANSPORT_TYPES al crear la migración
+ECO_TRANSPORT_TYPES = ['bike', 'walk', 'scooter']
+
+
+def recount_eco_transport(apps, schema_editor):
+    # Los contadores se calcularon con claves que no existen en
+    # TRANSPORT_CHOICES ('bicycle', 'electric_scooter', ...) y quedaron en 0
+    Transport = apps.get_model('transport', 'M_Transport')
+    UserStats = apps.get_model('users', 'M_UserStats')
+
+    eco_trips = Transport.objects.filter(
+        user_id=OuterRef('user_id'),
+        is_active=True,
+        transport_type__in=ECO_TRANSPORT_TYPES
+    ).order_by().values('user_id').annotate(count=Count('id')).values('count')
+    UserStats.objects.update(eco_transport_count=Coalesce(Subquery(eco_trips), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_points_ledger'),
+        ('transport', '0002_sync_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(recount_eco_transport, migrations.RunPython.noop),
+    ]
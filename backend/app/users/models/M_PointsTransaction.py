@@ -0,0 +1,122 @@
+"""
+Historial de puntos.
+Cada punto otorgado queda como un movimiento (solo inserciones); los
+movimientos antiguos se compactan en resúmenes mensuales con
+`python manage.py compact_points_ledger`. Ver app.users.points.
+"""
+from django.db import models
+from django.contrib.auth.models import User
+
+
+REASON_CHOICES = [
+    ('meal', 'Comida registrada'),
+    ('transport', 'Viaje registrado'),
+    ('achievement', 'Logro desbloqueado'),
+    ('opening_balance', 'Saldo inicial'),
+    ('adjustment', 'Ajuste'),
+]
+
+
+class M_PointsTransaction(models.Model):
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='points_transactions',
+        verbose_name="Usuario"
+    )
+
+    amount = models.IntegerField(
+        verbose_name="Puntos"
+    )
+
+    reason = models.CharField(
+        max_length=20,
+        choices=REASON_CHOICES,
+        verbose_name="Motivo"
+    )
+
+    # Objeto que originó los puntos: 'app_label.modelo' e id
+    source_type = models.CharField(
+        max_length=50,
+        blank=True,
+        default='',
+        verbose_name="Tipo de origen"
+    )
+
+    source_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="ID de origen"
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        verbose_name="Fecha"
+    )
+
+    class Meta:
+        db_table = 'points_transactions'
+        verbose_name = "Movimiento de Puntos"
+        verbose_name_plural = "Movimientos de Puntos"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {self.amount:+d} ({self.reason})"
+
+
+class M_PointsSummary(models.Model):
+    """Movimientos compactados de un usuario por mes y motivo."""
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='points_summaries',
+        verbose_name="Usuario"
+    )
+
+    # 'YYYY-MM'
+    period = models.CharField(
+        max_length=7,
+        verbose_name="Mes"
+    )
+
+    reason = models.CharField(
+        max_length=20,
+        choices=REASON_CHOICES,
+        verbose_name="Motivo"
+    )
+
+    amount = models.IntegerField(
+        default=0,
+        verbose_name="Puntos"
+    )
+
+    transaction_count = models.IntegerField(
+        default=0,
+        verbose_name="Movimientos"
+    )
+
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name="Última actualización"
+    )
+
+    class Meta:
+        db_table = 'points_summaries'
+        verbose_name = "Resumen de Puntos"
+        verbose_name_plural = "Resúmenes de Puntos"
+        ordering = ['-period']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'period', 'reason'],
+                name='unique_points_summary'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.period}: {self.amount} ({self.reason})"
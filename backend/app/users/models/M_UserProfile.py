@@ -2,14 +2,18 @@
 Modelo de perfil de usuario extendido.
 Incluye información adicional del usuario y gamificación.
 """
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
+from core.cache import bump_user_version
 from core.models import M_BaseModel
 
 
 class M_UserProfile(M_BaseModel):
 
+    # Campos que determinan la posición en el ranking global
+    RANKING_FIELDS = {'total_points', 'level', 'total_co2_saved'}
+
     user = models.OneToOneField(
         User,
         on_delete=models.CASCADE,
@@ -90,10 +94,45 @@ class M_UserProfile(M_BaseModel):
     def __str__(self):
         return f"Perfil de {self.user.username}"
 
-    def add_points(self, points: int):
-        self.total_points += points
-        self.update_level()
-        self.save()
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            
+            from app.sync.sync import COLLECTION_PROFILE, record_changes
+            record_changes(COLLECTION_PROFILE, [(self.user_id, self.user_id)])
+            
+            # Perfil nuevo: la cola crea en bloque sus logros con el progreso inicial
+            if is_new:
+                from app.social.achievement_queue import enqueue_achievement_evaluation
+                enqueue_achievement_evaluation(self.user_id)
+            
+            # Reubicar al usuario en el ranking global de este proceso con los
+            # valores guardados: los de memoria pueden ser anteriores a un
+            # UPDATE de puntos de otra petición
+            update_fields = kwargs.get('update_fields')
+            if update_fields is None or self.RANKING_FIELDS & set(update_fields):
+                from app.social.ranking import rank_index
+                ranking = M_UserProfile.objects.filter(pk=self.pk).values_list(
+                    'total_points', 'level', 'total_co2_saved'
+                ).get()
+                transaction.on_commit(lambda: rank_index.update(self.user_id, *ranking))
+        # Puntos, nivel, racha o datos del perfil cambiaron
+        bump_user_version(self.user_id)
+
+    def apply_activity(self, awards=(), activity_dates=()):
+        """
+        Otorga puntos (lista de (puntos, motivo, origen)), recalcula el nivel
+        y mueve la racha con un solo UPDATE condicional (ver app.users.points).
+        Los campos en memoria quedan con los valores guardados.
+        """
+        from app.users.points import award_points
+        
+        for field, value in award_points(self.user_id, awards, activity_dates).items():
+            setattr(self, field, value)
+
+    def add_points(self, points: int, reason: str = 'adjustment', source=None):
+        self.apply_activity([(points, reason, source)])
 
     def update_level(self):
         # Sistema simple: 1 nivel cada 1000 puntos
@@ -101,9 +140,10 @@ class M_UserProfile(M_BaseModel):
         if new_level > self.level:
             self.level = new_level
 
-    def update_streak(self, activity_date):
-
-        from datetime import timedelta
+    def update_streak(self, activity_date, commit: bool = True):
+        if commit:
+            self.apply_activity(activity_dates=[activity_date])
+            return
         
         if self.last_activity_date:
             days_diff = (activity_date - self.last_activity_date).days
@@ -118,4 +158,3 @@ class M_UserProfile(M_BaseModel):
             self.streak_days = 1
         
         self.last_activity_date = activity_date
-        self.save()
@@ -0,0 +1,73 @@
+"""
+Contadores de actividad por usuario.
+Se mantienen con UPDATE atómicos al registrar o eliminar actividades
+y al cambiar amistades; ver app.users.stats.
+"""
+from django.db import models
+from django.contrib.auth.models import User
+from core.models import M_BaseModel
+
+
+class M_UserStats(M_BaseModel):
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        related_name='stats',
+        verbose_name="Usuario"
+    )
+
+    # Comidas activas
+    meal_count = models.IntegerField(
+        default=0,
+        verbose_name="Comidas"
+    )
+
+    vegan_meal_count = models.IntegerField(
+        default=0,
+        verbose_name="Comidas veganas"
+    )
+
+    vegetarian_meal_count = models.IntegerField(
+        default=0,
+        verbose_name="Comidas vegetarianas"
+    )
+
+    meals_co2 = models.FloatField(
+        default=0.0,
+        verbose_name="CO2 de comidas (kg)"
+    )
+
+    # Transportes activos
+    transport_count = models.IntegerField(
+        default=0,
+        verbose_name="Viajes"
+    )
+
+    eco_transport_count = models.IntegerField(
+        default=0,
+        verbose_name="Viajes ecológicos"
+    )
+
+    transport_co2 = models.FloatField(
+        default=0.0,
+        verbose_name="CO2 de transporte (kg)"
+    )
+
+    # Amistades aceptadas
+    friend_count = models.IntegerField(
+        default=0,
+        verbose_name="Amigos"
+    )
+
+    class Meta:
+        db_table = 'user_stats'
+        verbose_name = "Estadísticas de Usuario"
+        verbose_name_plural = "Estadísticas de Usuarios"
+
+    def __str__(self):
+        return f"Estadísticas de {self.user.username}"
+
+    @property
+    def total_co2(self):
+        return self.meals_co2 + self.transport_co2
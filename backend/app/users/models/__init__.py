@@ -1,3 +1,5 @@
 from .M_UserProfile import M_UserProfile
+from .M_UserStats import M_UserStats
+from .M_PointsTransaction import M_PointsTransaction, M_PointsSummary
 
-__all__ = ['M_UserProfile']
+__all__ = ['M_UserProfile', 'M_UserStats', 'M_PointsTransaction', 'M_PointsSummary']
@@ -0,0 +1,259 @@
+"""
+Otorgamiento de puntos.
+Cada otorgamiento inserta sus movimientos en el historial
+(M_PointsTransaction) y suma el total al perfil con un UPDATE atómico que
+también sube el nivel y mueve la racha, sin leer y reescribir la fila
+completa. Los movimientos antiguos se compactan en resúmenes mensuales
+(M_PointsSummary).
+"""
+from collections import defaultdict
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from core.cache import bump_user_version
+from .models import M_PointsSummary, M_PointsTransaction, M_UserProfile
+
+
+REASON_MEAL = 'meal'
+REASON_TRANSPORT = 'transport'
+REASON_ACHIEVEMENT = 'achievement'
+REASON_ADJUSTMENT = 'adjustment'
+
+# 1 nivel cada 1000 puntos
+LEVEL_POINTS = 1000
+
+# Campos del perfil que cambian al registrar actividad
+PROFILE_ACTIVITY_FIELDS = ('total_points', 'level', 'streak_days', 'last_activity_date')
+
+
+def level_for(total_points):
+    return total_points // LEVEL_POINTS + 1
+
+
+def points_update(amount):
+    """Campos de un UPDATE que suma `amount` puntos; el nivel nunca baja."""
+    return {
+        'total_points': F('total_points') + amount,
+        'level': Greatest(F('level'), (F('total_points') + amount) / LEVEL_POINTS + 1),
+    }
+
+
+def ledger_entry(user_id, amount, reason, source=None):
+    """Movimiento sin guardar; `source` es la instancia que originó los puntos."""
+    entry = M_PointsTransaction(user_id=user_id, amount=amount, reason=reason)
+    if source is not None:
+        entry.source_type = source._meta.label_lower
+        entry.source_id = source.pk
+    return entry
+
+
+def record_transactions(entries):
+    """Inserta movimientos en bloque (sin tocar el perfil)."""
+    M_PointsTransaction.objects.bulk_create(
+        [entry for entry in entries if entry.amount],
+        batch_size=1000
+    )
+
+
+def apply_points(points_by_user, day=None):
+    """
+    Suma puntos a los perfiles con un UPDATE por cada valor distinto,
+    los registra en los leaderboards por periodo y reubica a los usuarios
+    en el índice de ranking al confirmar.
+
+    Args:
+        points_by_user: Dict {user_id: puntos}
+    """
+    from app.social.period_leaderboards import add_period_points
+    from app.social.ranking import rank_index
+    from app.sync.sync import COLLECTION_PROFILE, record_changes
+
+    by_amount = defaultdict(list)
+    for user_id, amount in points_by_user.items():
+        if amount:
+            by_amount[amount].append(user_id)
+    if not by_amount:
+        return
+
+    now = timezone.now()
+    with transaction.atomic(savepoint=False):
+        for amount, user_ids in by_amount.items():
+            M_UserProfile.objects.filter(user_id__in=user_ids).update(
+                updated_at=now,
+                **points_update(amount)
+            )
+        add_period_points(points_by_user, day)
+        updated = list(M_UserProfile.objects.filter(
+            user_id__in=[user_id for user_ids in by_amount.values() for user_id in user_ids]
+        ).values_list('user_id', 'total_points', 'level'))
+        record_changes(COLLECTION_PROFILE, [(user_id, user_id) for user_id, _, _ in updated])
+
+    for user_ids in by_amount.values():
+        for user_id in user_ids:
+            bump_user_version(user_id)
+
+    def update_ranks():
+        for user_id, total_points, level in updated:
+            rank_index.update_points(user_id, total_points, level)
+
+    transaction.on_commit(update_ranks)
+
+
+def streak_update(activity_dates):
+    """
+    Campos de un UPDATE que mueve la racha con las actividades de `activity_dates`.
+
+    Equivale a aplicar update_streak fecha por fecha en orden: la racha
+    final es la corrida de días consecutivos que termina en la última fecha,
+    sumada a la racha guardada si la continúa. Las fechas anteriores a la
+    última actividad no cambian nada.
+    """
+    dates = sorted(set(activity_dates))
+    last_date = dates[-1]
+
+    # Corrida de días consecutivos que termina en la última fecha
+    run = 1
+    while run < len(dates) and dates[-run - 1] == last_date - timedelta(days=run):
+        run += 1
+    run_start = last_date - timedelta(days=run - 1)
+
+    # La racha guardada termina el día anterior a la corrida o dentro de ella:
+    # suma los días nuevos
+    continues = []
+    for offset in range(run):
+        previous = run_start - timedelta(days=1) + timedelta(days=offset)
+        continues.append(When(
+            last_activity_date=previous,
+            then=F('streak_days') + (last_date - previous).days
+        ))
+    return {
+        'streak_days': Case(
+            When(last_activity_date__isnull=True, then=Value(run)),
+            When(last_activity_date__gte=last_date, then=F('streak_days')),
+            *continues,
+            default=Value(run)
+        ),
+        'last_activity_date': Case(
+            When(
+                Q(last_activity_date__isnull=True) | Q(last_activity_date__lt=last_date),
+                then=Value(last_date)
+            ),
+            default=F('last_activity_date')
+        ),
+    }
+
+
+def apply_activity(user_id, amount, activity_dates=(), day=None):
+    """
+    Suma `amount` puntos (ya registrados en el historial), recalcula el
+    nivel y mueve la racha con un solo UPDATE condicional del perfil.
+
+    Returns:
+        Dict con total_points, level, streak_days y last_activity_date actualizados
+    """
+    from app.social.period_leaderboards import add_period_points
+    from app.social.ranking import rank_index
+    from app.sync.sync import COLLECTION_PROFILE, record_changes
+
+    fields = points_update(amount) if amount else {}
+    if activity_dates:
+        fields.update(streak_update(activity_dates))
+
+    profile = M_UserProfile.objects.filter(user_id=user_id)
+    with transaction.atomic(savepoint=False):
+        if fields:
+            profile.update(updated_at=timezone.now(), **fields)
+            add_period_points({user_id: amount}, day)
+            record_changes(COLLECTION_PROFILE, [(user_id, user_id)])
+        values = profile.values(*PROFILE_ACTIVITY_FIELDS).get()
+
+    if fields:
+        bump_user_version(user_id)
+    if amount:
+        transaction.on_commit(lambda: rank_index.update_points(
+            user_id, values['total_points'], values['level']
+        ))
+    return values
+
+
+def award_points(user_id, awards, activity_dates=(), day=None):
+    """
+    Otorga puntos a un usuario y, si se indican fechas de actividad, mueve su racha.
+
+    Args:
+        awards: Lista de (puntos, motivo, objeto origen o None)
+
+    Returns:
+        Dict con total_points, level, streak_days y last_activity_date actualizados
+    """
+    entries = [ledger_entry(user_id, amount, reason, source) for amount, reason, source in awards]
+    with transaction.atomic(savepoint=False):
+        record_transactions(entries)
+        return apply_activity(
+            user_id,
+            sum(entry.amount for entry in entries),
+            activity_dates,
+            day
+        )
+
+
+def compact_ledger(before, chunk_size=5000):
+    """
+    Pliega en M_PointsSummary (usuario, mes, motivo) un lote de los
+    movimientos anteriores a `before` y los elimina, en una transacción.
+
+    Returns:
+        Cantidad de movimientos compactados (0 cuando no quedan)
+    """
+    old = M_PointsTransaction.objects.filter(created_at__lt=before).order_by('id')
+    with transaction.atomic():
+        last_id = old.values_list('id', flat=True)[chunk_size - 1:chunk_size].first()
+        if last_id is None:
+            last_id = old.values_list('id', flat=True).last()
+        if last_id is None:
+            return 0
+        batch = old.filter(id__lte=last_id)
+
+        totals = defaultdict(lambda: [0, 0])
+        for user_id, created_at, reason, amount in batch.values_list(
+            'user_id', 'created_at', 'reason', 'amount'
+        ).iterator(chunk_size=chunk_size):
+            key = (user_id, timezone.localtime(created_at).strftime('%Y-%m'), reason)
+            totals[key][0] += amount
+            totals[key][1] += 1
+
+        existing = {
+            (summary.user_id, summary.period, summary.reason): summary
+            for summary in M_PointsSummary.objects.select_for_update().filter(
+                user_id__in={user_id for user_id, _, _ in totals},
+                period__in={period for _, period, _ in totals}
+            )
+        }
+        changed, created = [], []
+        for key, (amount, count) in totals.items():
+            summary = existing.get(key)
+            if summary is None:
+                user_id, period, reason = key
+                created.append(M_PointsSummary(
+                    user_id=user_id,
+                    period=period,
+                    reason=reason,
+                    amount=amount,
+                    transaction_count=count
+                ))
+            else:
+                summary.amount += amount
+                summary.transaction_count += count
+                summary.updated_at = timezone.now()
+                changed.append(summary)
+        M_PointsSummary.objects.bulk_create(created, batch_size=1000)
+        M_PointsSummary.objects.bulk_update(
+            changed,
+            ['amount', 'transaction_count', 'updated_at'],
+            batch_size=1000
+        )
+
+        compacted, _ = batch.delete()
+    return compacted
@@ -34,10 +34,11 @@ class SZ_UserProfileUpdate(serializers.ModelSerializer):
             user.last_name = user_data.get('last_name', user.last_name)
             user.save()
 
-        # Actualizar perfil
+        # Actualizar perfil: solo los campos editados, para no pisar puntos,
+        # nivel o racha que se sumaron con UPDATE después de leer el perfil
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, 'updated_at'])
         
         return instance
 
@@ -0,0 +1,169 @@
+"""
+Mantenimiento incremental de los contadores por usuario (M_UserStats).
+Comidas, transportes y amistades reportan su estado antes y después de
+guardarse; aquí se aplica la diferencia con un UPDATE atómico.
+"""
+from collections import Counter
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+from app.transport.models import M_Transport
+from .models import M_UserStats
+
+
+ECO_TRANSPORT_TYPES = M_Transport.ECO_TRANSPORT_TYPES
+
+STAT_FIELDS = (
+    'meal_count',
+    'vegan_meal_count',
+    'vegetarian_meal_count',
+    'meals_co2',
+    'transport_count',
+    'eco_transport_count',
+    'transport_co2',
+    'friend_count',
+)
+
+
+def compute_user_stats(user_ids):
+    """
+    Calcula los contadores desde las tablas de origen.
+
+    Returns:
+        Dict {user_id: {campo: valor}} con una entrada por cada id pedido
+    """
+    from app.meals.models import M_Meal
+    from app.social.models import FriendEdge
+    from app.transport.models import M_Transport
+
+    stats = {
+        user_id: {field: 0.0 if field.endswith('_co2') else 0 for field in STAT_FIELDS}
+        for user_id in user_ids
+    }
+
+    meals = M_Meal.objects.filter(user_id__in=user_ids, is_active=True).order_by().values(
+        'user_id'
+    ).annotate(
+        meal_count=Count('id'),
+        vegan_meal_count=Count('id', filter=Q(is_vegan=True)),
+        vegetarian_meal_count=Count('id', filter=Q(is_vegetarian=True)),
+        meals_co2=Sum('total_co2'),
+    )
+    transports = M_Transport.objects.filter(user_id__in=user_ids, is_active=True).order_by().values(
+        'user_id'
+    ).annotate(
+        transport_count=Count('id'),
+        eco_transport_count=Count('id', filter=Q(transport_type__in=ECO_TRANSPORT_TYPES)),
+        transport_co2=Sum('total_co2'),
+    )
+    for row in list(meals) + list(transports):
+        user_stats = stats[row.pop('user_id')]
+        for field, value in row.items():
+            user_stats[field] = value or user_stats[field]
+
+    edges = FriendEdge.objects.filter(user_id__in=user_ids).order_by().values('user_id').annotate(
+        count=Count('id')
+    )
+    for row in edges:
+        stats[row['user_id']]['friend_count'] = row['count']
+
+    return stats
+
+
+def get_user_stats(user_id):
+    """Fila de contadores del usuario; se crea desde las tablas de origen si falta."""
+    try:
+        return M_UserStats.objects.get(user_id=user_id)
+    except M_UserStats.DoesNotExist:
+        pass
+
+    values = compute_user_stats([user_id])[user_id]
+    try:
+        with transaction.atomic():
+            return M_UserStats.objects.create(user_id=user_id, **values)
+    except IntegrityError:
+        return M_UserStats.objects.get(user_id=user_id)
+
+
+def apply_stats_delta(user_id, deltas):
+    """Suma (o resta) `deltas` {campo: valor} a los contadores con un UPDATE atómico."""
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    rows = M_UserStats.objects.filter(user_id=user_id)
+    changes = {field: F(field) + value for field, value in deltas.items()}
+    if rows.update(updated_at=timezone.now(), **changes):
+        return
+
+    # Sin fila todavía: las tablas de origen ya incluyen este cambio
+    values = compute_user_stats([user_id])[user_id]
+    try:
+        with transaction.atomic():
+            M_UserStats.objects.create(user_id=user_id, **values)
+    except IntegrityError:
+        # Otra petición creó la fila sin ver este cambio (aún sin confirmar)
+        rows.update(updated_at=timezone.now(), **changes)
+
+
+def _meal_delta(state, sign):
+    is_vegan, is_vegetarian, co2 = state
+    return Counter({
+        'meal_count': sign,
+        'vegan_meal_count': sign if is_vegan else 0,
+        'vegetarian_meal_count': sign if is_vegetarian else 0,
+        'meals_co2': sign * co2,
+    })
+
+
+def _transport_delta(state, sign):
+    transport_type, co2 = state
+    return Counter({
+        'transport_count': sign,
+        'eco_transport_count': sign if transport_type in ECO_TRANSPORT_TYPES else 0,
+        'transport_co2': sign * co2,
+    })
+
+
+ACTIVITY_DELTAS = {
+    'meals': _meal_delta,
+    'transport': _transport_delta,
+}
+
+
+def track_stats_change(user_id, category, before, after):
+    """
+    Aplica el cambio de una actividad a los contadores.
+
+    Args:
+        category: 'meals' o 'transport'
+        before: Estado antes de guardar (stats_state()), o None si no contaba
+        after: Estado después de guardar, o None si ya no cuenta
+    """
+    if before == after:
+        return
+    delta_for = ACTIVITY_DELTAS[category]
+    deltas = Counter()
+    if before is not None:
+        deltas.update(delta_for(before, -1))
+    if after is not None:
+        deltas.update(delta_for(after, 1))
+    apply_stats_delta(user_id, deltas)
+
+
+def track_bulk_stats(user_id, category, states):
+    """Registra un lote de actividades nuevas con un solo UPDATE."""
+    delta_for = ACTIVITY_DELTAS[category]
+    deltas = Counter()
+    for state in states:
+        deltas.update(delta_for(state, 1))
+    apply_stats_delta(user_id, deltas)
+
+
+def track_friendship_change(from_user_id, to_user_id, was_accepted, is_accepted):
+    """Ajusta friend_count de ambos usuarios cuando una amistad se acepta o se elimina."""
+    if was_accepted == is_accepted:
+        return
+    delta = 1 if is_accepted else -1
+    apply_stats_delta(from_user_id, {'friend_count': delta})
+    apply_stats_delta(to_user_id, {'friend_count': delta})
@@ -1,3 +1,146 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta
+from itertools import combinations
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import M_PointsSummary, M_PointsTransaction, M_UserProfile
+from .serializers import SZ_UserProfileUpdate
+from .points import (
+    LEVEL_POINTS, REASON_ACHIEVEMENT, REASON_MEAL, apply_activity, compact_ledger, streak_update
+)
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class StreakUpdateTests(TestCase):
+
+    def setUp(self):
+        self.profile = M_UserProfile.objects.create(
+            user=User.objects.create_user(username='ana', password='x')
+        )
+        self.day = date(2025, 3, 10)
+
+    def expected(self, last_activity_date, streak_days, activity_dates):
+        """update_streak fecha por fecha; las anteriores a la última actividad no cuentan."""
+        profile = M_UserProfile(last_activity_date=last_activity_date, streak_days=streak_days)
+        for activity_date in sorted(set(activity_dates)):
+            if profile.last_activity_date is None or activity_date > profile.last_activity_date:
+                profile.update_streak(activity_date, commit=False)
+        return profile.streak_days, profile.last_activity_date
+
+    def test_matches_applying_dates_one_by_one(self):
+        rows = M_UserProfile.objects.filter(pk=self.profile.pk)
+        days = [self.day + timedelta(days=offset) for offset in range(-2, 4)]
+        for last_activity_date, streak_days in ((None, 0), (self.day, 4), (self.day - timedelta(days=3), 2)):
+            for size in (1, 2, 3):
+                for activity_dates in combinations(days, size):
+                    with self.subTest(last=last_activity_date, dates=activity_dates):
+                        rows.update(last_activity_date=last_activity_date, streak_days=streak_days)
+                        rows.update(**streak_update(activity_dates))
+                        self.assertEqual(
+                            rows.values_list('streak_days', 'last_activity_date').get(),
+                            self.expected(last_activity_date, streak_days, activity_dates)
+                        )
+
+    def test_apply_activity_adds_points_level_and_streak(self):
+        M_UserProfile.objects.filter(pk=self.profile.pk).update(
+            total_points=LEVEL_POINTS - 10, last_activity_date=self.day, streak_days=5
+        )
+
+        values = apply_activity(self.profile.user_id, 30, [self.day + timedelta(days=1)])
+
+        self.assertEqual(values, {
+            'total_points': LEVEL_POINTS + 20,
+            'level': 2,
+            'streak_days': 6,
+            'last_activity_date': self.day + timedelta(days=1),
+        })
+
+
+class LedgerCompactionTests(TestCase):
+
+    def setUp(self):
+        self.users = [User.objects.create_user(username=f'user{i}', password='x') for i in range(2)]
+
+    def entry(self, user, amount, reason, moment):
+        entry = M_PointsTransaction.objects.create(user=user, amount=amount, reason=reason)
+        M_PointsTransaction.objects.filter(pk=entry.pk).update(created_at=moment)
+
+    def summaries(self):
+        return {
+            (row.user_id, row.period, row.reason): (row.amount, row.transaction_count)
+            for row in M_PointsSummary.objects.all()
+        }
+
+    def test_folds_old_entries_into_monthly_summaries(self):
+        first, second = self.users
+        january = timezone.make_aware(datetime(2025, 1, 15, 12))
+        february = timezone.make_aware(datetime(2025, 2, 15, 12))
+        recent = timezone.make_aware(datetime(2025, 4, 15, 12))
+        self.entry(first, 10, REASON_MEAL, january)
+        self.entry(first, 15, REASON_MEAL, january)
+        self.entry(first, 50, REASON_ACHIEVEMENT, february)
+        self.entry(second, 7, REASON_MEAL, february)
+        self.entry(first, 99, REASON_MEAL, recent)
+
+        before = timezone.make_aware(datetime(2025, 3, 1))
+        batches = []
+        while True:
+            compacted = compact_ledger(before, chunk_size=3)
+            if not compacted:
+                break
+            batches.append(compacted)
+
+        self.assertEqual(batches, [3, 1])
+        self.assertEqual(self.summaries(), {
+            (first.id, '2025-01', REASON_MEAL): (25, 2),
+            (first.id, '2025-02', REASON_ACHIEVEMENT): (50, 1),
+            (second.id, '2025-02', REASON_MEAL): (7, 1),
+        })
+        self.assertEqual(list(M_PointsTransaction.objects.values_list('amount', flat=True)), [99])
+
+    def test_later_runs_add_to_existing_summaries(self):
+        first = self.users[0]
+        january = timezone.make_aware(datetime(2025, 1, 15, 12))
+        before = timezone.make_aware(datetime(2025, 3, 1))
+        self.entry(first, 10, REASON_MEAL, january)
+        compact_ledger(before)
+        self.entry(first, 5, REASON_MEAL, january)
+        compact_ledger(before)
+
+        self.assertEqual(self.summaries(), {(first.id, '2025-01', REASON_MEAL): (15, 2)})
+
+
+@override_settings(ACHIEVEMENT_WORKER='command')
+class ProfileUpdateTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='ana', password='x')
+        M_UserProfile.objects.create(user=self.user)
+        self.other = M_UserProfile.objects.create(
+            user=User.objects.create_user(username='beto', password='x')
+        )
+        M_UserProfile.objects.filter(pk=self.other.pk).update(total_points=20)
+
+    def test_edit_keeps_points_awarded_after_loading_the_profile(self):
+        from app.social.ranking import rank_index
+
+        profile = M_UserProfile.objects.get(user=self.user)
+        # Una actividad se confirma mientras la petición de edición está en curso
+        with self.captureOnCommitCallbacks(execute=True):
+            apply_activity(self.user.id, 50, [date(2025, 3, 10)])
+        rank_index.rebuild()
+
+        serializer = SZ_UserProfileUpdate(profile, data={'bio': 'Hola', 'first_name': 'Ana'}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.captureOnCommitCallbacks(execute=True):
+            serializer.save()
+
+        self.assertEqual(
+            M_UserProfile.objects.filter(user=self.user).values_list(
+                'bio', 'total_points', 'streak_days', 'last_activity_date'
+            ).get(),
+            ('Hola', 50, 1, date(2025, 3, 10))
+        )
+        self.assertEqual(rank_index.rank(self.user.id), 1)
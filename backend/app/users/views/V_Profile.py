@@ -6,12 +6,14 @@ from rest_framework.decorators import api_view, permission_classes, parser_class
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
+from core.cache import cache_user_response
 from app.users.models import M_UserProfile
 from app.users.serializers import SZ_UserProfile, SZ_UserProfileUpdate
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@cache_user_response('profile')
 def V_ProfileDetail(request):
     try:
         profile = M_UserProfile.objects.get(user=request.user)
@@ -0,0 +1,76 @@
+"""
+Benchmark de CarbonCalculator: métodos escalares vs. por lotes.
+
+Uso (desde backend/):
+    python benchmarks/bench_carbon_calculator.py [--size 50000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.utils.carbon_calculator import CarbonCalculator  # noqa: E402
+from core.utils.constants import MEAL_EMISSIONS, TRANSPORT_EMISSIONS  # noqa: E402
+
+
+def build_trips(size, rng):
+    transport_types = list(TRANSPORT_EMISSIONS) + ['Car', 'BIKE', 'unknown']
+    return [
+        (rng.choice(transport_types), round(rng.uniform(0.1, 300), 2))
+        for _ in range(size)
+    ]
+
+
+def build_meals(size, rng):
+    ingredients = list(MEAL_EMISSIONS) + ['Beef', 'unknown']
+    return [
+        {
+            rng.choice(ingredients): round(rng.uniform(0.05, 0.5), 2)
+            for _ in range(rng.randint(1, 6))
+        }
+        for _ in range(size)
+    ]
+
+
+def bench(label, scalar, batch, repeat):
+    assert scalar() == batch(), f'{label}: los resultados no coinciden'
+    scalar_time = min(timeit.repeat(scalar, number=1, repeat=repeat))
+    batch_time = min(timeit.repeat(batch, number=1, repeat=repeat))
+    print(
+        f'{label:<10} escalar {scalar_time * 1000:9.1f} ms   '
+        f'lotes {batch_time * 1000:9.1f} ms   '
+        f'x{scalar_time / batch_time:5.1f}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=50000, help='Elementos por lote')
+    parser.add_argument('--repeat', type=int, default=5, help='Repeticiones (se reporta la mejor)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    trips = build_trips(args.size, rng)
+    meals = build_meals(args.size, rng)
+
+    print(f'{args.size} elementos, mejor de {args.repeat} repeticiones\n')
+    bench(
+        'transporte',
+        lambda: [CarbonCalculator.calculate_transport_emissions(t, d) for t, d in trips],
+        lambda: CarbonCalculator.calculate_transport_emissions_batch(trips),
+        args.repeat
+    )
+    bench(
+        'comidas',
+        lambda: [CarbonCalculator.calculate_meal_emissions(m) for m in meals],
+        lambda: CarbonCalculator.calculate_meal_emissions_batch(meals),
+        args.repeat
+    )
+
+
+if __name__ == '__main__':
+    main()
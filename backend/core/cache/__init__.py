@@ -0,0 +1,3 @@
+from .response_cache import cache_user_response, get_user_version, bump_user_version
+
+__all__ = ['cache_user_response', 'get_user_version', 'bump_user_version']
@@ -0,0 +1,96 @@
+"""
+Caché de respuestas por usuario con invalidación por versión.
+Cada usuario tiene un contador de versión; las respuestas se guardan con
+la versión vigente en la llave y cualquier cambio en sus datos incrementa
+el contador, dejando obsoletas todas sus entradas de una vez.
+"""
+import hashlib
+import time
+from functools import wraps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.response import Response
+
+
+def _cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'responses')]
+
+
+def _version_key(user_id):
+    return f'user_version:{user_id}'
+
+
+def get_user_version(user_id) -> int:
+    """
+    Retorna la versión actual de los datos del usuario.
+
+    Si el contador no existe (primer uso o fue desalojado) se inicializa
+    con un valor basado en el reloj, para que nunca coincida con una
+    versión anterior cuyas entradas sigan en caché.
+    """
+    cache = _cache()
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_user_version(user_id):
+    """
+    Invalida todas las respuestas cacheadas del usuario.
+    Se ejecuta al confirmar la transacción en curso para que una lectura
+    concurrente no guarde datos viejos con la versión nueva.
+    """
+    def bump():
+        cache = _cache()
+        key = _version_key(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def cache_user_response(namespace):
+    """
+    Decorador para vistas GET que cachea `response.data` por usuario.
+
+    La llave incluye el namespace, el usuario, su versión de datos, la
+    fecha actual y la ruta completa (con query params).
+
+    Uso:
+        @cache_user_response('profile')
+        def V_ProfileDetail(request): ...
+
+        @method_decorator(cache_user_response('dashboard_stats'), name='get')
+        class V_DashboardStats(APIView): ...
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            user = request.user
+            if request.method != 'GET' or not user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+
+            cache = _cache()
+            path_hash = hashlib.md5(request.get_full_path().encode()).hexdigest()
+            key = (
+                f'response:{namespace}:{user.id}:v{get_user_version(user.id)}:'
+                f'{timezone.localdate().isoformat()}:{path_hash}'
+            )
+
+            data = cache.get(key)
+            if data is not None:
+                return Response(data)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and getattr(response, 'data', None) is not None:
+                cache.set(key, response.data, getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300))
+            return response
+        return wrapper
+    return decorator
@@ -1,4 +1,6 @@
 from .carbon_calculator import CarbonCalculator
 from .constants import *
+from .etags import build_etag, queryset_fingerprint
+from .pagination import InvalidCursor, KeysetPaginator
 
-__all__ = ['CarbonCalculator']
+__all__ = ['CarbonCalculator', 'build_etag', 'queryset_fingerprint', 'InvalidCursor', 'KeysetPaginator']
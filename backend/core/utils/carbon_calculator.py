@@ -2,7 +2,8 @@
 Calculadora de emisiones de CO2 para diferentes actividades.
 Centraliza toda la lógica de cálculo de huella de carbono.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
 from .constants import (
     TRANSPORT_EMISSIONS,
     MEAL_EMISSIONS,
@@ -13,8 +14,49 @@ from .constants import (
 )
 
 
+DEFAULT_TRANSPORT_FACTOR = 0.1
+DEFAULT_MEAL_FACTOR = 0.5
+
+
+def _factor_vector(factors: Dict[str, float], default: float):
+    """Índice nombre -> posición y vector de factores; la última posición es el default."""
+    index = {name: position for position, name in enumerate(factors)}
+    vector = np.array(list(factors.values()) + [default], dtype=np.float64)
+    return index, vector
+
+
+def _lookup_factors(names: Sequence[str], index: Dict[str, int], vector) -> np.ndarray:
+    """Factor por nombre resolviendo cada nombre distinto una sola vez."""
+    default_position = len(vector) - 1
+    positions = {
+        name: index.get(name.lower(), default_position)
+        for name in set(names)
+    }
+    codes = np.fromiter(map(positions.__getitem__, names), dtype=np.intp, count=len(names))
+    return vector[codes]
+
+
+def _round3(values: np.ndarray) -> List[float]:
+    """
+    Redondea a 3 decimales con el mismo resultado que round(x, 3).
+
+    np.round escala por 1000 y puede diferir de round() solo cuando el
+    valor escalado queda casi en .5; esos casos se redondean con Python.
+    """
+    scaled = values * 1000.0
+    result = np.rint(scaled) / 1000.0
+    tolerance = np.maximum(1e-6, 4 * np.spacing(np.abs(scaled)))
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) <= tolerance)
+    for position in ties.tolist():
+        result[position] = round(float(values[position]), 3)
+    return result.tolist()
+
+
 class CarbonCalculator:
 
+    _TRANSPORT_INDEX, _TRANSPORT_FACTORS = _factor_vector(TRANSPORT_EMISSIONS, DEFAULT_TRANSPORT_FACTOR)
+    _MEAL_INDEX, _MEAL_FACTORS = _factor_vector(MEAL_EMISSIONS, DEFAULT_MEAL_FACTOR)
+
     @staticmethod
     def calculate_transport_emissions(transport_type: str, distance_km: float) -> float:
         """
@@ -27,9 +69,31 @@ class CarbonCalculator:
         Returns:
             float: Emisiones en kg de CO2
         """
-        emission_factor = TRANSPORT_EMISSIONS.get(transport_type.lower(), 0.1)
+        emission_factor = TRANSPORT_EMISSIONS.get(transport_type.lower(), DEFAULT_TRANSPORT_FACTOR)
         return round(emission_factor * distance_km, 3)
 
+    @classmethod
+    def calculate_transport_emissions_batch(
+        cls,
+        trips: Iterable[Tuple[str, float]]
+    ) -> List[float]:
+        """
+        Versión por lotes de calculate_transport_emissions.
+        
+        Args:
+            trips: Pares (transport_type, distance_km)
+            
+        Returns:
+            Lista de emisiones en kg de CO2, idéntica a llamar al método
+            escalar por cada par
+        """
+        trips = list(trips)
+        if not trips:
+            return []
+        transport_types, distances = zip(*trips)
+        factors = _lookup_factors(transport_types, cls._TRANSPORT_INDEX, cls._TRANSPORT_FACTORS)
+        return _round3(factors * np.asarray(distances, dtype=np.float64))
+
     @staticmethod
     def calculate_meal_emissions(ingredients: Dict[str, float]) -> float:
         """
@@ -44,10 +108,50 @@ class CarbonCalculator:
         """
         total_emissions = 0.0
         for ingredient, quantity in ingredients.items():
-            emission_factor = MEAL_EMISSIONS.get(ingredient.lower(), 0.5)
+            emission_factor = MEAL_EMISSIONS.get(ingredient.lower(), DEFAULT_MEAL_FACTOR)
             total_emissions += emission_factor * quantity
         return round(total_emissions, 3)
 
+    @classmethod
+    def calculate_meal_emissions_batch(
+        cls,
+        meals: Iterable[Dict[str, float]]
+    ) -> List[float]:
+        """
+        Versión por lotes de calculate_meal_emissions.
+        
+        Args:
+            meals: Dicts de ingredientes, uno por comida
+            
+        Returns:
+            Lista de emisiones en kg de CO2, idéntica a llamar al método
+            escalar por cada comida
+        """
+        meals = list(meals)
+        if not meals:
+            return []
+        
+        lengths = np.fromiter((len(ingredients) for ingredients in meals), dtype=np.intp, count=len(meals))
+        names = [name for ingredients in meals for name in ingredients]
+        quantities = np.asarray(
+            [quantity for ingredients in meals for quantity in ingredients.values()],
+            dtype=np.float64
+        )
+        products = _lookup_factors(names, cls._MEAL_INDEX, cls._MEAL_FACTORS) * quantities
+        
+        # Matriz comidas x ingredientes rellenada con ceros; sumar columna
+        # por columna conserva el orden de suma del método escalar
+        width = int(lengths.max())
+        matrix = np.zeros((len(meals), width), dtype=np.float64)
+        rows = np.repeat(np.arange(len(meals)), lengths)
+        offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        matrix[rows, np.arange(len(names)) - offsets] = products
+        
+        totals = np.zeros(len(meals), dtype=np.float64)
+        for column in range(width):
+            totals += matrix[:, column]
+        return _round3(totals)
+
     @staticmethod
     def calculate_energy_emissions(energy_type: str, amount: float) -> float:
         """
@@ -0,0 +1,28 @@
+"""
+Utilidades para GET condicionales (ETag / If-None-Match).
+Los ETags se construyen con metadatos baratos de las tablas
+(último updated_at y cantidad de filas), nunca con el cuerpo de la respuesta.
+"""
+import hashlib
+from django.db.models import Count, Max
+
+
+def queryset_fingerprint(queryset) -> str:
+    """
+    Resume un queryset como 'último updated_at:cantidad' en una sola consulta.
+
+    Incluir los registros eliminados lógicamente en el queryset hace que
+    un soft delete también cambie la huella (actualiza su updated_at).
+    """
+    result = queryset.order_by().aggregate(
+        last_update=Max('updated_at'),
+        count=Count('id')
+    )
+    last_update = result['last_update'].isoformat() if result['last_update'] else '-'
+    return f"{last_update}:{result['count']}"
+
+
+def build_etag(*parts) -> str:
+    """Combina las partes en un ETag corto y estable."""
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.md5(raw.encode()).hexdigest()
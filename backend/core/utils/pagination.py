@@ -0,0 +1,91 @@
+"""
+Paginación por cursor (keyset) para historiales ordenados por fecha.
+Cada página se obtiene con un rango sobre el índice (user, -fecha),
+así que el costo no depende de cuántas páginas se hayan recorrido
+y los cursores siguen siendo válidos aunque se agreguen registros.
+"""
+import base64
+from datetime import date
+from django.db.models import Q
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Cursor o parámetro de paginación mal formado."""
+
+
+def encode_cursor(day: date, pk: int) -> str:
+    raw = f'{day.isoformat()}|{pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """Retorna (fecha, id) del último registro de la página anterior."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        day, pk = raw.split('|')
+        return date.fromisoformat(day), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursor('Cursor inválido.')
+
+
+class KeysetPaginator:
+    """
+    Pagina un queryset en orden (-date_field, -id).
+
+    Parámetros de query: cursor, page_size (máximo MAX_PAGE_SIZE) e
+    include_count=true para agregar el total, que requiere una consulta
+    extra y por eso es opcional.
+    """
+
+    def __init__(self, queryset, date_field, default_page_size=DEFAULT_PAGE_SIZE,
+                 max_page_size=MAX_PAGE_SIZE):
+        self.queryset = queryset
+        self.date_field = date_field
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+
+    def _page_size(self, value):
+        if value in (None, ''):
+            return self.default_page_size
+        try:
+            page_size = int(value)
+        except ValueError:
+            raise InvalidCursor('page_size debe ser un número entero.')
+        if page_size < 1:
+            raise InvalidCursor('page_size debe ser mayor que 0.')
+        return min(page_size, self.max_page_size)
+
+    def paginate(self, query_params):
+        """
+        Retorna (registros, next_cursor, count). count es None salvo que
+        se pida include_count; next_cursor es None en la última página.
+        """
+        page_size = self._page_size(query_params.get('page_size'))
+        queryset = self.queryset.order_by(f'-{self.date_field}', '-id')
+
+        count = None
+        if query_params.get('include_count', '').lower() in ('1', 'true'):
+            count = queryset.count()
+
+        cursor = query_params.get('cursor')
+        if cursor:
+            day, pk = decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f'{self.date_field}__lt': day}) |
+                Q(**{self.date_field: day, 'id__lt': pk})
+            )
+
+        # Un registro extra indica si hay otra página sin consultar el total
+        items = list(queryset[:page_size + 1])
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            next_cursor = encode_cursor(getattr(last, self.date_field), last.id)
+
+        return items, next_cursor, count
@@ -233,6 +233,7 @@ achievements_data = [
 print("Creando logros...")
 created_count = 0
 updated_count = 0
+changed_ids = []
 
 for data in achievements_data:
     achievement, created = Achievement.objects.get_or_create(
@@ -242,16 +243,25 @@ for data in achievements_data:
     
     if created:
         created_count += 1
-        print(f"Creado: {achievement.icon} {achievement.name}")
+        changed_ids.append(achievement.id)
+        print(f"Creado: {achievement.name}")
     else:
         # Actualizar si ya existe
+        if any(getattr(achievement, key) != value for key, value in data.items()):
+            changed_ids.append(achievement.id)
         for key, value in data.items():
             setattr(achievement, key, value)
         achievement.save()
         updated_count += 1
-        print(f" Actualizado: {achievement.icon} {achievement.name}")
+        print(f" Actualizado: {achievement.name}")
 
 print(f"\n✨ Proceso completado!")
 print(f"   Logros creados: {created_count}")
 print(f"   Logros actualizados: {updated_count}")
 print(f"   Total de logros: {Achievement.objects.count()}")
+
+# Los usuarios existentes reciben los logros nuevos o modificados con el backfill
+if changed_ids:
+    args = ' '.join(f'--achievement {achievement_id}' for achievement_id in changed_ids)
+    print(f"\n   Para re-evaluar a los usuarios existentes:")
+    print(f"   python manage.py backfill_achievements {args}")
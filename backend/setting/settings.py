@@ -51,6 +51,7 @@ INSTALLED_APPS = [
     'app.social',
     'app.energy',
     'app.dashboard',
+    'app.sync',
 ]
 
 MIDDLEWARE = [
@@ -91,10 +92,53 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # El worker de logros escribe desde otro hilo: las transacciones
+        # toman el bloqueo de escritura al iniciar y esperan en vez de fallar
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 20,
+        },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 'responses' guarda las respuestas cacheadas por usuario (core.cache).
+# Opciones: 'locmem' (memoria del proceso, desarrollo) o 'file'
+# (compartida entre procesos del mismo servidor).
+
+RESPONSE_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ecotracker-responses',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'responses',
+    },
+}
+
+RESPONSE_CACHE_BACKEND = 'locmem'
+RESPONSE_CACHE_ALIAS = 'responses'
+RESPONSE_CACHE_TIMEOUT = 300  # segundos
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    RESPONSE_CACHE_ALIAS: RESPONSE_CACHE_BACKENDS[RESPONSE_CACHE_BACKEND],
+}
+
+
+# Logros
+# Se evalúan fuera del request desde una cola en la base de datos
+# (app.social.achievement_queue). Opciones: 'thread' (hilo dentro de cada
+# proceso web) o 'command' (`python manage.py process_achievement_jobs`).
+
+ACHIEVEMENT_WORKER = 'thread'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -29,6 +29,7 @@ urlpatterns = [
     path('api/transport/', include('app.transport.urls')),
     path('api/social/', include('app.social.urls')),
     path('api/dashboard/', include('app.dashboard.urls')),
+    path('api/sync/', include('app.sync.urls')),
     # path('api/energy/', include('app.energy.urls')),
     # path('api/dashboard/', include('app.dashboard.urls')),
     # path('api/social/', include('app.social.urls')),
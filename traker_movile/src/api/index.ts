@@ -9,3 +9,4 @@ export { mealsAPI } from './meals.api';
 export { transportAPI } from './transport.api';
 export { dashboardAPI } from './dashboard.api';
 export { socialAPI } from './social.api';
+export { syncAPI } from './sync.api';
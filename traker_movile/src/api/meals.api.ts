@@ -7,11 +7,20 @@ import type { Meal, CreateMealData } from '../models';
 
 export const mealsAPI = {
   /**
-   * Obtener lista de comidas del usuario
+   * Obtener una página de comidas del usuario.
+   * Para la siguiente, volver a llamar con `cursor: next_cursor` (null si no hay más);
+   * `count` solo viene con `include_count: true`.
    */
-  list: async (params?: { date?: string; meal_type?: string }): Promise<{
-    count: number;
+  list: async (params?: {
+    date?: string;
+    meal_type?: string;
+    cursor?: string;
+    page_size?: number;
+    include_count?: boolean;
+  }): Promise<{
     meals: Meal[];
+    next_cursor: string | null;
+    count?: number;
   }> => {
     const response = await apiClient.get('/meals/', { params });
     return response.data;
@@ -0,0 +1,96 @@
+/**
+ * Sync API - Sincronización incremental
+ * @module api/sync
+ */
+import apiClient from './client';
+
+export interface SyncChanges<T> {
+  changed: T[];
+  deleted: number[];
+}
+
+export interface SyncProfile {
+  id: number;
+  bio: string;
+  total_points: number;
+  level: number;
+  total_co2_saved: number;
+  streak_days: number;
+  last_activity_date: string | null;
+  daily_co2_goal: number;
+  notifications_enabled: boolean;
+  updated_at: string;
+}
+
+export interface SyncMeal {
+  id: number;
+  meal_type: string;
+  description: string;
+  ingredients: Record<string, number>;
+  total_co2: number;
+  meal_date: string;
+  is_vegetarian: boolean;
+  is_vegan: boolean;
+  created_at: string;
+  updated_at: string;
+}
+
+export interface SyncTransport {
+  id: number;
+  transport_type: string;
+  distance_km: number;
+  origin: string;
+  destination: string;
+  total_co2: number;
+  trip_date: string;
+  created_at: string;
+  updated_at: string;
+}
+
+export interface SyncAchievement {
+  id: number;
+  achievement_id: number;
+  progress: number;
+  is_unlocked: boolean;
+  unlocked_at: string | null;
+  updated_at: string;
+}
+
+export interface SyncFriendship {
+  id: number;
+  status: 'pending' | 'accepted' | 'rejected';
+  direction: 'sent' | 'received';
+  friend_id: number;
+  friend_username: string;
+  friend_first_name: string;
+  friend_last_name: string;
+  accepted_at: string | null;
+  created_at: string;
+  updated_at: string;
+}
+
+export interface SyncResponse {
+  cursor: string;
+  has_more: boolean;
+  full: boolean;
+  profile: SyncProfile | null;
+  meals: SyncChanges<SyncMeal>;
+  transports: SyncChanges<SyncTransport>;
+  achievements: SyncChanges<SyncAchievement>;
+  friendships: SyncChanges<SyncFriendship>;
+}
+
+export const syncAPI = {
+  /**
+   * Obtener cambios desde el cursor de la sincronización anterior.
+   * Si `has_more` es true, volver a llamar con el cursor recibido;
+   * si `full` es true, reemplazar los datos locales.
+   */
+  getChanges: async (since?: string): Promise<SyncResponse> => {
+    const params = since ? { since } : {};
+    const response = await apiClient.get('/sync/', { params });
+    return response.data;
+  },
+};
+
+export default syncAPI;
@@ -7,11 +7,20 @@ import type { Transport, CreateTransportData } from '../models';
 
 export const transportAPI = {
   /**
-   * Obtener lista de transportes del usuario
+   * Obtener una página de transportes del usuario.
+   * Para la siguiente, volver a llamar con `cursor: next_cursor` (null si no hay más);
+   * `count` solo viene con `include_count: true`.
    */
-  list: async (params?: { date?: string; transport_type?: string }): Promise<{
-    count: number;
+  list: async (params?: {
+    date?: string;
+    transport_type?: string;
+    cursor?: string;
+    page_size?: number;
+    include_count?: boolean;
+  }): Promise<{
     transports: Transport[];
+    next_cursor: string | null;
+    count?: number;
   }> => {
     const response = await apiClient.get('/transport/', { params });
     return response.data;